@@ -0,0 +1,120 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from app.algo.gazetteer import normalize_place
+from app.consts.countries import COUNTRY_SNAPSHOT_PATH, COUNTRY_SNAPSHOT_MAX_AGE_DAYS
+
+
+class CountryIndex:
+    _shared: Optional["CountryIndex"] = None
+    _shared_loaded = False
+
+    _stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    def __init__(
+        self,
+        countries: List[Dict],
+        fetched_at: Optional[datetime] = None,
+        complete: bool = True,
+        max_age_days: float = COUNTRY_SNAPSHOT_MAX_AGE_DAYS
+    ):
+        self.countries = countries
+        self.fetched_at = fetched_at
+        self.complete = complete
+        self.max_age_days = max_age_days
+        self._index: Dict[str, Dict] = {}
+        self._codes: Dict[str, Dict] = {}
+        # Official names win over alternate spellings shared by several countries
+        for country in countries:
+            for key in self._names(country, primary=True):
+                self._index.setdefault(key, country)
+        for country in countries:
+            for key in self._names(country, primary=False):
+                self._index.setdefault(key, country)
+            for code in (country.get("cca2"), country.get("cca3")):
+                if code:
+                    self._codes[code.lower()] = country
+
+    @staticmethod
+    def _names(country: Dict, primary: bool) -> Iterator[str]:
+        name = country.get("name", {})
+        if primary:
+            values = [name.get("common"), name.get("official")]
+        else:
+            values = [spelling for spelling in country.get("altSpellings", []) if spelling != country.get("cca2")]
+            for native in name.get("nativeName", {}).values():
+                values += [native.get("common"), native.get("official")]
+        for value in values:
+            key = normalize_place(value or "")
+            if key:
+                yield key
+
+    def lookup(self, name: str, include_codes: bool = False) -> Optional[Dict]:
+        # Two-letter codes are opt-in: as place names they collide with abbreviations like "LA"
+        key = normalize_place(name)
+        country = self._index.get(key)
+        if country is None and include_codes:
+            country = self._codes.get(key)
+        CountryIndex._stats["hits" if country is not None else "misses"] += 1
+        return country
+
+    def code(self, name: str) -> Optional[str]:
+        country = self.lookup(name, include_codes=True)
+        if country is None:
+            return None
+        return country.get("cca2", "").upper() or None
+
+    def age_days(self) -> Optional[float]:
+        if self.fetched_at is None:
+            return None
+        return (datetime.now(timezone.utc) - self.fetched_at).total_seconds() / 86400
+
+    def is_stale(self) -> bool:
+        age = self.age_days()
+        return age is None or age > self.max_age_days
+
+    @classmethod
+    def load(cls, path: Path) -> "CountryIndex":
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+        fetched_at = snapshot.get("fetched_at")
+        return cls(
+            snapshot["countries"],
+            fetched_at=datetime.fromisoformat(fetched_at) if fetched_at else None,
+            complete=snapshot.get("complete", True)
+        )
+
+    @classmethod
+    def shared(cls) -> Optional["CountryIndex"]:
+        if not cls._shared_loaded:
+            cls._shared_loaded = True
+            path = Path(COUNTRY_SNAPSHOT_PATH)
+            try:
+                cls._shared = cls.load(path)
+            except FileNotFoundError:
+                print(f"Country snapshot not found at '{path}', using the REST Countries API only")
+                return None
+            except Exception as e:
+                print(f"Error loading country snapshot from '{path}': {str(e)}")
+                return None
+
+            if cls._shared.is_stale():
+                age = "has never been refreshed" if cls._shared.fetched_at is None else f"is older than {cls._shared.max_age_days:g} days"
+                print(f"Country snapshot at '{path}' {age}, refresh it with: python -m app.scripts.refresh_countries")
+        return cls._shared
+
+    def stats(self) -> Dict:
+        stats = CountryIndex._stats
+        lookups = stats["hits"] + stats["misses"]
+        age = self.age_days()
+        return {
+            "countries": len(self.countries),
+            "keys": len(self._index) + len(self._codes),
+            "complete": self.complete,
+            "age_days": round(age, 1) if age is not None else None,
+            "stale": self.is_stale(),
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0
+        }
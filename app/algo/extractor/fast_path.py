@@ -0,0 +1,180 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.consts.places import (
+    COUNTRIES,
+    CITIES,
+    REGIONS,
+    FICTIONAL_PLACES,
+    AMBIGUOUS_PLACE_NAMES,
+    ORIGIN_MARKERS
+)
+
+FAST_PATH_STAGE = "fast_path"
+LLM_STAGE = "llm"
+
+MONTHS = {
+    "january": "january", "jan": "january", "february": "february", "feb": "february", "march": "march",
+    "mar": "march", "april": "april", "apr": "april", "may": "may", "june": "june", "jun": "june",
+    "july": "july", "jul": "july", "august": "august", "aug": "august", "september": "september",
+    "sep": "september", "sept": "september", "october": "october", "oct": "october", "november": "november",
+    "nov": "november", "december": "december", "dec": "december"
+}
+SEASONS = ["spring", "summer", "fall", "autumn", "winter"]
+
+
+@dataclass
+class FastPathResult:
+    resolved: bool
+    value: Optional[str] = None
+
+
+class CascadeStats:
+    _counts: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def record(cls, extractor: str, stage: str):
+        counts = cls._counts.setdefault(extractor, {FAST_PATH_STAGE: 0, LLM_STAGE: 0})
+        counts[stage] += 1
+
+    @classmethod
+    def stats(cls) -> Dict:
+        result = {}
+        for extractor, counts in cls._counts.items():
+            total = counts[FAST_PATH_STAGE] + counts[LLM_STAGE]
+            result[extractor] = {
+                **counts,
+                "fast_path_hit_rate": round(counts[FAST_PATH_STAGE] / total, 4) if total else 0.0
+            }
+        return result
+
+
+class FastLocationMatcher:
+    REAL = "real"
+    FICTIONAL = "fictional"
+
+    _TOKEN_PATTERN = re.compile(r"[^\W\d_]+(?:['\-][^\W\d_]+)*")
+
+    def __init__(self):
+        self.places: Dict[str, str] = {}
+        for name in COUNTRIES + CITIES + REGIONS:
+            self.places[name] = self.REAL
+        for name in FICTIONAL_PLACES:
+            self.places[name] = self.FICTIONAL
+        self.ambiguous = set(AMBIGUOUS_PLACE_NAMES)
+        self.max_words = max(len(name.split()) for name in self.places)
+        self._origin_pattern = re.compile(r"\b(?:" + "|".join(re.escape(marker) for marker in ORIGIN_MARKERS) + r")\s*$")
+
+    def match(self, message: str) -> FastPathResult:
+        matches = self._find_places(message)
+
+        # Only a single, unambiguous destination is resolved locally
+        if len(matches) != 1:
+            return FastPathResult(resolved=False)
+
+        name, kind = matches[0]
+        if kind == self.FICTIONAL:
+            return FastPathResult(resolved=True, value='fictional')
+        return FastPathResult(resolved=True, value=name)
+
+    def _find_places(self, message: str) -> List[Tuple[str, str]]:
+        tokens = [(m.group(0), m.start()) for m in self._TOKEN_PATTERN.finditer(message)]
+        lowered = [token.lower() for token, _ in tokens]
+        matches = []
+        seen = set()
+
+        i = 0
+        while i < len(tokens):
+            for size in range(min(self.max_words, len(tokens) - i), 0, -1):
+                name = " ".join(lowered[i:i + size])
+                kind = self.places.get(name)
+                if kind is None:
+                    continue
+
+                original, position = tokens[i]
+                if name in self.ambiguous and (i == 0 or not original[0].isupper()):
+                    break
+
+                if self._origin_pattern.search(message[:position].lower()):
+                    # "from Israel", "I live in London": origin, not destination
+                    return []
+
+                if name not in seen:
+                    seen.add(name)
+                    matches.append((name, kind))
+                i += size - 1
+                break
+            i += 1
+
+        return matches
+
+
+class FastDateParser:
+    _MONTH_NAMES = "|".join(sorted(MONTHS, key=len, reverse=True))
+    _SEASON_NAMES = "|".join(SEASONS)
+
+    _ISO_DATE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+    _MONTH_DAY = re.compile(rf"\b({_MONTH_NAMES})\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?\b(?!\s*(?:days?|nights?|weeks?|people|\$))", re.IGNORECASE)
+    _DAY_MONTH = re.compile(rf"\b(\d{{1,2}})(?:st|nd|rd|th)?\s+(?:of\s+)?({_MONTH_NAMES})\b", re.IGNORECASE)
+    _MONTH = re.compile(rf"\b((?:early|mid|late|end of|beginning of)\s+)?({_MONTH_NAMES})(?:\s+(\d{{4}}))?\b(?!\s+(?:i|we|you)\b)", re.IGNORECASE)
+    _SEASON = re.compile(rf"\b(next|this|coming|the|in|during)?\s*(early|late)?\s*({_SEASON_NAMES})\b", re.IGNORECASE)
+    _RELATIVE = re.compile(
+        r"\b(today|tonight|tomorrow|this weekend|next weekend|(?:next|this|coming) (?:week|month|year)"
+        r"|in (?:\d+|a|an|one|two|three|four|few) (?:days?|weeks?|months?))\b",
+        re.IGNORECASE
+    )
+
+    # Anything temporal at all; messages without it have no date to extract
+    _TEMPORAL_HINT = re.compile(
+        rf"\d|\b(?:{_MONTH_NAMES}|{_SEASON_NAMES}|today|tonight|tomorrow|yesterday|week|weekend|month|year|day|days"
+        r"|night|nights|holiday|holidays|christmas|easter|new year|thanksgiving|hanukkah|ramadan|monday|tuesday"
+        r"|wednesday|thursday|friday|saturday|sunday|next|soon|later|upcoming|season|date|dates|when)\b",
+        re.IGNORECASE
+    )
+
+    def match(self, message: str) -> FastPathResult:
+        if not self._TEMPORAL_HINT.search(message):
+            return FastPathResult(resolved=True, value=None)
+
+        candidates = self._find_dates(message)
+        if len(candidates) != 1:
+            return FastPathResult(resolved=False)
+
+        return FastPathResult(resolved=True, value=candidates[0])
+
+    def _find_dates(self, message: str) -> List[str]:
+        candidates = []
+        consumed: List[Tuple[int, int]] = []
+
+        def add(value: str, span: Tuple[int, int]):
+            if any(start < span[1] and span[0] < end for start, end in consumed):
+                return
+            consumed.append(span)
+            if value not in candidates:
+                candidates.append(value)
+
+        for match in self._ISO_DATE.finditer(message):
+            add(match.group(1), match.span())
+        for match in self._MONTH_DAY.finditer(message):
+            add(f"{MONTHS[match.group(1).lower()]} {int(match.group(2))}", match.span())
+        for match in self._DAY_MONTH.finditer(message):
+            add(f"{MONTHS[match.group(2).lower()]} {int(match.group(1))}", match.span())
+        for match in self._MONTH.finditer(message):
+            month = match.group(2)
+            if month.lower() == "may" and (match.start(2) == 0 or not month[0].isupper()):
+                continue
+            qualifier = (match.group(1) or "").lower()
+            year = f" {match.group(3)}" if match.group(3) else ""
+            add(f"{qualifier}{MONTHS[month.lower()]}{year}", match.span())
+        for match in self._SEASON.finditer(message):
+            season = match.group(3).lower()
+            if season == "fall" and not (match.group(1) or match.group(2)):
+                # "fall" without a temporal lead-in is more likely the verb
+                return []
+            qualifier = f"{match.group(2).lower()} " if match.group(2) else ""
+            add(f"{qualifier}{season}", match.span(3))
+        for match in self._RELATIVE.finditer(message):
+            add(match.group(1).lower(), match.span())
+
+        return candidates
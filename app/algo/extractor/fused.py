@@ -0,0 +1,64 @@
+import json
+import re
+from typing import Optional
+
+from app.modules.clients.ollama import OllamaClient
+from app.prompts.builder.prompts import render_template
+from app.consts.roles import MessageRole
+from app.algo.extractor.date import DateExtractor
+from app.algo.extractor.intent import IntentExtractor
+from app.algo.extractor.location import LocationExtractor
+from app.models.extraction_result import ExtractionResult
+
+
+class FusedExtractor:
+    def __init__(self, llm_client: OllamaClient):
+        self.llm = llm_client
+        self.intent_extractor = IntentExtractor(llm_client)
+        self.location_extractor = LocationExtractor(llm_client)
+        self.date_extractor = DateExtractor(llm_client)
+    
+    def _parse_response(self, response: str) -> Optional[ExtractionResult]:
+        response = response.strip()
+        
+        json_match = re.search(r'\{[^{}]*"intent"[^{}]*\}', response, re.DOTALL)
+        if json_match:
+            response = json_match.group(0)
+        
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError:
+            return None
+        
+        if not isinstance(data, dict):
+            return None
+        
+        # Normalize each field exactly like the dedicated extractors do; "false" as a string is not fictional
+        is_fictional = data.get("is_fictional", False)
+        intent = self.intent_extractor._parse_response(json.dumps({"intent": str(data.get("intent", ""))}))
+        location = self.location_extractor._parse_response(json.dumps({
+            "location": str(data.get("location", "")),
+            "is_fictional": is_fictional is True or str(is_fictional).strip().lower() == "true"
+        }))
+        date = self.date_extractor._parse_response(json.dumps({"date": str(data.get("date", ""))}))
+        
+        return ExtractionResult(intent=intent, location=location, date=date)
+    
+    async def extract(self, message: str) -> Optional[ExtractionResult]:
+        prompt = render_template("fused_extraction.j2", message=message)
+        
+        messages = [
+            {
+                "role": MessageRole.USER.value,
+                "content": prompt
+            }
+        ]
+        
+        try:
+            response = await self.llm.chat(messages, temperature=0.0, num_predict=80, format="json")
+            content = response.get("content", "") if isinstance(response, dict) else response
+            return self._parse_response(content)
+            
+        except Exception as e:
+            print(f"Fused extraction error: {str(e)}")
+            return None
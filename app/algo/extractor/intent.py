@@ -5,11 +5,15 @@ from app.modules.clients.ollama import OllamaClient
 from app.prompts.builder.prompts import render_template
 from app.consts.roles import MessageRole
 from app.consts.intents import LEGITIMATE_INTENT, VALID_INTENTS, NON_VALID_INTENT
+from app.consts.extraction import INTENT_CLASSIFIER_ENABLED, INTENT_CLASSIFIER_THRESHOLD
+from app.algo.extractor.intent_classifier import IntentClassifier
+from app.algo.extractor.fast_path import CascadeStats, FAST_PATH_STAGE, LLM_STAGE
 
 
 class IntentExtractor:
-    def __init__(self, llm_client: OllamaClient):
+    def __init__(self, llm_client: OllamaClient, use_classifier: bool = INTENT_CLASSIFIER_ENABLED):
         self.llm = llm_client
+        self.classifier = IntentClassifier.shared() if use_classifier else None
     
     def _parse_response(self, response: str) -> str:
         response = response.strip()
@@ -31,6 +35,13 @@ class IntentExtractor:
             return LEGITIMATE_INTENT
     
     async def extract(self, message: str) -> str:
+        if self.classifier:
+            intent, confidence = self.classifier.predict(message)
+            if confidence >= INTENT_CLASSIFIER_THRESHOLD:
+                CascadeStats.record("intent", FAST_PATH_STAGE)
+                return intent
+            CascadeStats.record("intent", LLM_STAGE)
+        
         prompt = render_template("intent_extraction.j2", message=message)
 
         messages = [
@@ -0,0 +1,107 @@
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.consts.extraction import INTENT_CLASSIFIER_MODEL_PATH
+
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+def extract_features(text: str) -> List[str]:
+    words = _WORD_PATTERN.findall(text.lower())
+    features = [f"w:{word}" for word in words]
+    features += [f"b:{first} {second}" for first, second in zip(words, words[1:])]
+    for word in words:
+        padded = f"<{word}>"
+        features += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+    return features
+
+
+class IntentClassifier:
+    # Scales cosine similarities before the softmax so confidences are well spread
+    SOFTMAX_SCALE = 10.0
+
+    _shared: Optional["IntentClassifier"] = None
+    _shared_loaded = False
+
+    def __init__(self, vocabulary: Dict[str, int], idf: np.ndarray, centroids: np.ndarray, labels: List[str]):
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.centroids = centroids
+        self.labels = labels
+
+    @classmethod
+    def train(cls, texts: List[str], labels: List[str]) -> "IntentClassifier":
+        documents = [extract_features(text) for text in texts]
+
+        vocabulary: Dict[str, int] = {}
+        for features in documents:
+            for feature in features:
+                vocabulary.setdefault(feature, len(vocabulary))
+
+        document_frequency = np.zeros(len(vocabulary), dtype=np.float32)
+        for features in documents:
+            document_frequency[[vocabulary[feature] for feature in set(features)]] += 1
+        idf = (np.log((1 + len(documents)) / (1 + document_frequency)) + 1).astype(np.float32)
+
+        classifier = cls(vocabulary, idf, np.empty(0, dtype=np.float32), sorted(set(labels)))
+        matrix = np.vstack([classifier._vectorize(features) for features in documents])
+
+        label_index = np.array([classifier.labels.index(label) for label in labels])
+        centroids = np.vstack([matrix[label_index == i].mean(axis=0) for i in range(len(classifier.labels))])
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        classifier.centroids = (centroids / np.maximum(norms, 1e-12)).astype(np.float32)
+        return classifier
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        vector = self._vectorize(extract_features(text))
+        if not vector.any():
+            return self.labels[0], 0.0
+
+        scores = self.centroids @ vector * self.SOFTMAX_SCALE
+        probabilities = np.exp(scores - scores.max())
+        probabilities /= probabilities.sum()
+
+        best = int(probabilities.argmax())
+        return self.labels[best], float(probabilities[best])
+
+    def _vectorize(self, features: List[str]) -> np.ndarray:
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        indices = [self.vocabulary[feature] for feature in features if feature in self.vocabulary]
+        if not indices:
+            return vector
+
+        np.add.at(vector, indices, 1.0)
+        vector *= self.idf
+        return vector / np.linalg.norm(vector)
+
+    def save(self, path: Path):
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        np.savez_compressed(
+            path,
+            terms=np.array(terms),
+            idf=self.idf,
+            centroids=self.centroids,
+            labels=np.array(self.labels)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "IntentClassifier":
+        with np.load(path) as data:
+            vocabulary = {str(term): index for index, term in enumerate(data["terms"])}
+            return cls(vocabulary, data["idf"], data["centroids"], [str(label) for label in data["labels"]])
+
+    @classmethod
+    def shared(cls) -> Optional["IntentClassifier"]:
+        if not cls._shared_loaded:
+            cls._shared_loaded = True
+            path = Path(INTENT_CLASSIFIER_MODEL_PATH)
+            try:
+                cls._shared = cls.load(path)
+            except FileNotFoundError:
+                print(f"Intent classifier model not found at '{path}', using the LLM only")
+            except Exception as e:
+                print(f"Error loading intent classifier from '{path}': {str(e)}")
+        return cls._shared
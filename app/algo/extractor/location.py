@@ -4,11 +4,16 @@ from typing import Optional
 
 from app.modules.clients.ollama import OllamaClient
 from app.prompts.builder.prompts import render_template
+from app.algo.extractor.fast_path import FastLocationMatcher, CascadeStats, FAST_PATH_STAGE, LLM_STAGE
+from app.consts.extraction import FAST_PATH_ENABLED
 
 
 class LocationExtractor:    
-    def __init__(self, llm_client: OllamaClient):
+    fast_path = FastLocationMatcher()
+    
+    def __init__(self, llm_client: OllamaClient, use_fast_path: bool = FAST_PATH_ENABLED):
         self.llm = llm_client
+        self.use_fast_path = use_fast_path
     
     def _parse_response(self, response: str) -> Optional[str]:
         response = response.strip()
@@ -49,6 +54,13 @@ class LocationExtractor:
             return response.lower()
     
     async def extract(self, message: str) -> Optional[str]:
+        if self.use_fast_path:
+            fast_result = self.fast_path.match(message)
+            if fast_result.resolved:
+                CascadeStats.record("location", FAST_PATH_STAGE)
+                return fast_result.value
+            CascadeStats.record("location", LLM_STAGE)
+        
         prompt = render_template("location_extraction.j2", message=message)
 
         messages = [
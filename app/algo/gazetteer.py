@@ -0,0 +1,252 @@
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.consts.gazetteer import GAZETTEER_PATH, GAZETTEER_MAX_EDIT_DISTANCE
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+class Place(NamedTuple):
+    name: str
+    latitude: float
+    longitude: float
+    country_code: str
+    country: str
+    population: int = 0
+    distance: int = 0
+
+
+def normalize_place(text: str) -> str:
+    ascii_text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM.sub(" ", ascii_text.lower()).strip()
+
+
+def trigrams(key: str) -> List[str]:
+    padded = f"  {key} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def edit_distance(first: str, second: str, limit: int) -> int:
+    # Optimal string alignment: an adjacent transposition ("lodnon") counts as one edit
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+
+    before: List[int] = []
+    previous = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        current = [i]
+        for j in range(1, len(second) + 1):
+            cost = first[i - 1] != second[j - 1]
+            distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                distance = min(distance, before[j - 2] + 1)
+            current.append(distance)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class Gazetteer:
+    # Arrays saved as separate .npy files so they can be memory-mapped instead of read at startup
+    ARRAYS = [
+        "names", "latitudes", "longitudes", "populations", "place_countries",
+        "country_codes", "country_names", "keys", "key_places", "grams", "gram_offsets", "gram_postings"
+    ]
+    FUZZY_CANDIDATES = 64
+    # Shorter names are only matched exactly; one edit already turns real places into seed cities ("napa" -> "nara")
+    LONG_NAME_LENGTH = 8
+
+    _shared: Optional["Gazetteer"] = None
+    _shared_loaded = False
+
+    _stats: Dict[str, float] = {"exact_hits": 0, "fuzzy_hits": 0, "misses": 0, "total_ms": 0.0}
+
+    def __init__(self, arrays: Dict[str, np.ndarray], max_edit_distance: int = GAZETTEER_MAX_EDIT_DISTANCE):
+        self.arrays = arrays
+        self.max_edit_distance = max_edit_distance
+        self.keys = arrays["keys"]
+        self.key_places = arrays["key_places"]
+        self.grams = arrays["grams"]
+        self.gram_offsets = arrays["gram_offsets"]
+        self.gram_postings = arrays["gram_postings"]
+        self.country_lookup = {
+            normalize_place(value.decode("utf-8")): index
+            for column in ("country_codes", "country_names")
+            for index, value in enumerate(arrays[column])
+        }
+
+    @classmethod
+    def build(cls, places: List[Dict], countries: Dict[str, str]) -> "Gazetteer":
+        codes = sorted({place["country_code"] for place in places})
+        country_index = {code: index for index, code in enumerate(codes)}
+
+        entries: List[Tuple[str, int, int]] = []
+        for index, place in enumerate(places):
+            for alias in {normalize_place(name) for name in [place["name"]] + place.get("aliases", [])}:
+                if alias:
+                    entries.append((alias, -int(place["population"]), index))
+        # Same key: the most populous place first, so exact lookups prefer it
+        entries.sort()
+
+        keys = [key for key, _, _ in entries]
+        postings: Dict[str, List[int]] = {}
+        for position, key in enumerate(keys):
+            if position > 0 and keys[position - 1] == key:
+                continue
+            for gram in set(trigrams(key)):
+                postings.setdefault(gram, []).append(position)
+
+        grams = sorted(postings)
+        offsets = np.zeros(len(grams) + 1, dtype=np.int32)
+        offsets[1:] = np.cumsum([len(postings[gram]) for gram in grams])
+
+        arrays = {
+            "names": cls._bytes_array([place["name"] for place in places]),
+            "latitudes": np.array([place["latitude"] for place in places], dtype=np.float32),
+            "longitudes": np.array([place["longitude"] for place in places], dtype=np.float32),
+            "populations": np.array([place["population"] for place in places], dtype=np.uint32),
+            "place_countries": np.array([country_index[place["country_code"]] for place in places], dtype=np.uint16),
+            "country_codes": cls._bytes_array(codes),
+            "country_names": cls._bytes_array([countries.get(code, code) for code in codes]),
+            "keys": cls._bytes_array(keys),
+            "key_places": np.array([index for _, _, index in entries], dtype=np.int32),
+            "grams": cls._bytes_array(grams),
+            "gram_offsets": offsets,
+            "gram_postings": np.array([position for gram in grams for position in postings[gram]], dtype=np.int32)
+        }
+        return cls(arrays)
+
+    @staticmethod
+    def _bytes_array(values: List[str]) -> np.ndarray:
+        encoded = [value.encode("utf-8") for value in values]
+        return np.array(encoded, dtype=f"S{max([len(value) for value in encoded] + [1])}")
+
+    def lookup(self, query: str) -> Optional[Place]:
+        started = time.perf_counter()
+        place = self._lookup(query)
+
+        stats = Gazetteer._stats
+        stats["total_ms"] += (time.perf_counter() - started) * 1000
+        if place is None:
+            stats["misses"] += 1
+        elif place.distance:
+            stats["fuzzy_hits"] += 1
+        else:
+            stats["exact_hits"] += 1
+        return place
+
+    def _lookup(self, query: str) -> Optional[Place]:
+        # "Paris, France" / "Paris, TX": the part after the comma narrows the country when it names one
+        name, _, qualifier = (query or "").partition(",")
+        country = self.country_lookup.get(normalize_place(qualifier)) if qualifier else None
+
+        key = normalize_place(name if country is not None or not qualifier else query)
+        if not key:
+            return None
+
+        places = self._exact(key, country)
+        if places:
+            return self._place(places[0], 0)
+
+        match = self._fuzzy(key, country)
+        if match is None:
+            return None
+        return self._place(*match)
+
+    def _exact(self, key: str, country: Optional[int]) -> List[int]:
+        encoded = key.encode("utf-8")
+        start = int(np.searchsorted(self.keys, encoded, side="left"))
+        end = int(np.searchsorted(self.keys, encoded, side="right"))
+        places = [int(index) for index in self.key_places[start:end]]
+        if country is not None:
+            places = [index for index in places if int(self.arrays["place_countries"][index]) == country]
+        return places
+
+    def _fuzzy(self, key: str, country: Optional[int]) -> Optional[Tuple[int, int]]:
+        if len(key) < self.LONG_NAME_LENGTH or self.max_edit_distance <= 0:
+            return None
+        limit = self.max_edit_distance
+
+        query_grams = set(trigrams(key))
+        hits = []
+        for gram in query_grams:
+            encoded = gram.encode("utf-8")
+            position = int(np.searchsorted(self.grams, encoded))
+            if position < len(self.grams) and self.grams[position] == encoded:
+                hits.append(self.gram_postings[self.gram_offsets[position]:self.gram_offsets[position + 1]])
+        if not hits:
+            return None
+
+        # An edit changes at most four trigrams (a transposition), so a match shares at least this many
+        candidates, counts = np.unique(np.concatenate(hits), return_counts=True)
+        required = max(1, len(query_grams) - 4 * limit)
+        keep = counts >= required
+        candidates, counts = candidates[keep], counts[keep]
+        candidates = candidates[np.argsort(-counts, kind="stable")[:self.FUZZY_CANDIDATES]]
+
+        best: Optional[Tuple[int, int, int]] = None
+        for position in candidates:
+            candidate = self.keys[position].decode("utf-8")
+            distance = edit_distance(key, candidate, limit)
+            if distance > limit:
+                continue
+            for place in self._exact(candidate, country):
+                rank = (distance, -int(self.arrays["populations"][place]), place)
+                if best is None or rank < best:
+                    best = rank
+        return (best[2], best[0]) if best is not None else None
+
+    def _place(self, index: int, distance: int) -> Place:
+        arrays = self.arrays
+        country = int(arrays["place_countries"][index])
+        return Place(
+            name=arrays["names"][index].decode("utf-8"),
+            latitude=round(float(arrays["latitudes"][index]), 5),
+            longitude=round(float(arrays["longitudes"][index]), 5),
+            country_code=arrays["country_codes"][country].decode("utf-8"),
+            country=arrays["country_names"][country].decode("utf-8"),
+            population=int(arrays["populations"][index]),
+            distance=distance
+        )
+
+    def save(self, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(directory / f"{name}.npy", self.arrays[name])
+
+    @classmethod
+    def load(cls, directory: Path) -> "Gazetteer":
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in cls.ARRAYS}
+        return cls(arrays)
+
+    @classmethod
+    def shared(cls) -> Optional["Gazetteer"]:
+        if not cls._shared_loaded:
+            cls._shared_loaded = True
+            path = Path(GAZETTEER_PATH)
+            try:
+                cls._shared = cls.load(path)
+            except FileNotFoundError:
+                print(f"Gazetteer not found at '{path}', geocoding with the remote API only")
+            except Exception as e:
+                print(f"Error loading gazetteer from '{path}': {str(e)}")
+        return cls._shared
+
+    def stats(self) -> Dict:
+        stats = Gazetteer._stats
+        lookups = int(stats["exact_hits"] + stats["fuzzy_hits"] + stats["misses"])
+        return {
+            "places": len(self.arrays["names"]),
+            "keys": len(self.keys),
+            "exact_hits": int(stats["exact_hits"]),
+            "fuzzy_hits": int(stats["fuzzy_hits"]),
+            "misses": int(stats["misses"]),
+            "hit_rate": round((lookups - stats["misses"]) / lookups, 4) if lookups else 0.0,
+            "avg_lookup_ms": round(stats["total_ms"] / lookups, 3) if lookups else 0.0
+        }
@@ -1,9 +1,13 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, AsyncIterator
 
+from app.consts.priority import RequestPriority
 from app.modules.clients.ollama import OllamaClient
+from app.modules.deadline import Deadline
 
 
 class LLMResponseGenerator:
+    NUM_PREDICT = 500
+    
     def __init__(self, llm_client: OllamaClient):
         self.llm = llm_client
     
@@ -13,9 +17,34 @@ class LLMResponseGenerator:
         temperature: Optional[float] = 0.3
     ) -> str:
         try:
-            response = await self.llm.chat(messages, temperature=temperature, num_predict=500)
+            response = await self.llm.chat(
+                messages,
+                temperature=temperature,
+                num_predict=Deadline.num_predict(self.NUM_PREDICT),
+                priority=RequestPriority.GENERATION
+            )
             content = response.get("content", "") if isinstance(response, dict) else response
             return content
         except Exception as e:
             print(f"Response generation error: {str(e)}")
             return f"I encountered an error while processing your request. Please try again. (Error: {str(e)})"
+
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = 0.3
+    ) -> AsyncIterator[str]:
+        streamed_any = False
+        try:
+            async for token in self.llm.chat_stream(
+                messages,
+                temperature=temperature,
+                num_predict=Deadline.num_predict(self.NUM_PREDICT),
+                priority=RequestPriority.GENERATION
+            ):
+                streamed_any = True
+                yield token
+        except Exception as e:
+            print(f"Response streaming error: {str(e)}")
+            if not streamed_any:
+                yield f"I encountered an error while processing your request. Please try again. (Error: {str(e)})"
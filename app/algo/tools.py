@@ -1,17 +1,23 @@
-from typing import Optional, Dict
+import asyncio
+from typing import Optional, Dict, List
 
 from app.modules.clients.weather import WeatherAPI
 from app.modules.clients.country import CountryAPI
 from app.modules.clients.visa import VisaAPI
 from app.modules.clients.geocoding import GeocodingClient
+from app.modules.tools.speculation import SpeculativePrefetch
 
 
 async def fetch_weather_for_location(
     location: str,
     start_date: str,
-    end_date: str
+    end_date: str,
+    prefetch: Optional[SpeculativePrefetch] = None
 ) -> Optional[Dict]:
-    coords = await GeocodingClient.get_coordinates(location)
+    if prefetch:
+        coords = await prefetch.get_coordinates(location)
+    else:
+        coords = await GeocodingClient.get_coordinates(location)
     if not coords:
         return None
     
@@ -24,8 +30,41 @@ async def fetch_weather_for_location(
     return weather_data
 
 
-async def fetch_country_info(country_name: str) -> Optional[Dict]:
+async def fetch_weather_for_locations(
+    locations: List[str],
+    start_date: str,
+    end_date: str,
+    prefetch: Optional[SpeculativePrefetch] = None
+) -> List[Dict]:
+    get_coordinates = prefetch.get_coordinates if prefetch else GeocodingClient.get_coordinates
+    coordinates = await asyncio.gather(*[get_coordinates(location) for location in locations])
+    resolved = [(location, coords) for location, coords in zip(locations, coordinates) if coords]
+    if not resolved:
+        return []
+    
+    # All locations share one upstream request; summaries are computed together on the batch
+    batch = await WeatherAPI.get_forecasts(
+        [(coords.latitude, coords.longitude) for _, coords in resolved],
+        start_date,
+        end_date
+    )
+    if not batch:
+        return []
     
+    forecasts = []
+    for (location, _), weather_data in zip(resolved, batch.views()):
+        if weather_data:
+            weather_data["location"] = location
+            forecasts.append(weather_data)
+    return forecasts
+
+
+async def fetch_country_info(
+    country_name: str,
+    prefetch: Optional[SpeculativePrefetch] = None
+) -> Optional[Dict]:
+    if prefetch:
+        return await prefetch.get_country_info(country_name)
     return await CountryAPI.get_country_info(country_name)
 
 
@@ -0,0 +1,135 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.consts.visa import VISA_CATEGORY_NAMES, VISA_MATRIX_PATH
+
+
+class VisaMatrix:
+    # Cell value 0 means the pair is unknown; category codes are stored as their index + 1
+    CATEGORIES = list(VISA_CATEGORY_NAMES)
+    NO_DURATION = 0
+
+    _shared: Optional["VisaMatrix"] = None
+    _shared_loaded = False
+
+    _stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    def __init__(
+        self,
+        codes: np.ndarray,
+        categories: np.ndarray,
+        durations: np.ndarray,
+        metadata: Optional[Dict] = None
+    ):
+        self.codes = codes
+        self.categories = categories
+        self.durations = durations
+        self.metadata = metadata or {}
+        self._positions = {code.decode("ascii"): index for index, code in enumerate(codes)}
+
+    @classmethod
+    def empty(cls, codes: List[str]) -> "VisaMatrix":
+        ordered = sorted({code.upper() for code in codes})
+        size = len(ordered)
+        return cls(
+            np.array([code.encode("ascii") for code in ordered], dtype="S3"),
+            np.zeros((size, size), dtype=np.uint8),
+            np.zeros((size, size), dtype=np.uint16)
+        )
+
+    def resized(self, codes: List[str]) -> "VisaMatrix":
+        # A matrix over the union of both code sets, keeping every pair already known
+        matrix = VisaMatrix.empty([code.decode("ascii") for code in self.codes] + list(codes))
+        positions = [matrix._positions[code.decode("ascii")] for code in self.codes]
+        matrix.categories[np.ix_(positions, positions)] = self.categories
+        matrix.durations[np.ix_(positions, positions)] = self.durations
+        matrix.metadata = dict(self.metadata)
+        return matrix
+
+    def set(self, origin_code: str, destination_code: str, category: str, duration: Optional[int] = None):
+        origin = self._positions.get(origin_code.upper())
+        destination = self._positions.get(destination_code.upper())
+        if origin is None or destination is None or category not in self.CATEGORIES:
+            return
+        self.categories[origin, destination] = self.CATEGORIES.index(category) + 1
+        self.durations[origin, destination] = min(int(duration or self.NO_DURATION), np.iinfo(np.uint16).max)
+
+    def lookup(self, origin_code: str, destination_code: str) -> Optional[Dict]:
+        # Answers in the visa API's response shape, so callers parse both the same way
+        origin = self._positions.get((origin_code or "").upper())
+        destination = self._positions.get((destination_code or "").upper())
+        value = 0
+        if origin is not None and destination is not None:
+            value = int(self.categories[origin, destination])
+
+        if value == 0:
+            VisaMatrix._stats["misses"] += 1
+            return None
+
+        VisaMatrix._stats["hits"] += 1
+        category = self.CATEGORIES[value - 1]
+        duration = int(self.durations[origin, destination])
+        return {
+            "category": {"code": category, "name": VISA_CATEGORY_NAMES[category]},
+            "dur": duration or None,
+            "source": "visa_matrix"
+        }
+
+    def coverage(self) -> float:
+        size = len(self.codes)
+        cells = size * size - size
+        return round(int(np.count_nonzero(self.categories)) / cells, 4) if cells > 0 else 0.0
+
+    def save(self, directory: Path, metadata: Optional[Dict] = None):
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "codes.npy", self.codes)
+        np.save(directory / "categories.npy", self.categories)
+        np.save(directory / "durations.npy", self.durations)
+        self.metadata = {
+            **(metadata or {}),
+            "updated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "countries": len(self.codes),
+            "coverage": self.coverage()
+        }
+        (directory / "metadata.json").write_text(json.dumps(self.metadata, indent=2))
+
+    @classmethod
+    def load(cls, directory: Path, writable: bool = False) -> "VisaMatrix":
+        mode = None if writable else "r"
+        metadata_path = directory / "metadata.json"
+        return cls(
+            np.load(directory / "codes.npy"),
+            np.load(directory / "categories.npy", mmap_mode=mode),
+            np.load(directory / "durations.npy", mmap_mode=mode),
+            json.loads(metadata_path.read_text()) if metadata_path.exists() else None
+        )
+
+    @classmethod
+    def shared(cls) -> Optional["VisaMatrix"]:
+        if not cls._shared_loaded:
+            cls._shared_loaded = True
+            path = Path(VISA_MATRIX_PATH)
+            try:
+                cls._shared = cls.load(path)
+            except FileNotFoundError:
+                print(f"Visa matrix not found at '{path}', using the visa API only")
+            except Exception as e:
+                print(f"Error loading visa matrix from '{path}': {str(e)}")
+        return cls._shared
+
+    def stats(self) -> Dict:
+        stats = VisaMatrix._stats
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            "countries": len(self.codes),
+            "coverage": self.coverage(),
+            "updated_at": self.metadata.get("updated_at"),
+            "source": self.metadata.get("source"),
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0
+        }
@@ -1,17 +1,49 @@
-from fastapi import HTTPException
+import json
+import re
+import uuid
+from typing import AsyncIterator, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import StreamingResponse, JSONResponse
 
 from app.models.message import ChatMessage
 from app.models.response import ChatResponse
 from app.services.conversation_handler import ConversationHandler
+from app.modules.clients.ollama_warmup import ModelWarmup
+from app.modules.extractor.manager import ExtractorManager
+from app.algo.extractor.fast_path import CascadeStats
+from app.algo.gazetteer import Gazetteer
+from app.modules.clients.single_flight import SingleFlight
+from app.modules.clients.http_pool import HttpClientPool
+from app.modules.clients.country import CountryAPI
+from app.modules.clients.visa import VisaAPI
+from app.modules.clients.weather_cache import ForecastCache
+from app.modules.tools.speculation import SpeculativePrefetch
+from app.modules.tools.cache import ToolResultCache
+from app.modules.deadline import Deadline
+from app.modules.context_window import ContextWindowManager
+from app.prompts.builder.registry import TemplateRegistry
+from app.consts.gazetteer import GAZETTEER_ENABLED
+from app.consts.weather import WEATHER_CACHE_ENABLED
+from app.consts.research import TOOL_CACHE_ENABLED
+from app.consts.deadline import TURN_DEADLINE_HEADER
+from app.consts.session import SESSION_HEADER_NAME, SESSION_COOKIE_NAME, SESSION_COOKIE_MAX_AGE
 
 
 class ConversationController:
-    def __init__(self, conversation_service: ConversationHandler):
+    SESSION_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{8,128}")
+    
+    def __init__(self, conversation_service: ConversationHandler, model_warmup: ModelWarmup):
         self.service = conversation_service
+        self.model_warmup = model_warmup
     
-    async def chat(self, message: ChatMessage) -> ChatResponse:
+    async def chat(self, message: ChatMessage, request: Request, http_response: Response) -> ChatResponse:
+        session_id, is_new = self.resolve_session(request)
+        self._attach_session(http_response, session_id, is_new)
+        deadline = Deadline.for_request(request.headers.get(TURN_DEADLINE_HEADER))
         try:
-            response = await self.service.handle(message.message)
+            with Deadline.activate(deadline):
+                response = await self.service.handle(session_id, message.message)
             
             return ChatResponse(
                 response=response,
@@ -23,9 +55,73 @@ class ConversationController:
                 response="I encountered an error while processing your request. Please try again."
             )
     
-    async def reset_conversation(self) -> str:
+    def chat_stream(self, message: ChatMessage, request: Request) -> StreamingResponse:
+        session_id, is_new = self.resolve_session(request)
+        response = StreamingResponse(
+            self._stream_events(session_id, message, Deadline.for_request(request.headers.get(TURN_DEADLINE_HEADER))),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no"
+            }
+        )
+        self._attach_session(response, session_id, is_new)
+        return response
+    
+    async def _stream_events(self, session_id: str, message: ChatMessage, deadline: Optional[Deadline]) -> AsyncIterator[str]:
         try:
-            self.service.start_conversation()
+            with Deadline.activate(deadline):
+                async for token in self.service.handle_stream(session_id, message.message):
+                    yield self._format_event("token", {"token": token})
+            yield self._format_event("done", {})
+        
+        except Exception as e:
+            print(f"Error in chat stream endpoint: {str(e)}")
+            yield self._format_event("error", {
+                "error": "I encountered an error while processing your request. Please try again."
+            })
+    
+    @staticmethod
+    def _format_event(event: str, data: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    
+    async def get_readiness(self) -> JSONResponse:
+        readiness = self.model_warmup.readiness()
+        return JSONResponse(
+            content=readiness,
+            status_code=200 if readiness["ready"] else 503
+        )
+    
+    async def get_stats(self) -> dict:
+        llm_cache = self.service.llm.cache
+        gazetteer = Gazetteer.shared() if GAZETTEER_ENABLED else None
+        country_snapshot = CountryAPI.snapshot()
+        visa_matrix = VisaAPI.matrix()
+        return {
+            "ollama": self.service.llm.pool.stats(),
+            "llm_cache": llm_cache.stats() if llm_cache else {"enabled": False},
+            "http": HttpClientPool.shared().stats(),
+            "gazetteer": gazetteer.stats() if gazetteer else {"enabled": False},
+            "country_snapshot": country_snapshot.stats() if country_snapshot else {"enabled": False},
+            "visa_matrix": visa_matrix.stats() if visa_matrix else {"enabled": False},
+            "weather_cache": ForecastCache.shared().stats() if WEATHER_CACHE_ENABLED else {"enabled": False},
+            "extraction": ExtractorManager.stats(),
+            "extraction_fast_path": CascadeStats.stats(),
+            "single_flight": SingleFlight.all_stats(),
+            "speculation": SpeculativePrefetch.stats(),
+            "deadline": Deadline.stats(),
+            "tool_cache": ToolResultCache.shared().stats() if TOOL_CACHE_ENABLED else {"enabled": False},
+            "context_window": ContextWindowManager.stats(),
+            "prompts": TemplateRegistry.shared().stats(),
+            "summarizer": self.service.summarizer.stats(),
+            "sessions": self.service.sessions.stats()
+        }
+    
+    async def reset_conversation(self, request: Request) -> str:
+        session_id, is_new = self.resolve_session(request)
+        try:
+            if not is_new:
+                await self.service.reset_conversation(session_id)
             return "Conversation successfully reset"
         except Exception as e:
             print(f"Error resetting conversation: {str(e)}")
@@ -33,3 +129,21 @@ class ConversationController:
                 status_code=500,
                 detail=f"Error resetting conversation: {str(e)}"
             )
+    
+    def resolve_session(self, request: Request) -> Tuple[str, bool]:
+        session_id = request.headers.get(SESSION_HEADER_NAME) or request.cookies.get(SESSION_COOKIE_NAME)
+        if session_id and self.SESSION_ID_PATTERN.fullmatch(session_id):
+            return session_id, False
+        return uuid.uuid4().hex, True
+    
+    @staticmethod
+    def _attach_session(response: Response, session_id: str, is_new: bool):
+        response.headers[SESSION_HEADER_NAME] = session_id
+        if is_new:
+            response.set_cookie(
+                SESSION_COOKIE_NAME,
+                session_id,
+                max_age=SESSION_COOKIE_MAX_AGE,
+                httponly=True,
+                samesite="lax"
+            )
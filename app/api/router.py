@@ -1,7 +1,7 @@
 """API router configuration."""
 
 from pathlib import Path
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse, FileResponse
 
 from app.models.message import ChatMessage
@@ -15,12 +15,24 @@ def create_travel_assistant_router(controller: ConversationController):
     travel_assistant_router = APIRouter(tags=["travel-assistant"], prefix="/travel-assistant")
 
     @travel_assistant_router.post("/chat", response_model=ChatResponse)
-    async def chat(message: ChatMessage) -> ChatResponse:
-        return await controller.chat(message)
+    async def chat(message: ChatMessage, request: Request, response: Response) -> ChatResponse:
+        return await controller.chat(message, request, response)
+
+    @travel_assistant_router.post("/chat/stream")
+    async def chat_stream(message: ChatMessage, request: Request):
+        return controller.chat_stream(message, request)
 
     @travel_assistant_router.post("/reset")
-    async def reset_conversation():
-        return await controller.reset_conversation()
+    async def reset_conversation(request: Request):
+        return await controller.reset_conversation(request)
+
+    @travel_assistant_router.get("/ready")
+    async def get_readiness():
+        return await controller.get_readiness()
+
+    @travel_assistant_router.get("/stats")
+    async def get_stats():
+        return await controller.get_stats()
 
     return travel_assistant_router
 
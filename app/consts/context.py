@@ -1,2 +1,16 @@
-MAX_CONTEXT_MESSAGES = 15
+import os
 
+# Prompt token budget for response generation, e.g. CONTEXT_MODEL_TOKEN_BUDGETS="llama3.1:8b=3000,qwen3=6000"
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "3000"))
+CONTEXT_MODEL_TOKEN_BUDGETS = os.getenv("CONTEXT_MODEL_TOKEN_BUDGETS", "")
+
+# Optional tokenizer.json (Hugging Face `tokenizers` format); the offline approximation is used otherwise
+CONTEXT_TOKENIZER_PATH = os.getenv("CONTEXT_TOKENIZER_PATH", "")
+
+# Chat template tokens added around every message (role header and end-of-turn markers)
+CONTEXT_MESSAGE_OVERHEAD_TOKENS = 4
+
+# Background summarization: older turns are folded into a running summary, the recent tail is sent verbatim
+SUMMARY_ENABLED = os.getenv("SUMMARY_ENABLED", "true").lower() == "true"
+SUMMARY_TAIL_MESSAGES = int(os.getenv("SUMMARY_TAIL_MESSAGES", "6"))
+SUMMARY_MIN_FOLD_MESSAGES = int(os.getenv("SUMMARY_MIN_FOLD_MESSAGES", "4"))
@@ -0,0 +1,12 @@
+import os
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# Bundled REST Countries snapshot used for country info and name-to-code resolution
+COUNTRY_SNAPSHOT_ENABLED = os.getenv("COUNTRY_SNAPSHOT_ENABLED", "true").lower() == "true"
+COUNTRY_SNAPSHOT_PATH = os.getenv("COUNTRY_SNAPSHOT_PATH", os.path.join(_DATA_DIR, "countries", "rest_countries.json"))
+COUNTRY_SNAPSHOT_MAX_AGE_DAYS = float(os.getenv("COUNTRY_SNAPSHOT_MAX_AGE_DAYS", "90"))
+# restcountries.com accepts at most ten fields per /all request
+COUNTRY_SNAPSHOT_FIELDS = [
+    "name", "cca2", "cca3", "capital", "region", "subregion", "currencies", "languages", "timezones", "altSpellings"
+]
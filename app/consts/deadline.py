@@ -0,0 +1,18 @@
+import os
+
+# Every /chat turn gets a time budget; clients may ask for a tighter one in milliseconds via the header
+TURN_DEADLINE_ENABLED = os.getenv("TURN_DEADLINE_ENABLED", "true").lower() == "true"
+TURN_DEADLINE_SECONDS = float(os.getenv("TURN_DEADLINE_SECONDS", "25"))
+TURN_DEADLINE_HEADER = os.getenv("TURN_DEADLINE_HEADER", "X-Request-Deadline-Ms")
+
+# Seconds kept back for response generation; extraction and research must finish before it
+DEADLINE_GENERATION_RESERVE = float(os.getenv("DEADLINE_GENERATION_RESERVE", "6"))
+# Research is skipped below this budget, and the LLM tool choice is replaced by direct lookups below the second
+DEADLINE_RESEARCH_MIN_SECONDS = float(os.getenv("DEADLINE_RESEARCH_MIN_SECONDS", "1.5"))
+DEADLINE_TOOL_CHOICE_MIN_SECONDS = float(os.getenv("DEADLINE_TOOL_CHOICE_MIN_SECONDS", "5"))
+# Below this research budget, expired tool cache entries are served instead of calling upstream
+DEADLINE_CACHE_FALLBACK_SECONDS = float(os.getenv("DEADLINE_CACHE_FALLBACK_SECONDS", "3"))
+
+# num_predict for generation is shrunk to what the remaining budget can produce at this rate
+DEADLINE_GENERATION_TOKENS_PER_SECOND = float(os.getenv("DEADLINE_GENERATION_TOKENS_PER_SECOND", "30"))
+DEADLINE_MIN_NUM_PREDICT = int(os.getenv("DEADLINE_MIN_NUM_PREDICT", "150"))
@@ -0,0 +1,18 @@
+import os
+
+FANOUT_EXTRACTION_MODE = "fanout"
+FUSED_EXTRACTION_MODE = "fused"
+EXTRACTION_MODES = [FANOUT_EXTRACTION_MODE, FUSED_EXTRACTION_MODE]
+
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", FANOUT_EXTRACTION_MODE).lower()
+
+# Rule-based first stage for location and date extraction, falling back to the LLM when ambiguous
+FAST_PATH_ENABLED = os.getenv("FAST_PATH_ENABLED", "true").lower() == "true"
+
+# Local intent classifier used as a first pass; predictions below the threshold defer to the LLM
+INTENT_CLASSIFIER_ENABLED = os.getenv("INTENT_CLASSIFIER_ENABLED", "true").lower() == "true"
+INTENT_CLASSIFIER_MODEL_PATH = os.getenv(
+    "INTENT_CLASSIFIER_MODEL_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "intent_classifier.npz")
+)
+INTENT_CLASSIFIER_THRESHOLD = float(os.getenv("INTENT_CLASSIFIER_THRESHOLD", "0.65"))
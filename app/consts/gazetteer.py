@@ -0,0 +1,12 @@
+import os
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# Local place index consulted before the remote geocoding API
+GAZETTEER_ENABLED = os.getenv("GAZETTEER_ENABLED", "true").lower() == "true"
+GAZETTEER_PATH = os.getenv("GAZETTEER_PATH", os.path.join(_DATA_DIR, "gazetteer"))
+GAZETTEER_MAX_EDIT_DISTANCE = int(os.getenv("GAZETTEER_MAX_EDIT_DISTANCE", "2"))
+
+# GeoNames-format sources the index is built from (see app.scripts.build_gazetteer)
+GAZETTEER_CITIES_SOURCE = os.path.join(_DATA_DIR, "geonames", "cities_seed.txt")
+GAZETTEER_COUNTRIES_SOURCE = os.path.join(_DATA_DIR, "geonames", "country_info_seed.txt")
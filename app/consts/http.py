@@ -0,0 +1,32 @@
+import os
+
+# Shared HTTP client for the external APIs (geocoding, weather, countries, visa)
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "10"))
+HTTP_MAX_KEEPALIVE_PER_HOST = int(os.getenv("HTTP_MAX_KEEPALIVE_PER_HOST", "5"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5.0"))
+HTTP_DEFAULT_TIMEOUT = float(os.getenv("HTTP_DEFAULT_TIMEOUT", "10.0"))
+
+# Per-host overrides, e.g. HTTP_HOST_TIMEOUTS="restcountries.com=5,api.open-meteo.com=8"
+HTTP_HOST_TIMEOUTS = os.getenv("HTTP_HOST_TIMEOUTS", "")
+HTTP_HOST_MAX_CONNECTIONS = os.getenv("HTTP_HOST_MAX_CONNECTIONS", "")
+
+# Resolved addresses are reused for new connections until they expire
+DNS_CACHE_TTL = float(os.getenv("DNS_CACHE_TTL", "300"))
+
+# Circuit breaker per upstream host: after this many consecutive failures (errors, timeouts, 5xx)
+# requests fail fast for the reset timeout, then a single probe decides whether to close it again
+HTTP_BREAKER_ENABLED = os.getenv("HTTP_BREAKER_ENABLED", "true").lower() == "true"
+HTTP_BREAKER_FAILURE_THRESHOLD = int(os.getenv("HTTP_BREAKER_FAILURE_THRESHOLD", "5"))
+HTTP_BREAKER_RESET_TIMEOUT = float(os.getenv("HTTP_BREAKER_RESET_TIMEOUT", "30"))
+
+# Hedged GETs: a second attempt is sent when the first has not answered by the host's latency percentile
+HTTP_HEDGE_ENABLED = os.getenv("HTTP_HEDGE_ENABLED", "true").lower() == "true"
+HTTP_HEDGE_PERCENTILE = float(os.getenv("HTTP_HEDGE_PERCENTILE", "0.95"))
+HTTP_HEDGE_MIN_SAMPLES = int(os.getenv("HTTP_HEDGE_MIN_SAMPLES", "20"))
+HTTP_HEDGE_MIN_DELAY = float(os.getenv("HTTP_HEDGE_MIN_DELAY", "0.05"))
+
+# Per-host overrides, e.g. HTTP_HOST_HEDGE="rough-sun-2523.fly.dev=false", HTTP_HOST_BREAKER_THRESHOLDS="restcountries.com=3"
+HTTP_HOST_HEDGE = os.getenv("HTTP_HOST_HEDGE", "")
+HTTP_HOST_BREAKER_THRESHOLDS = os.getenv("HTTP_HOST_BREAKER_THRESHOLDS", "")
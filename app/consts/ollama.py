@@ -0,0 +1,24 @@
+import os
+
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+
+# Shared HTTP connection pool towards the Ollama server
+OLLAMA_MAX_CONNECTIONS = int(os.getenv("OLLAMA_MAX_CONNECTIONS", "16"))
+OLLAMA_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OLLAMA_MAX_KEEPALIVE_CONNECTIONS", "8"))
+OLLAMA_KEEPALIVE_EXPIRY = float(os.getenv("OLLAMA_KEEPALIVE_EXPIRY", "120"))
+
+# Per-model in-flight limits, e.g. OLLAMA_MODEL_MAX_INFLIGHT="llama3.1:8b=4,qwen3=2"
+OLLAMA_DEFAULT_MAX_INFLIGHT = int(os.getenv("OLLAMA_MAX_INFLIGHT", "4"))
+OLLAMA_MODEL_MAX_INFLIGHT = os.getenv("OLLAMA_MODEL_MAX_INFLIGHT", "")
+OLLAMA_MAX_QUEUE = int(os.getenv("OLLAMA_MAX_QUEUE", "64"))
+
+# Model residency: keep_alive sent with every request, startup warmup and the periodic keeper
+_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+OLLAMA_KEEP_ALIVE = float(_KEEP_ALIVE) if _KEEP_ALIVE.lstrip("-").replace(".", "", 1).isdigit() else _KEEP_ALIVE
+OLLAMA_WARMUP_ENABLED = os.getenv("OLLAMA_WARMUP_ENABLED", "true").lower() == "true"
+OLLAMA_KEEPER_INTERVAL = float(os.getenv("OLLAMA_KEEPER_INTERVAL", "600"))
+
+# Model-affinity scheduler: same-model requests are batched to avoid swapping models in Ollama
+OLLAMA_SCHEDULER_AFFINITY = os.getenv("OLLAMA_SCHEDULER_AFFINITY", "true").lower() == "true"
+OLLAMA_SCHEDULER_MAX_BATCH = int(os.getenv("OLLAMA_SCHEDULER_MAX_BATCH", "8"))
+OLLAMA_SCHEDULER_MAX_WAIT = float(os.getenv("OLLAMA_SCHEDULER_MAX_WAIT", "2.0"))
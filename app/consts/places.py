@@ -0,0 +1,81 @@
+"""Place names resolved locally by the rule-based extraction fast path (all lowercase)."""
+
+COUNTRIES = [
+    "afghanistan", "albania", "algeria", "andorra", "angola", "antigua and barbuda", "argentina", "armenia",
+    "australia", "austria", "azerbaijan", "bahamas", "bahrain", "bangladesh", "barbados", "belarus", "belgium",
+    "belize", "benin", "bhutan", "bolivia", "bosnia and herzegovina", "botswana", "brazil", "brunei", "bulgaria",
+    "burkina faso", "burundi", "cambodia", "cameroon", "canada", "cape verde", "central african republic", "chad",
+    "chile", "china", "colombia", "comoros", "congo", "costa rica", "croatia", "cuba", "cyprus", "czech republic",
+    "czechia", "denmark", "djibouti", "dominica", "dominican republic", "ecuador", "egypt", "el salvador",
+    "equatorial guinea", "eritrea", "estonia", "eswatini", "ethiopia", "fiji", "finland", "france", "gabon",
+    "gambia", "georgia", "germany", "ghana", "greece", "grenada", "guatemala", "guinea", "guinea-bissau", "guyana",
+    "haiti", "honduras", "hungary", "iceland", "india", "indonesia", "iran", "iraq", "ireland", "israel", "italy",
+    "ivory coast", "jamaica", "japan", "jordan", "kazakhstan", "kenya", "kiribati", "kosovo", "kuwait",
+    "kyrgyzstan", "laos", "latvia", "lebanon", "lesotho", "liberia", "libya", "liechtenstein", "lithuania",
+    "luxembourg", "madagascar", "malawi", "malaysia", "maldives", "mali", "malta", "marshall islands",
+    "mauritania", "mauritius", "mexico", "micronesia", "moldova", "monaco", "mongolia", "montenegro", "morocco",
+    "mozambique", "myanmar", "namibia", "nauru", "nepal", "netherlands", "new zealand", "nicaragua", "niger",
+    "nigeria", "north korea", "north macedonia", "norway", "oman", "pakistan", "palau", "panama",
+    "papua new guinea", "paraguay", "peru", "philippines", "poland", "portugal", "qatar", "romania", "russia",
+    "rwanda", "saint kitts and nevis", "saint lucia", "saint vincent and the grenadines", "samoa", "san marino",
+    "sao tome and principe", "saudi arabia", "senegal", "serbia", "seychelles", "sierra leone", "singapore",
+    "slovakia", "slovenia", "solomon islands", "somalia", "south africa", "south korea", "south sudan", "spain",
+    "sri lanka", "sudan", "suriname", "sweden", "switzerland", "syria", "taiwan", "tajikistan", "tanzania",
+    "thailand", "timor-leste", "togo", "tonga", "trinidad and tobago", "tunisia", "turkey", "turkmenistan",
+    "tuvalu", "uganda", "ukraine", "united arab emirates", "united kingdom", "united states", "uruguay",
+    "uzbekistan", "vanuatu", "vatican city", "venezuela", "vietnam", "yemen", "zambia", "zimbabwe",
+    "usa", "uk", "uae", "england", "scotland", "wales", "holland", "korea", "hong kong", "macau", "puerto rico",
+    "greenland", "tahiti", "french polynesia", "america"
+]
+
+CITIES = [
+    "amsterdam", "athens", "auckland", "austin", "bangkok", "barcelona", "beijing", "berlin", "bogota",
+    "boston", "brussels", "budapest", "buenos aires", "cairo", "cancun", "cape town", "chiang mai", "chicago",
+    "copenhagen", "cusco", "delhi", "new delhi", "doha", "dubai", "dublin", "dubrovnik", "edinburgh", "florence",
+    "frankfurt", "geneva", "hanoi", "havana", "helsinki", "ho chi minh city", "honolulu", "istanbul", "jakarta",
+    "jerusalem", "johannesburg", "kathmandu", "krakow", "kuala lumpur", "kyoto", "las vegas", "lima", "lisbon",
+    "london", "los angeles", "madrid", "marrakech", "melbourne", "mexico city", "miami", "milan", "montreal",
+    "moscow", "mumbai", "munich", "nairobi", "naples", "new orleans", "new york", "new york city", "nyc", "nice",
+    "orlando", "osaka", "oslo", "paris", "phuket", "porto", "prague", "punta cana", "reykjavik", "rio de janeiro",
+    "rome", "san diego", "san francisco", "santiago", "santorini", "sao paulo", "seattle", "seoul", "seville",
+    "shanghai", "split", "stockholm", "sydney", "taipei", "tel aviv", "tokyo", "toronto", "tulum", "vancouver",
+    "venice", "vienna", "warsaw", "washington", "zurich", "salzburg", "valencia", "granada", "malaga", "bruges",
+    "hamburg", "cologne", "lyon", "marseille", "bordeaux", "manchester", "liverpool", "glasgow", "belfast",
+    "tallinn", "riga", "vilnius", "bucharest", "sofia", "belgrade", "zagreb", "ljubljana",
+    "bratislava", "hoi an", "siem reap", "luang prabang", "yangon", "manila", "cebu", "hiroshima",
+    "nara", "sapporo", "busan", "abu dhabi", "muscat", "amman", "petra",
+    "beirut", "eilat", "haifa", "casablanca", "fez", "zanzibar", "cartagena", "medellin", "quito", "la paz",
+    "montevideo", "rio", "queenstown", "brisbane", "perth", "adelaide", "cairns", "quebec city",
+    "banff", "denver", "nashville", "philadelphia", "san juan", "playa del carmen", "oaxaca", "guadalajara",
+    "bali", "maui", "hawaii", "mallorca", "majorca", "ibiza", "crete", "mykonos", "sicily", "sardinia", "corsica",
+    "capri", "amalfi coast", "tuscany", "provence", "algarve", "madeira", "tenerife", "canary islands",
+    "azores", "bora bora", "phi phi", "koh samui", "lombok", "goa", "kerala", "rajasthan", "jaipur",
+    "agra", "patagonia", "galapagos", "machu picchu", "yosemite", "grand canyon", "yellowstone", "lapland",
+    "the alps", "alps", "swiss alps", "dolomites", "scottish highlands", "lake como"
+]
+
+REGIONS = [
+    "africa", "asia", "europe", "north america", "south america", "central america", "latin america",
+    "oceania", "antarctica", "the caribbean", "caribbean", "the middle east", "middle east", "southeast asia",
+    "east asia", "south asia", "central asia", "eastern europe", "western europe", "northern europe",
+    "southern europe", "scandinavia", "the balkans", "balkans", "the mediterranean", "mediterranean",
+    "north africa", "east africa", "west africa", "southern africa", "polynesia", "the baltics", "baltics"
+]
+
+FICTIONAL_PLACES = [
+    "narnia", "middle earth", "middle-earth", "westeros", "essos", "hogwarts", "mordor", "the shire", "rivendell",
+    "wakanda", "asgard", "pandora", "tatooine", "gotham", "gotham city", "metropolis", "neverland", "oz",
+    "land of oz", "wonderland", "atlantis", "el dorado", "shangri-la", "krypton", "hyrule", "bikini bottom",
+    "moon", "the moon", "mars", "jupiter", "saturn", "venus", "mercury", "pluto", "hogsmeade", "king's landing",
+    "winterfell", "jurassic park", "camelot", "valhalla", "olympus", "mount olympus", "emerald city"
+]
+
+# Place names that are also everyday words; only trusted when capitalized mid-sentence
+AMBIGUOUS_PLACE_NAMES = [
+    "nice", "split", "turkey", "china", "chad", "jordan", "georgia", "florence", "victoria", "mobile", "reading",
+    "bath", "male", "guinea", "niger", "petra", "rio", "oz", "mercury", "venus", "olympus", "america", "washington",
+    "orlando", "austin", "santiago", "phoenix", "moon", "mars", "saturn"
+]
+
+# Words that introduce the traveler's origin rather than the destination
+ORIGIN_MARKERS = ["from", "live in", "living in", "based in", "i'm in", "i am in", "citizen of"]
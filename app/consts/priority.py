@@ -0,0 +1,8 @@
+from enum import IntEnum
+
+
+class RequestPriority(IntEnum):
+    # Lower values are scheduled first
+    GENERATION = 0
+    EXTRACTION = 1
+    BACKGROUND = 2
@@ -0,0 +1,4 @@
+import os
+
+# Re-read prompt templates whose file changed on disk; meant for development only
+PROMPT_TEMPLATES_HOT_RELOAD = os.getenv("PROMPT_TEMPLATES_HOT_RELOAD", "false").lower() == "true"
@@ -0,0 +1,17 @@
+import os
+
+# Start geocoding and country lookups as soon as the location is extracted
+SPECULATIVE_PREFETCH_ENABLED = os.getenv("SPECULATIVE_PREFETCH_ENABLED", "true").lower() == "true"
+
+# Tool results are cached per tool; after the TTL a stale result is still served while it is refreshed
+# in the background, until the stale window also runs out. Format: "tool=seconds,tool=seconds"
+TOOL_CACHE_ENABLED = os.getenv("TOOL_CACHE_ENABLED", "true").lower() == "true"
+TOOL_CACHE_TTLS = os.getenv(
+    "TOOL_CACHE_TTLS",
+    "fetch_weather=900,compare_weather=900,fetch_country_info=86400,fetch_visa_info=86400"
+)
+TOOL_CACHE_STALE_TTLS = os.getenv(
+    "TOOL_CACHE_STALE_TTLS",
+    "fetch_weather=900,compare_weather=900,fetch_country_info=604800,fetch_visa_info=604800"
+)
+TOOL_CACHE_MAX_ENTRIES = int(os.getenv("TOOL_CACHE_MAX_ENTRIES", "1024"))
@@ -0,0 +1,20 @@
+import os
+
+# Conversation sessions are keyed by this header, or by the cookie when the header is absent
+SESSION_HEADER_NAME = os.getenv("SESSION_HEADER_NAME", "X-Session-ID")
+SESSION_COOKIE_NAME = os.getenv("SESSION_COOKIE_NAME", "session_id")
+SESSION_COOKIE_MAX_AGE = int(os.getenv("SESSION_COOKIE_MAX_AGE", str(7 * 24 * 3600)))
+
+# Bounded in-memory store: LRU by session count, idle expiry and a memory cap
+SESSION_MAX_SESSIONS = int(os.getenv("SESSION_MAX_SESSIONS", "10000"))
+SESSION_IDLE_TTL = float(os.getenv("SESSION_IDLE_TTL", "3600"))
+SESSION_MAX_MEMORY_BYTES = int(os.getenv("SESSION_MAX_MEMORY_BYTES", str(256 * 1024 * 1024)))
+SESSION_SWEEP_INTERVAL = float(os.getenv("SESSION_SWEEP_INTERVAL", "60"))
+
+# Session persistence: "memory" keeps sessions in process only, "sqlite" writes them behind to a local file
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory").lower()
+SESSION_SQLITE_PATH = os.getenv("SESSION_SQLITE_PATH", "data/sessions.db")
+SESSION_FLUSH_INTERVAL = float(os.getenv("SESSION_FLUSH_INTERVAL", "1.0"))
+SESSION_FLUSH_BATCH_SIZE = int(os.getenv("SESSION_FLUSH_BATCH_SIZE", "256"))
+SESSION_RETENTION = float(os.getenv("SESSION_RETENTION", str(30 * 24 * 3600)))
+SESSION_COMPACT_INTERVAL = float(os.getenv("SESSION_COMPACT_INTERVAL", "3600"))
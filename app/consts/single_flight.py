@@ -0,0 +1,4 @@
+import os
+
+# Merge concurrent identical LLM and external API calls into one upstream request
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
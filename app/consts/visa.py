@@ -1,5 +1,7 @@
 """Constants for visa-related functionality."""
 
+import os
+
 VISA_API_BASE_URL = "https://rough-sun-2523.fly.dev"
 VISA_API_TIMEOUT = 10.0
 REST_COUNTRIES_TIMEOUT = 5.0
@@ -67,6 +69,14 @@ VISA_CATEGORY_TO_STATUS = {
     "NA": "no_admission"
 }
 
+VISA_CATEGORY_NAMES = {
+    "VF": "Visa free",
+    "VOA": "Visa on arrival",
+    "EV": "eVisa",
+    "VR": "Visa required",
+    "NA": "No admission"
+}
+
 VISA_STATUS_DESCRIPTIONS = {
     "yes": "Visa required",
     "no": "No visa required",
@@ -88,3 +98,9 @@ DEFAULT_LLM_TEMPERATURE = 0.1
 DEFAULT_SOURCE = "llm"
 MAX_TEXT_EXTRACT_LENGTH = 500
 
+# Precomputed origin x destination matrix, answered locally before the visa API and the LLM
+VISA_MATRIX_ENABLED = os.getenv("VISA_MATRIX_ENABLED", "true").lower() == "true"
+VISA_MATRIX_PATH = os.getenv(
+    "VISA_MATRIX_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "visa_matrix")
+)
@@ -0,0 +1,13 @@
+import os
+
+# Daily forecast cache keyed by a lat/lon grid cell; nearby points share one upstream forecast
+WEATHER_CACHE_ENABLED = os.getenv("WEATHER_CACHE_ENABLED", "true").lower() == "true"
+WEATHER_CACHE_GRID_DEGREES = float(os.getenv("WEATHER_CACHE_GRID_DEGREES", "0.1"))
+WEATHER_CACHE_MAX_CELLS = int(os.getenv("WEATHER_CACHE_MAX_CELLS", "2048"))
+# Open-Meteo refreshes its forecast models roughly hourly, so cached days older than this are refetched
+WEATHER_CACHE_TTL_SECONDS = float(os.getenv("WEATHER_CACHE_TTL_SECONDS", "3600"))
+
+WEATHER_DAILY_FIELDS = ["temperature_2m_max", "temperature_2m_min", "precipitation_sum", "weathercode"]
+
+# Open-Meteo accepts comma-separated coordinates; larger batches are split into requests of this size
+WEATHER_BATCH_MAX_LOCATIONS = int(os.getenv("WEATHER_BATCH_MAX_LOCATIONS", "50"))
@@ -3,29 +3,55 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import uvicorn
 
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.consts.ollama import OLLAMA_WARMUP_ENABLED
 from app.modules.clients.ollama import OllamaClient
+from app.modules.clients.ollama_warmup import ModelWarmup
+from app.modules.clients.http_pool import HttpClientPool
+from app.modules.tools.cache import ToolResultCache
+from app.algo.extractor.intent_classifier import IntentClassifier
+from app.algo.gazetteer import Gazetteer
+from app.modules.clients.country import CountryAPI
+from app.modules.clients.visa import VisaAPI
+from app.prompts.builder.registry import TemplateRegistry
+from app.modules.summarizer import ConversationSummarizer
 from app.services.conversation_handler import ConversationHandler
 from app.api.controllers.conversation_controller import ConversationController
 from app.api.router import create_travel_assistant_router, create_static_router
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 STATIC_DIR = PROJECT_ROOT / "app" / "static"
 
 llm_client = OllamaClient()
+model_warmup = ModelWarmup(llm_client.pool, enabled=OLLAMA_WARMUP_ENABLED)
 conversation_service = ConversationHandler(llm_client)
-conversation_controller = ConversationController(conversation_service)
+conversation_controller = ConversationController(conversation_service, model_warmup)
 travel_assistant_router = create_travel_assistant_router(conversation_controller)
 static_router = create_static_router(STATIC_DIR)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    conversation_service.start_conversation()
+    await conversation_service.sessions.start()
+    TemplateRegistry.shared().load_all()
+    TemplateRegistry.shared().print_report()
+    ConversationSummarizer.check_prompt()
+    IntentClassifier.shared()
+    Gazetteer.shared()
+    CountryAPI.snapshot()
+    VisaAPI.matrix()
+    if OLLAMA_WARMUP_ENABLED:
+        model_warmup.start()
     yield
+    await conversation_service.summarizer.stop()
+    await conversation_service.sessions.stop()
+    await model_warmup.stop()
+    await llm_client.pool.aclose()
+    await ToolResultCache.shared().stop()
+    await HttpClientPool.shared().aclose()
 
 fast_api = FastAPI(lifespan=lifespan)
 fast_api.include_router(travel_assistant_router)
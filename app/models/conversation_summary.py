@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class ConversationSummary:
+    origin: Optional[str] = None
+    budget: Optional[str] = None
+    travelers: Optional[str] = None
+    dates: List[str] = field(default_factory=list)
+    destinations: List[str] = field(default_factory=list)
+    preferences: List[str] = field(default_factory=list)
+    notes: Optional[str] = None
+    
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ConversationSummary":
+        def text(key: str) -> Optional[str]:
+            value = data.get(key)
+            if value is None or str(value).strip().upper() in ["", "NONE", "N/A", "UNKNOWN"]:
+                return None
+            return str(value).strip()
+        
+        def items(key: str) -> List[str]:
+            value = data.get(key) or []
+            if isinstance(value, str):
+                value = [value]
+            return [str(item).strip() for item in value if str(item).strip()]
+        
+        return cls(
+            origin=text("origin"),
+            budget=text("budget"),
+            travelers=text("travelers"),
+            dates=items("dates"),
+            destinations=items("destinations"),
+            preferences=items("preferences"),
+            notes=text("notes")
+        )
+    
+    def is_empty(self) -> bool:
+        return not any(self.__dict__.values())
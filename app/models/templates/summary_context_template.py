@@ -0,0 +1,19 @@
+from app.models.conversation_summary import ConversationSummary
+
+
+class SummaryContextTemplate:
+    @staticmethod
+    def format(summary: ConversationSummary) -> str:
+        def join(values: list) -> str:
+            return ", ".join(values) if values else "Unknown"
+        
+        return f"""<conversation_summary>
+Summary of the earlier part of this conversation:
+Origin: {summary.origin or "Unknown"}
+Budget: {summary.budget or "Unknown"}
+Travelers: {summary.travelers or "Unknown"}
+Dates: {join(summary.dates)}
+Destinations discussed: {join(summary.destinations)}
+Preferences: {join(summary.preferences)}
+Notes: {summary.notes or "None"}
+</conversation_summary>"""
@@ -1,96 +1,136 @@
-from typing import Optional, Dict, List
-from pydantic import BaseModel, computed_field
-from statistics import mean
+from typing import Optional, Dict, List, Sequence, Tuple
 
+import numpy as np
 
-class DailyWeatherData(BaseModel):
-    temperature_2m_max: List[float]
-    temperature_2m_min: List[float]
-    precipitation_sum: List[float]
-    weathercode: List[int]
-    time: Optional[List[str]] = None
-    
-    @computed_field
-    @property
-    def avg_high(self) -> float:
-        return mean(self.temperature_2m_max) if self.temperature_2m_max else 0.0
-    
-    @computed_field
-    @property
-    def avg_low(self) -> float:
-        return mean(self.temperature_2m_min) if self.temperature_2m_min else 0.0
-    
-    @computed_field
-    @property
-    def total_precipitation(self) -> float:
-        return sum(self.precipitation_sum) if self.precipitation_sum else 0.0
 
-
-class WeatherForecast(BaseModel):
-    latitude: float
-    longitude: float
-    start_date: str
-    end_date: str
-    daily: DailyWeatherData
-    
-    @computed_field
-    @property
-    def location(self) -> str:
-        return f"{self.latitude:.2f}, {self.longitude:.2f}"
-    
-    @computed_field
-    @property
-    def temp_range(self) -> str:
-        return f"{self.daily.avg_low:.0f}°C to {self.daily.avg_high:.0f}°C"
+class ForecastBatch:
+    # Upper bounds of the average WMO weather code for each condition label
+    CONDITION_BOUNDS = np.array([3, 45, 50, 70, 80])
+    CONDITION_LABELS = [
+        "Mostly clear skies",
+        "Partly cloudy",
+        "Foggy conditions",
+        "Rainy periods",
+        "Snow possible",
+        "Showers and possible storms"
+    ]
     
-    @computed_field
-    @property
-    def conditions(self) -> str:
-        if not self.daily.weathercode:
-            return "Variable conditions"
-        
-        avg_code = mean(self.daily.weathercode)
+    def __init__(
+        self,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        days: List[str],
+        temperature_max: np.ndarray,
+        temperature_min: np.ndarray,
+        precipitation: np.ndarray,
+        weathercode: np.ndarray,
+        start_date: str,
+        end_date: str
+    ):
+        # Daily values are (locations, days) columns; NaN marks a day without data
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.days = days
+        self.temperature_max = temperature_max
+        self.temperature_min = temperature_min
+        self.precipitation = precipitation
+        self.weathercode = weathercode
+        self.start_date = start_date
+        self.end_date = end_date
         
-        if avg_code < 3:
-            return "Mostly clear skies"
-        elif avg_code < 45:
-            return "Partly cloudy"
-        elif avg_code < 50:
-            return "Foggy conditions"
-        elif avg_code < 70:
-            return "Rainy periods"
-        elif avg_code < 80:
-            return "Snow possible"
-        else:
-            return "Showers and possible storms"
-    
-    @computed_field
-    @property
-    def summary(self) -> str:
-        return f"Average temperatures between {self.daily.avg_low:.0f}°C and {self.daily.avg_high:.0f}°C with {self.conditions.lower()}"
+        # Summary statistics for every location at once, computed a single time per batch
+        self.present = ~np.isnan(temperature_max) | ~np.isnan(temperature_min)
+        self.avg_high = self._row_mean(temperature_max)
+        self.avg_low = self._row_mean(temperature_min)
+        self.total_precipitation = np.nansum(precipitation, axis=1)
+        self.avg_code = self._row_mean(weathercode)
+        self.condition_index = np.searchsorted(self.CONDITION_BOUNDS, self.avg_code, side="right")
     
     @classmethod
-    def from_api_response(
+    def from_daily(
         cls,
-        data: Dict,
-        latitude: float,
-        longitude: float,
+        points: Sequence[Tuple[float, float]],
+        daily: Sequence[Optional[Dict[str, List]]],
         start_date: str,
         end_date: str
-    ) -> Optional["WeatherForecast"]:
-        daily_data = data.get("daily", {})
-        if not daily_data:
-            return None
+    ) -> "ForecastBatch":
+        days = sorted({day for columns in daily if columns for day in columns.get("time") or []})
+        day_index = {day: index for index, day in enumerate(days)}
+        shape = (len(points), len(days))
+        columns = {
+            field: np.full(shape, np.nan)
+            for field in ("temperature_2m_max", "temperature_2m_min", "precipitation_sum", "weathercode")
+        }
+        
+        for row, values in enumerate(daily):
+            if not values:
+                continue
+            positions = [day_index[day] for day in values.get("time") or []]
+            for field, matrix in columns.items():
+                series = values.get(field) or []
+                count = min(len(positions), len(series))
+                matrix[row, positions[:count]] = np.array(series[:count], dtype=float)
         
-        try:
-            daily = DailyWeatherData(**daily_data)
-            return cls(
-                latitude=latitude,
-                longitude=longitude,
-                start_date=start_date,
-                end_date=end_date,
-                daily=daily
-            )
-        except Exception:
+        return cls(
+            latitudes=np.array([point[0] for point in points], dtype=float),
+            longitudes=np.array([point[1] for point in points], dtype=float),
+            days=days,
+            temperature_max=columns["temperature_2m_max"],
+            temperature_min=columns["temperature_2m_min"],
+            precipitation=columns["precipitation_sum"],
+            weathercode=columns["weathercode"],
+            start_date=start_date,
+            end_date=end_date
+        )
+    
+    @staticmethod
+    def _row_mean(matrix: np.ndarray) -> np.ndarray:
+        counts = np.sum(~np.isnan(matrix), axis=1)
+        sums = np.nansum(matrix, axis=1)
+        return np.divide(sums, counts, out=np.full(len(matrix), np.nan), where=counts > 0)
+    
+    def __len__(self) -> int:
+        return len(self.latitudes)
+    
+    def conditions(self, index: int) -> str:
+        if np.isnan(self.avg_code[index]):
+            return "Variable conditions"
+        return self.CONDITION_LABELS[int(self.condition_index[index])]
+    
+    def view(self, index: int) -> Optional[Dict]:
+        # Same shape as a single-location forecast, so WeatherContextTemplate formats it unchanged
+        mask = self.present[index]
+        if not mask.any():
             return None
-
+        
+        avg_high = 0.0 if np.isnan(self.avg_high[index]) else float(self.avg_high[index])
+        avg_low = 0.0 if np.isnan(self.avg_low[index]) else float(self.avg_low[index])
+        conditions = self.conditions(index)
+        latitude, longitude = float(self.latitudes[index]), float(self.longitudes[index])
+        return {
+            "latitude": latitude,
+            "longitude": longitude,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "daily": {
+                "temperature_2m_max": self._series(self.temperature_max[index][mask]),
+                "temperature_2m_min": self._series(self.temperature_min[index][mask]),
+                "precipitation_sum": self._series(self.precipitation[index][mask]),
+                "weathercode": [None if np.isnan(code) else int(code) for code in self.weathercode[index][mask]],
+                "time": [day for day, present in zip(self.days, mask) if present],
+                "avg_high": avg_high,
+                "avg_low": avg_low,
+                "total_precipitation": float(self.total_precipitation[index])
+            },
+            "location": f"{latitude:.2f}, {longitude:.2f}",
+            "temp_range": f"{avg_low:.0f}°C to {avg_high:.0f}°C",
+            "conditions": conditions,
+            "summary": f"Average temperatures between {avg_low:.0f}°C and {avg_high:.0f}°C with {conditions.lower()}"
+        }
+    
+    def views(self) -> List[Optional[Dict]]:
+        return [self.view(index) for index in range(len(self))]
+    
+    @staticmethod
+    def _series(values: np.ndarray) -> List[Optional[float]]:
+        return [None if np.isnan(value) else float(value) for value in values]
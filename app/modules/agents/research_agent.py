@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 
 from app.consts.models import QWEN_MODEL
 from app.modules.clients.ollama import OllamaClient
+from app.modules.deadline import Deadline
 from app.modules.tools.function_caller import FunctionCaller
 from app.modules.tools.registry import ToolRegistry
 from app.models.extraction_result import ExtractionResult
@@ -14,12 +15,12 @@ from app.prompts.builder.prompts import render_template
 from app.algo.tools import fetch_visa_info, fetch_weather_for_location, fetch_country_info
 from app.algo.extractor.visa_country import VisaCountryExtractor
 from app.consts.intents import PACKING_INTENT, DESTINATION_INTENT, ATTRACTIONS_INTENT
+from app.consts.deadline import DEADLINE_TOOL_CHOICE_MIN_SECONDS
 
 
 class ResearchAgent:
     def __init__(self, llm_client: OllamaClient, tool_registry: ToolRegistry):
-       
-        self.llm = OllamaClient(model=QWEN_MODEL)
+        self.llm = llm_client.for_model(QWEN_MODEL)
         self.tool_registry = tool_registry
         self.function_caller = FunctionCaller(tool_registry, self.llm)
     
@@ -41,6 +42,12 @@ class ResearchAgent:
         if is_visa_query:
             return await self._handle_visa_query_directly(last_user_message, extraction_result)
         
+        # Letting the LLM choose tools costs a generation; with little budget left the direct lookups are used
+        budget = Deadline.stage_budget()
+        if budget is not None and budget < DEADLINE_TOOL_CHOICE_MIN_SECONDS:
+            Deadline.record("research_direct")
+            return await self._fallback_research(extraction_result)
+        
         research_prompt = self._build_research_prompt(extraction_result, conversation_messages)
         
         research_messages = [
@@ -85,6 +92,11 @@ class ResearchAgent:
                     "data": visa_data
                 })
         
+        budget = Deadline.stage_budget()
+        if budget is not None and budget < DEADLINE_TOOL_CHOICE_MIN_SECONDS:
+            Deadline.record("research_direct")
+            return []
+        
         research_prompt = self._build_research_prompt(extraction_result, [
             {"role": MessageRole.USER.value, "content": user_message}
         ])
@@ -129,6 +141,13 @@ class ResearchAgent:
                 'data': formatted_weather
             })
         
+        elif tool_type == "weather_comparison" and data:
+            for weather_data in data:
+                formatted_data.append({
+                    'type': 'weather',
+                    'data': WeatherAPI.format(weather_data)
+                })
+        
         elif tool_type == "country" and data:
             formatted_country = CountryAPI.format(data)
             formatted_data.append({
@@ -157,7 +176,8 @@ class ResearchAgent:
             weather_data = await fetch_weather_for_location(
                 extraction_result.location,
                 start_date,
-                end_date
+                end_date,
+                self.tool_registry.prefetch
             )
             if weather_data:
                 formatted_weather = WeatherAPI.format(weather_data)
@@ -167,7 +187,7 @@ class ResearchAgent:
                 })
         
         elif extraction_result.intent in [DESTINATION_INTENT, ATTRACTIONS_INTENT] and extraction_result.location:
-            country_data = await fetch_country_info(extraction_result.location)
+            country_data = await fetch_country_info(extraction_result.location, self.tool_registry.prefetch)
             if country_data:
                 formatted_country = CountryAPI.format(country_data)
                 external_data.append({
@@ -1,13 +1,17 @@
-import httpx
 from typing import Optional, Dict
+from app.algo.country_index import CountryIndex
+from app.consts.countries import COUNTRY_SNAPSHOT_ENABLED
 from app.models.templates.country_context_template import CountryContextTemplate
 from app.modules.clients.geocoding import GeocodingClient
+from app.modules.clients.http_pool import HttpClientPool
+from app.modules.clients.single_flight import single_flight
 
 
 class CountryAPI:
     BASE_URL = "https://restcountries.com/v3.1"
     
     @staticmethod
+    @single_flight("country", key=lambda location: (location or "").strip().lower())
     async def get_country_info(location: str) -> Optional[Dict]:
         country_data = await CountryAPI._try_get_country(location)
         if country_data:
@@ -20,52 +24,50 @@ class CountryAPI:
         
         return None
     
+    @staticmethod
+    def snapshot() -> Optional[CountryIndex]:
+        return CountryIndex.shared() if COUNTRY_SNAPSHOT_ENABLED else None
+    
     @staticmethod
     async def _try_get_country(country_name: str) -> Optional[Dict]:
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{CountryAPI.BASE_URL}/name/{country_name}",
-                    params={"fullText": "false"}
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                if not data or len(data) == 0:
-                    return None
-                
-                country = data[0]
-                
+        snapshot = CountryAPI.snapshot()
+        if snapshot is not None:
+            country = snapshot.lookup(country_name)
+            if country is not None:
                 return CountryAPI._parse_country_data(country)
-                
+            # A complete snapshot knows every country, so a miss means the name is not one
+            if snapshot.complete:
+                return None
+        
+        return await CountryAPI._fetch_country(country_name)
+    
+    @staticmethod
+    async def _fetch_country(country_name: str) -> Optional[Dict]:
+        try:
+            response = await HttpClientPool.shared().get(
+                f"{CountryAPI.BASE_URL}/name/{country_name}",
+                params={"fullText": "false"},
+                timeout=10.0
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if not data or len(data) == 0:
+                return None
+            
+            country = data[0]
+            
+            return CountryAPI._parse_country_data(country)
+            
         except Exception as e:
             print(f"Error fetching country data for '{country_name}': {str(e)}")
             return None
     
     @staticmethod
     async def _resolve_country_from_location(location: str) -> Optional[str]:
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{GeocodingClient.BASE_URL}/search",
-                    params={"name": location.strip(), "count": 1}
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                results = data.get("results", [])
-                
-                if not results:
-                    return None
-                
-                first_result = results[0]
-                country = first_result.get("country")
-                
-                return country
-                
-        except Exception as e:
-            print(f"Error resolving country from location '{location}': {str(e)}")
-            return None
+        # Shares the geocoding resolution (local gazetteer first) used for the weather coordinates
+        place = await GeocodingClient.resolve(location)
+        return place.country if place and place.country else None
     
     @staticmethod
     def _parse_country_data(country: dict) -> Dict:
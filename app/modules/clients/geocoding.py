@@ -1,6 +1,10 @@
-import httpx
 from typing import NamedTuple, Optional
 
+from app.algo.gazetteer import Gazetteer, Place
+from app.consts.gazetteer import GAZETTEER_ENABLED
+from app.modules.clients.http_pool import HttpClientPool
+from app.modules.clients.single_flight import single_flight
+
 
 class Coordinates(NamedTuple):
     latitude: float
@@ -14,33 +18,61 @@ class GeocodingClient:
     
     @classmethod
     async def get_coordinates(cls, location: str) -> Optional[Coordinates]:
+        place = await cls.resolve(location)
+        if place is None:
+            return None
+        return Coordinates(latitude=place.latitude, longitude=place.longitude)
+    
+    @classmethod
+    @single_flight("geocoding", key=lambda cls, location: (location or "").strip().lower())
+    async def resolve(cls, location: str) -> Optional[Place]:
         if not location or not location.strip():
             return None
         
+        # Coordinates and country come from one resolution; the remote API is only asked on a local miss
+        candidate = None
+        if GAZETTEER_ENABLED:
+            gazetteer = Gazetteer.shared()
+            candidate = gazetteer.lookup(location) if gazetteer else None
+            if candidate and not candidate.distance:
+                return candidate
+        
+        # A fuzzy match may be a real place missing from the gazetteer, so the remote API decides first
+        place = await cls._resolve_remote(location)
+        return place or candidate
+    
+    @classmethod
+    async def _resolve_remote(cls, location: str) -> Optional[Place]:
         try:
-            async with httpx.AsyncClient(timeout=cls.REQUEST_TIMEOUT) as client:
-                response = await client.get(
-                    f"{cls.BASE_URL}/search",
-                    params={"name": location.strip(), "count": cls.MAX_RESULTS}
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                results = data.get("results", [])
-                
-                if not results:
-                    return None
-                
-                first_result = results[0]
-                latitude = first_result.get("latitude")
-                longitude = first_result.get("longitude")
-                
-                if latitude is None or longitude is None:
-                    return None
-                
-                return Coordinates(latitude=latitude, longitude=longitude)
-                
+            response = await HttpClientPool.shared().get(
+                f"{cls.BASE_URL}/search",
+                params={"name": location.strip(), "count": cls.MAX_RESULTS},
+                timeout=cls.REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            results = data.get("results", [])
+            
+            if not results:
+                return None
+            
+            first_result = results[0]
+            latitude = first_result.get("latitude")
+            longitude = first_result.get("longitude")
+            
+            if latitude is None or longitude is None:
+                return None
+            
+            return Place(
+                name=first_result.get("name", location.strip()),
+                latitude=latitude,
+                longitude=longitude,
+                country_code=first_result.get("country_code", ""),
+                country=first_result.get("country", ""),
+                population=first_result.get("population") or 0
+            )
+        
         except Exception as e:
             print(f"Error getting coordinates for '{location}': {str(e)}")
             return None
-
@@ -0,0 +1,337 @@
+import asyncio
+import socket
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from app.consts.http import (
+    HTTP2_ENABLED,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_MAX_KEEPALIVE_PER_HOST,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_DEFAULT_TIMEOUT,
+    HTTP_HOST_TIMEOUTS,
+    HTTP_HOST_MAX_CONNECTIONS,
+    DNS_CACHE_TTL,
+    HTTP_BREAKER_ENABLED,
+    HTTP_HEDGE_ENABLED,
+    HTTP_HOST_HEDGE,
+    HTTP_HOST_BREAKER_THRESHOLDS
+)
+from app.modules.clients.resilience import CircuitBreaker, LatencyTracker
+from app.modules.deadline import Deadline
+
+
+class CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, ttl: float = DNS_CACHE_TTL):
+        self.ttl = ttl
+        self.backend = httpcore.AnyIOBackend()
+        self._addresses: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.connections: Dict[str, int] = {}
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options=None
+    ) -> httpcore.AsyncNetworkStream:
+        self.connections[host] = self.connections.get(host, 0) + 1
+        addresses = await self._resolve(host, port)
+
+        # TLS still verifies against the original host name, only the TCP connect uses the cached address
+        error: Exception = httpcore.ConnectError(f"No addresses found for '{host}'")
+        for address in addresses:
+            try:
+                return await self.backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        self._addresses.pop((host, port), None)
+        raise error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options=None
+    ) -> httpcore.AsyncNetworkStream:
+        return await self.backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float):
+        await self.backend.sleep(seconds)
+
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        cached = self._addresses.get((host, port))
+        if cached is not None and cached[0] > time.monotonic():
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(f"Could not resolve '{host}': {str(e)}")
+
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._addresses[(host, port)] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    def stats(self) -> Dict:
+        return {
+            "ttl": self.ttl,
+            "cached_hosts": len(self._addresses),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+class HostTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, limits: httpx.Limits, http2: bool, network_backend: httpcore.AsyncNetworkBackend):
+        # Built here instead of in super().__init__, which would construct a second pool (and SSL
+        # context) only to throw it away; request mapping and aclose still come from httpx
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http2=http2,
+            network_backend=network_backend
+        )
+
+
+class HostRoutingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, pool: "HttpClientPool"):
+        self.pool = pool
+        self._transports: Dict[str, HostTransport] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        transport = self._transports.get(host)
+        if transport is None:
+            transport = HostTransport(self.pool.limits_for(host), self.pool.http2, self.pool.resolver)
+            self._transports[host] = transport
+
+        response = await transport.handle_async_request(request)
+        self.pool.record(host, response.extensions.get("http_version", b"HTTP/1.1").decode())
+        return response
+
+    async def aclose(self):
+        transports, self._transports = list(self._transports.values()), {}
+        for transport in transports:
+            await transport.aclose()
+
+
+class HttpClientPool:
+    _shared: Optional["HttpClientPool"] = None
+
+    def __init__(
+        self,
+        http2: bool = HTTP2_ENABLED,
+        max_connections: int = HTTP_MAX_CONNECTIONS_PER_HOST,
+        max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_PER_HOST,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+        default_timeout: float = HTTP_DEFAULT_TIMEOUT,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        host_timeouts: Optional[Dict[str, float]] = None,
+        host_max_connections: Optional[Dict[str, int]] = None,
+        resolver: Optional[CachingResolverBackend] = None,
+        breaker_enabled: bool = HTTP_BREAKER_ENABLED,
+        hedge_enabled: bool = HTTP_HEDGE_ENABLED
+    ):
+        self.http2 = http2 and self._h2_available()
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.default_timeout = default_timeout
+        self.connect_timeout = connect_timeout
+        self.host_timeouts = host_timeouts if host_timeouts is not None else {
+            host: float(value) for host, value in self._parse_host_values(HTTP_HOST_TIMEOUTS).items()
+        }
+        self.host_max_connections = host_max_connections if host_max_connections is not None else {
+            host: int(value) for host, value in self._parse_host_values(HTTP_HOST_MAX_CONNECTIONS).items()
+        }
+        self.breaker_enabled = breaker_enabled
+        self.hedge_enabled = hedge_enabled
+        self.host_hedge = {
+            host: value.lower() == "true" for host, value in self._parse_host_values(HTTP_HOST_HEDGE).items()
+        }
+        self.host_breaker_thresholds = {
+            host: int(value) for host, value in self._parse_host_values(HTTP_HOST_BREAKER_THRESHOLDS).items()
+        }
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.latencies: Dict[str, LatencyTracker] = {}
+        self.resolver = resolver or CachingResolverBackend()
+        self._client: Optional[httpx.AsyncClient] = None
+        self.clients_created = 0
+        self.requests: Dict[str, int] = {}
+        self.http_versions: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def shared(cls) -> "HttpClientPool":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                transport=HostRoutingTransport(self),
+                timeout=httpx.Timeout(self.default_timeout, connect=self.connect_timeout)
+            )
+            self.clients_created += 1
+        return self._client
+
+    async def get(self, url: str, timeout: Optional[float] = None, hedge: bool = True, **kwargs) -> httpx.Response:
+        host = httpx.URL(url).host
+        if timeout is None:
+            timeout = self.host_timeouts.get(host, self.default_timeout)
+        # The turn's remaining budget caps the timeout; an expired turn raises DeadlineExceededError
+        bounded = Deadline.bound(timeout)
+        request_timeout = httpx.Timeout(bounded, connect=min(bounded, self.connect_timeout))
+
+        # An unhealthy upstream fails fast with CircuitOpenError instead of waiting out the timeout
+        breaker = self.breaker_for(host) if self.breaker_enabled else None
+        if breaker:
+            breaker.acquire()
+        try:
+            response = await self._get(host, url, request_timeout, hedge, **kwargs)
+        except asyncio.CancelledError:
+            if breaker:
+                breaker.release()
+            raise
+        except httpx.TimeoutException:
+            if breaker:
+                # A timeout shortened by the turn deadline says nothing about the upstream's health
+                if bounded < timeout:
+                    breaker.release()
+                else:
+                    breaker.record_failure()
+            raise
+        except Exception:
+            if breaker:
+                breaker.record_failure()
+            raise
+
+        if breaker:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return response
+
+    async def _get(self, host: str, url: str, timeout: httpx.Timeout, hedge: bool, **kwargs) -> httpx.Response:
+        latency = self.latency_for(host)
+        delay = latency.hedge_delay() if hedge and self.hedge_enabled and self.host_hedge.get(host, True) else None
+        if delay is None:
+            return await self._attempt(latency, url, timeout, **kwargs)
+
+        attempts = [asyncio.ensure_future(self._attempt(latency, url, timeout, **kwargs))]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                # Slower than the host's usual tail latency: race a second attempt against the first
+                latency.hedges += 1
+                attempts.append(asyncio.ensure_future(self._attempt(latency, url, timeout, **kwargs)))
+
+            pending = set(attempts)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None and attempt.result().status_code < 500:
+                        if attempt is not attempts[0]:
+                            latency.hedge_wins += 1
+                        return attempt.result()
+                if not pending:
+                    # Every attempt failed; surface the last failure
+                    return attempt.result()
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
+    async def _attempt(self, latency: LatencyTracker, url: str, timeout: httpx.Timeout, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.client.get(url, timeout=timeout, **kwargs)
+        if response.status_code < 500:
+            latency.record(time.perf_counter() - started)
+        return response
+
+    def breaker_for(self, host: str) -> CircuitBreaker:
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            threshold = self.host_breaker_thresholds.get(host)
+            breaker = CircuitBreaker(host) if threshold is None else CircuitBreaker(host, failure_threshold=threshold)
+            self.breakers[host] = breaker
+        return breaker
+
+    def latency_for(self, host: str) -> LatencyTracker:
+        if host not in self.latencies:
+            self.latencies[host] = LatencyTracker()
+        return self.latencies[host]
+
+    def limits_for(self, host: str) -> httpx.Limits:
+        max_connections = self.host_max_connections.get(host, self.max_connections)
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(self.max_keepalive_connections, max_connections),
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    def record(self, host: str, http_version: str):
+        self.requests[host] = self.requests.get(host, 0) + 1
+        versions = self.http_versions.setdefault(host, {})
+        versions[http_version] = versions.get(http_version, 0) + 1
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def _h2_available() -> bool:
+        try:
+            import h2  # noqa: F401
+            return True
+        except ImportError:
+            print("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+            return False
+
+    @staticmethod
+    def _parse_host_values(value: str) -> Dict[str, str]:
+        values = {}
+        for item in value.split(","):
+            host, _, setting = item.strip().partition("=")
+            if host and setting:
+                values[host.strip()] = setting.strip()
+        return values
+
+    def stats(self) -> Dict:
+        hosts = {}
+        for host, requests in self.requests.items():
+            connections = self.resolver.connections.get(host, 0)
+            hosts[host] = {
+                "requests": requests,
+                "connections_opened": connections,
+                "reused": max(0, requests - connections),
+                "reuse_ratio": round(1 - connections / requests, 3) if requests else 0.0,
+                "http_versions": dict(self.http_versions.get(host, {})),
+                "max_connections": self.limits_for(host).max_connections,
+                "timeout": self.host_timeouts.get(host, self.default_timeout),
+                "breaker": self.breakers[host].stats() if host in self.breakers else None,
+                "hedging": self.latency_for(host).stats()
+            }
+        return {
+            "http2": self.http2,
+            "clients_created": self.clients_created,
+            "keepalive_expiry": self.keepalive_expiry,
+            "breakers": {host: breaker.state for host, breaker in self.breakers.items()},
+            "dns_cache": self.resolver.stats(),
+            "hosts": hosts
+        }
@@ -1,48 +1,141 @@
-from typing import List, Dict, Optional, Any
-import ollama
+from typing import List, Dict, Optional, Any, AsyncIterator
 from app.consts.models import LLAMA_MODEL
+from app.consts.ollama import OLLAMA_KEEP_ALIVE
+from app.consts.llm_cache import LLM_CACHE_ENABLED
+from app.consts.priority import RequestPriority
+from app.modules.clients.ollama_pool import OllamaClientPool
+from app.modules.clients.llm_cache import LLMResponseCache
+from app.modules.clients.single_flight import SingleFlight
 
 
 class OllamaClient:
-    def __init__(self, model: str = LLAMA_MODEL):
+    def __init__(
+        self,
+        model: str = LLAMA_MODEL,
+        pool: Optional[OllamaClientPool] = None,
+        cache: Optional[LLMResponseCache] = None
+    ):
         self.model = model
-        self.base_url = "http://localhost:11434"
+        self.pool = pool or OllamaClientPool.shared()
+        self.cache = cache or (LLMResponseCache.shared() if LLM_CACHE_ENABLED else None)
+        self.base_url = self.pool.host
         self.temperature = 0.0
+        self.keep_alive = OLLAMA_KEEP_ALIVE
+        self.priority = RequestPriority.EXTRACTION
+        self.flight = SingleFlight.group("llm")
         self.provider = "ollama"
 
+    def for_model(self, model: str) -> "OllamaClient":
+        if model == self.model:
+            return self
+        client = OllamaClient(model=model, pool=self.pool, cache=self.cache)
+        client.priority = self.priority
+        return client
+
     async def chat(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float] = None,
         tools: Optional[List[Dict]] = None,
         num_predict: Optional[int] = None,
+        format: Optional[str] = None,
+        priority: Optional[RequestPriority] = None,
     ) -> Dict:
         try:
-            client = ollama.AsyncClient(host=self.base_url)
+            options = self._build_options(temperature, num_predict)
             
-            options = {"temperature": temperature or self.temperature}
-            if num_predict is not None:
-                options["num_predict"] = num_predict
+            cache_key = self._cache_key(messages, options, tools, format)
+            if cache_key:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
             
             chat_params = {
                 "model": self.model,
                 "messages": messages,
-                "options": options
+                "options": options,
+                "keep_alive": self.keep_alive
             }
             if tools:
                 chat_params["tools"] = tools
+            if format:
+                chat_params["format"] = format
             
-            response = await client.chat(**chat_params)
-            message = self._extract_message(response)
-            
-            return {
-                "content": self._extract_content(message),
-                "tool_calls": self._extract_tool_calls(message)
-            }
+            # Identical requests already in flight share one upstream call
+            flight_key = cache_key or LLMResponseCache.build_key(self.model, messages, options, tools, format)
+            return await self.flight.do(flight_key, lambda: self._request(chat_params, priority, cache_key))
 
         except Exception as e:
             raise RuntimeError(f"Error calling Ollama client: {str(e)}")
 
+    async def _request(
+        self,
+        chat_params: Dict[str, Any],
+        priority: Optional[RequestPriority],
+        cache_key: Optional[str]
+    ) -> Dict:
+        async with self.pool.slot(self.model, self._priority(priority)) as client:
+            response = await client.chat(**chat_params)
+        message = self._extract_message(response)
+        
+        result = {
+            "content": self._extract_content(message),
+            "tool_calls": self._extract_tool_calls(message)
+        }
+        if cache_key:
+            self.cache.set(cache_key, result)
+        
+        return result
+
+    async def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        num_predict: Optional[int] = None,
+        priority: Optional[RequestPriority] = None,
+    ) -> AsyncIterator[str]:
+        options = self._build_options(temperature, num_predict)
+
+        try:
+            async with self.pool.slot(self.model, self._priority(priority)) as client:
+                stream = await client.chat(
+                    model=self.model,
+                    messages=messages,
+                    options=options,
+                    keep_alive=self.keep_alive,
+                    stream=True
+                )
+                async for part in stream:
+                    token = self._extract_token(self._extract_message(part))
+                    if token:
+                        yield token
+
+        except Exception as e:
+            raise RuntimeError(f"Error streaming from Ollama client: {str(e)}")
+
+    def _build_options(self, temperature: Optional[float], num_predict: Optional[int]) -> Dict[str, Any]:
+        options = {"temperature": temperature or self.temperature}
+        if num_predict is not None:
+            options["num_predict"] = num_predict
+        return options
+
+    def _priority(self, priority: Optional[RequestPriority]) -> RequestPriority:
+        return self.priority if priority is None else priority
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        options: Dict[str, Any],
+        tools: Optional[List[Dict]],
+        format: Optional[str]
+    ) -> Optional[str]:
+        if self.cache is None:
+            return None
+        if not LLMResponseCache.is_cacheable(options):
+            self.cache.record_skip()
+            return None
+        return LLMResponseCache.build_key(self.model, messages, options, tools, format)
+
     def _extract_message(self, response: Any) -> Any:
         if hasattr(response, 'message'):
             return response.message
@@ -55,6 +148,13 @@ class OllamaClient:
             return message.get("content", "").strip()
         return ""
 
+    def _extract_token(self, message: Any) -> str:
+        if hasattr(message, 'content'):
+            return message.content or ""
+        if isinstance(message, dict):
+            return message.get("content", "")
+        return ""
+
     def _extract_tool_calls(self, message: Any) -> Optional[List[Dict]]:
         if hasattr(message, 'tool_calls') and message.tool_calls:
             return [self._convert_tool_call(tc) for tc in message.tool_calls]
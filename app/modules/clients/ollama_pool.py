@@ -0,0 +1,96 @@
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+import httpx
+import ollama
+
+from app.consts.ollama import (
+    OLLAMA_BASE_URL,
+    OLLAMA_MAX_CONNECTIONS,
+    OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+    OLLAMA_KEEPALIVE_EXPIRY,
+    OLLAMA_DEFAULT_MAX_INFLIGHT,
+    OLLAMA_MODEL_MAX_INFLIGHT,
+    OLLAMA_MAX_QUEUE
+)
+from app.consts.priority import RequestPriority
+from app.modules.clients.ollama_scheduler import ModelScheduler
+
+
+class OllamaClientPool:
+    _shared: Optional["OllamaClientPool"] = None
+
+    def __init__(
+        self,
+        host: str = OLLAMA_BASE_URL,
+        default_max_inflight: int = OLLAMA_DEFAULT_MAX_INFLIGHT,
+        model_max_inflight: Optional[Dict[str, int]] = None,
+        max_queue: int = OLLAMA_MAX_QUEUE
+    ):
+        self.host = host
+        self.default_max_inflight = default_max_inflight
+        self.model_max_inflight = model_max_inflight if model_max_inflight is not None else self._parse_model_limits(OLLAMA_MODEL_MAX_INFLIGHT)
+        self.max_queue = max_queue
+        self.limits = httpx.Limits(
+            max_connections=OLLAMA_MAX_CONNECTIONS,
+            max_keepalive_connections=OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=OLLAMA_KEEPALIVE_EXPIRY
+        )
+        self._client: Optional[ollama.AsyncClient] = None
+        self.scheduler = ModelScheduler(self.max_inflight, max_queue=max_queue)
+        self.clients_created = 0
+        self.requests = 0
+
+    @classmethod
+    def shared(cls) -> "OllamaClientPool":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def client(self) -> ollama.AsyncClient:
+        if self._client is None:
+            self._client = ollama.AsyncClient(host=self.host, limits=self.limits)
+            self.clients_created += 1
+        return self._client
+
+    def max_inflight(self, model: str) -> int:
+        return self.model_max_inflight.get(model, self.default_max_inflight)
+
+    @asynccontextmanager
+    async def slot(self, model: str, priority: RequestPriority = RequestPriority.EXTRACTION):
+        async with self.scheduler.acquire(model, priority):
+            self.requests += 1
+            yield self.client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def stats(self) -> Dict:
+        return {
+            "host": self.host,
+            "pool": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+                "clients_created": self.clients_created,
+                "requests": self.requests
+            },
+            "models": {model: self.scheduler.model_stats(model) for model in self.scheduler.models()},
+            "scheduler": self.scheduler.stats()
+        }
+
+    @staticmethod
+    def _parse_model_limits(raw: str) -> Dict[str, int]:
+        limits = {}
+        for entry in raw.split(","):
+            model, sep, value = entry.strip().rpartition("=")
+            if not sep or not model:
+                continue
+            try:
+                limits[model.strip()] = max(1, int(value))
+            except ValueError:
+                print(f"Ignoring invalid Ollama in-flight limit: '{entry}'")
+        return limits
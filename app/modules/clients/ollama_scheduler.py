@@ -0,0 +1,225 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional
+
+from app.consts.priority import RequestPriority
+from app.consts.ollama import (
+    OLLAMA_MAX_QUEUE,
+    OLLAMA_SCHEDULER_AFFINITY,
+    OLLAMA_SCHEDULER_MAX_BATCH,
+    OLLAMA_SCHEDULER_MAX_WAIT
+)
+
+
+class OllamaQueueFullError(RuntimeError):
+    pass
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    model: str = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+class WaitStats:
+    SAMPLE_SIZE = 512
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=self.SAMPLE_SIZE)
+
+    def record(self, waited: float):
+        self.count += 1
+        self.total += waited
+        self.max = max(self.max, waited)
+        self.samples.append(waited)
+
+    def stats(self) -> Dict:
+        ordered = sorted(self.samples)
+        return {
+            "requests": self.count,
+            "avg_wait_ms": round(self.total / self.count * 1000, 2) if self.count else 0.0,
+            "p50_wait_ms": self._percentile(ordered, 0.5),
+            "p95_wait_ms": self._percentile(ordered, 0.95),
+            "max_wait_ms": round(self.max * 1000, 2)
+        }
+
+    @staticmethod
+    def _percentile(ordered: List[float], fraction: float) -> float:
+        if not ordered:
+            return 0.0
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000, 2)
+
+
+class ModelScheduler:
+    def __init__(
+        self,
+        max_inflight: Callable[[str], int],
+        max_queue: int = OLLAMA_MAX_QUEUE,
+        affinity: bool = OLLAMA_SCHEDULER_AFFINITY,
+        max_batch: int = OLLAMA_SCHEDULER_MAX_BATCH,
+        max_wait: float = OLLAMA_SCHEDULER_MAX_WAIT
+    ):
+        self.max_inflight = max_inflight
+        self.max_queue = max_queue
+        self.affinity = affinity
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.active_model: Optional[str] = None
+        self._queues: Dict[str, List[_Waiter]] = {}
+        self._running: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._batch_size = 0
+        self.dispatched = 0
+        self.batches = 0
+        self.switches = 0
+        self.completed: Dict[str, int] = {}
+        self.cancelled: Dict[str, int] = {}
+        self.rejected: Dict[str, int] = {}
+        self.model_waits: Dict[str, WaitStats] = {}
+        self.priority_waits = {priority: WaitStats() for priority in RequestPriority}
+
+    @asynccontextmanager
+    async def acquire(self, model: str, priority: RequestPriority = RequestPriority.EXTRACTION):
+        waiter = self._enqueue(model, priority)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            self.cancelled[model] = self.cancelled.get(model, 0) + 1
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just before the cancellation arrived; hand the slot back without counting a completion
+                self._release(model, completed=False)
+            else:
+                self._dispatch()
+            raise
+
+        try:
+            yield
+        finally:
+            self._release(model)
+
+    def _enqueue(self, model: str, priority: RequestPriority) -> _Waiter:
+        queue = self._queues.setdefault(model, [])
+        if sum(1 for waiter in queue if not waiter.future.done()) >= self.max_queue:
+            self.rejected[model] = self.rejected.get(model, 0) + 1
+            raise OllamaQueueFullError(f"Ollama queue for model '{model}' is full ({self.max_queue} waiting)")
+
+        waiter = _Waiter(
+            priority=int(priority),
+            sequence=next(self._sequence),
+            model=model,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.perf_counter()
+        )
+        heapq.heappush(queue, waiter)
+        return waiter
+
+    def _release(self, model: str, completed: bool = True):
+        self._running[model] -= 1
+        if completed:
+            self.completed[model] = self.completed.get(model, 0) + 1
+        self._dispatch()
+
+    def _dispatch(self):
+        while True:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            self._start(waiter)
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        for queue in self._queues.values():
+            while queue and queue[0].future.done():
+                heapq.heappop(queue)
+
+        waiting = [model for model, queue in self._queues.items() if queue]
+        if not waiting:
+            if not any(self._running.values()):
+                self._batch_size = 0
+            return None
+
+        if self.affinity:
+            model = self._choose_model(waiting)
+            if any(count for other, count in self._running.items() if other != model):
+                # Let the loaded model drain before Ollama switches to the next one
+                return None
+            candidates = [model]
+        else:
+            candidates = sorted(waiting, key=lambda name: self._queues[name][0])
+
+        for model in candidates:
+            if self._running.get(model, 0) < self.max_inflight(model):
+                return heapq.heappop(self._queues[model])
+        return None
+
+    def _choose_model(self, waiting: List[str]) -> str:
+        best = min(waiting, key=lambda model: self._queues[model][0])
+        if self.active_model not in waiting or best == self.active_model:
+            return best
+
+        head = self._queues[self.active_model][0]
+        other = self._queues[best][0]
+        if other.priority < head.priority:
+            return best
+
+        # Same priority: stay on the loaded model until the batch is full or the other model waited too long
+        waited = time.perf_counter() - other.enqueued_at
+        if self._batch_size < self.max_batch and waited < self.max_wait:
+            return self.active_model
+        return best
+
+    def _start(self, waiter: _Waiter):
+        if waiter.model != self.active_model:
+            if self.active_model is not None:
+                self.switches += 1
+            self.active_model = waiter.model
+            self._batch_size = 0
+            self.batches += 1
+
+        self._batch_size += 1
+        self.dispatched += 1
+        self._running[waiter.model] = self._running.get(waiter.model, 0) + 1
+
+        waited = time.perf_counter() - waiter.enqueued_at
+        self.priority_waits[RequestPriority(waiter.priority)].record(waited)
+        self.model_waits.setdefault(waiter.model, WaitStats()).record(waited)
+        waiter.future.set_result(None)
+
+    def models(self) -> List[str]:
+        return list(self._queues)
+
+    def model_stats(self, model: str) -> Dict:
+        waits = self.model_waits.get(model, WaitStats()).stats()
+        return {
+            "max_inflight": self.max_inflight(model),
+            "max_queue": self.max_queue,
+            "in_flight": self._running.get(model, 0),
+            "queued": sum(1 for waiter in self._queues.get(model, []) if not waiter.future.done()),
+            "completed": self.completed.get(model, 0),
+            "cancelled": self.cancelled.get(model, 0),
+            "rejected": self.rejected.get(model, 0),
+            "avg_wait_ms": waits["avg_wait_ms"],
+            "max_wait_ms": waits["max_wait_ms"]
+        }
+
+    def stats(self) -> Dict:
+        return {
+            "affinity": self.affinity,
+            "max_batch": self.max_batch,
+            "max_wait_s": self.max_wait,
+            "active_model": self.active_model,
+            "model_switches": self.switches,
+            "avg_batch_size": round(self.dispatched / self.batches, 2) if self.batches else 0.0,
+            "queue_wait": {priority.name.lower(): stats.stats() for priority, stats in self.priority_waits.items()}
+        }
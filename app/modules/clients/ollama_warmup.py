@@ -0,0 +1,143 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from app.consts.models import LLAMA_MODEL, QWEN_MODEL
+from app.consts.ollama import OLLAMA_KEEP_ALIVE, OLLAMA_KEEPER_INTERVAL, OLLAMA_WARMUP_ENABLED
+from app.consts.priority import RequestPriority
+from app.consts.roles import MessageRole
+from app.modules.clients.ollama import OllamaClient
+from app.modules.clients.ollama_pool import OllamaClientPool
+from app.modules.tools.registry import ToolRegistry
+from app.prompts.builder.prompts import render_template
+
+
+class ModelWarmup:
+    def __init__(
+        self,
+        pool: Optional[OllamaClientPool] = None,
+        models: Optional[List[str]] = None,
+        keep_alive=OLLAMA_KEEP_ALIVE,
+        keeper_interval: float = OLLAMA_KEEPER_INTERVAL,
+        enabled: bool = OLLAMA_WARMUP_ENABLED
+    ):
+        self.enabled = enabled
+        self.pool = pool or OllamaClientPool.shared()
+        self.models = models or [LLAMA_MODEL, QWEN_MODEL]
+        self.keep_alive = keep_alive
+        self.keeper_interval = keeper_interval
+        self.status: Dict[str, Dict] = {
+            model: {"loaded": False, "primed": False, "load_ms": None, "last_refresh": None, "error": None}
+            for model in self.models
+        }
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._keeper_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    @property
+    def is_ready(self) -> bool:
+        # Without warmup the models load on first use, so there is nothing to wait for
+        if not self.enabled:
+            return True
+        return all(status["loaded"] and status["primed"] for status in self.status.values())
+
+    async def warmup(self):
+        await asyncio.gather(*[self._warm_model(model) for model in self.models])
+
+    def start(self):
+        # Warm up in the background; the keeper takes over once warmup has finished
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self.warmup())
+            self._warmup_task.add_done_callback(self._on_warmup_done)
+
+    def _on_warmup_done(self, task: asyncio.Task):
+        if task.cancelled() or self._stopped:
+            return
+        self.start_keeper()
+
+    def start_keeper(self):
+        if self._keeper_task is None and not self._stopped:
+            self._keeper_task = asyncio.create_task(self._keep_models_loaded())
+
+    async def stop(self):
+        self._stopped = True
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+            self._warmup_task = None
+
+        if self._keeper_task is not None:
+            self._keeper_task.cancel()
+            try:
+                await self._keeper_task
+            except asyncio.CancelledError:
+                pass
+            self._keeper_task = None
+
+    def readiness(self) -> Dict:
+        return {
+            "ready": self.is_ready,
+            "warmup_enabled": self.enabled,
+            "keep_alive": self.keep_alive,
+            "models": self.status
+        }
+
+    async def _warm_model(self, model: str):
+        status = self.status[model]
+        try:
+            started = time.perf_counter()
+            await self._load(model)
+            status["load_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+            await self._prime(model)
+            status["primed"] = True
+            status["error"] = None
+        except Exception as e:
+            status["error"] = str(e)
+            print(f"Warmup failed for model '{model}': {str(e)}")
+
+    async def _load(self, model: str):
+        # An empty prompt loads the model into memory without generating
+        async with self.pool.slot(model, RequestPriority.BACKGROUND) as client:
+            await client.generate(model=model, prompt="", keep_alive=self.keep_alive)
+        self.status[model]["loaded"] = True
+        self.status[model]["last_refresh"] = time.time()
+
+    async def _prime(self, model: str):
+        llm = OllamaClient(model=model, pool=self.pool)
+        llm.keep_alive = self.keep_alive
+        llm.priority = RequestPriority.BACKGROUND
+        for messages, tools in self._priming_requests(model):
+            await llm.chat(messages, tools=tools, num_predict=1)
+
+    def _priming_requests(self, model: str) -> List:
+        # Static prompt prefixes, so their evaluation is cached before the first real turn
+        if model == QWEN_MODEL:
+            research_prompt = render_template("research_agent.j2", intent="", user_query="", location=None, date=None)
+            return [
+                ([{"role": MessageRole.SYSTEM.value, "content": research_prompt}], ToolRegistry().get_tool_schemas())
+            ]
+
+        return [
+            ([{"role": MessageRole.SYSTEM.value, "content": render_template("system_prompt.j2")}], None),
+            ([{"role": MessageRole.USER.value, "content": render_template("intent_extraction.j2", message="")}], None),
+            ([{"role": MessageRole.USER.value, "content": render_template("location_extraction.j2", message="")}], None),
+            ([{"role": MessageRole.USER.value, "content": render_template("date_extraction.j2", message="")}], None)
+        ]
+
+    async def _keep_models_loaded(self):
+        while True:
+            await asyncio.sleep(self.keeper_interval)
+            for model in self.models:
+                try:
+                    if not self.status[model]["primed"]:
+                        await self._warm_model(model)
+                    else:
+                        await self._load(model)
+                except Exception as e:
+                    self.status[model]["loaded"] = False
+                    self.status[model]["error"] = str(e)
+                    print(f"Keep-alive refresh failed for model '{model}': {str(e)}")
@@ -0,0 +1,120 @@
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from app.consts.http import (
+    HTTP_BREAKER_FAILURE_THRESHOLD,
+    HTTP_BREAKER_RESET_TIMEOUT,
+    HTTP_HEDGE_PERCENTILE,
+    HTTP_HEDGE_MIN_SAMPLES,
+    HTTP_HEDGE_MIN_DELAY
+)
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = HTTP_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = HTTP_BREAKER_RESET_TIMEOUT
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    def acquire(self):
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(f"Circuit for '{self.host}' is open after {self.consecutive_failures} consecutive failures")
+            self.state = self.HALF_OPEN
+
+        if self.state == self.HALF_OPEN:
+            # One probe at a time decides whether the upstream has recovered
+            if self._probing:
+                self.rejected += 1
+                raise CircuitOpenError(f"Circuit for '{self.host}' is half-open and already probing")
+            self._probing = True
+
+    def release(self):
+        # The request was cancelled before it had an outcome
+        self._probing = False
+
+    def record_success(self):
+        self.successes += 1
+        self.consecutive_failures = 0
+        self._probing = False
+        self.state = self.CLOSED
+
+    def record_failure(self):
+        self.failures += 1
+        self.consecutive_failures += 1
+        self._probing = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "successes": self.successes,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened
+        }
+
+
+class LatencyTracker:
+    SAMPLE_SIZE = 256
+
+    def __init__(
+        self,
+        percentile: float = HTTP_HEDGE_PERCENTILE,
+        min_samples: int = HTTP_HEDGE_MIN_SAMPLES,
+        min_delay: float = HTTP_HEDGE_MIN_DELAY
+    ):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.samples: Deque[float] = deque(maxlen=self.SAMPLE_SIZE)
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record(self, latency: float):
+        self.samples.append(latency)
+
+    def hedge_delay(self) -> Optional[float]:
+        # No hedging until there are enough samples to know what a slow answer looks like
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return max(self.min_delay, ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))])
+
+    def stats(self) -> Dict:
+        delay = self.hedge_delay()
+        return {
+            "samples": len(self.samples),
+            "hedge_delay_ms": round(delay * 1000, 2) if delay is not None else None,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins
+        }
@@ -0,0 +1,109 @@
+import asyncio
+import copy
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from app.consts.single_flight import SINGLE_FLIGHT_ENABLED
+from app.modules.deadline import Deadline, DeadlineExceededError
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    _groups: Dict[str, "SingleFlight"] = {}
+
+    def __init__(self, name: str, enabled: bool = SINGLE_FLIGHT_ENABLED):
+        self.name = name
+        self.enabled = enabled
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.executions = 0
+        self.merged = 0
+        self.errors = 0
+
+    @classmethod
+    def group(cls, name: str) -> "SingleFlight":
+        if name not in cls._groups:
+            cls._groups[name] = cls(name)
+        return cls._groups[name]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        if not self.enabled:
+            self.executions += 1
+            return await fn()
+
+        flight = self._flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _Flight(asyncio.ensure_future(self._detached(fn)))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda task: self._finish(key, flight))
+            self.executions += 1
+        else:
+            self.merged += 1
+
+        # The shared call runs without a deadline; each caller only waits for as long as its own turn allows
+        deadline = Deadline.current()
+        flight.waiters += 1
+        try:
+            result = await asyncio.wait_for(asyncio.shield(flight.task), deadline.remaining() if deadline else None)
+        except asyncio.TimeoutError:
+            if flight.task.done():
+                raise
+            raise DeadlineExceededError(f"Turn deadline exceeded while waiting for '{self.name}'")
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller gave up; nobody is left to receive the result
+                flight.task.cancel()
+
+        # Every caller, the leader included, gets its own copy so mutations never leak between callers
+        return copy.deepcopy(result)
+
+    @staticmethod
+    async def _detached(fn: Callable[[], Awaitable[Any]]) -> Any:
+        # The task inherited the leader's context; followers must not be bound by the leader's deadline
+        Deadline.detach()
+        return await fn()
+
+    def _finish(self, key: Hashable, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled() and flight.task.exception() is not None:
+            self.errors += 1
+
+    def stats(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "merged": self.merged,
+            "in_flight": len(self._flights),
+            "errors": self.errors,
+            "merge_rate": round(self.merged / self.calls, 4) if self.calls else 0.0
+        }
+
+    @classmethod
+    def all_stats(cls) -> Dict:
+        return {
+            "enabled": SINGLE_FLIGHT_ENABLED,
+            "groups": {name: group.stats() for name, group in cls._groups.items()}
+        }
+
+
+def single_flight(name: str, key: Optional[Callable[..., Hashable]] = None):
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        group = SingleFlight.group(name)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            flight_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            return await group.do(flight_key, lambda: fn(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
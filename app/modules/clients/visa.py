@@ -1,9 +1,12 @@
 import json
 import re
-import httpx
 from typing import Optional, Dict
+from app.algo.visa_matrix import VisaMatrix
 from app.consts.models import QWEN_MODEL
 from app.modules.clients.ollama import OllamaClient
+from app.modules.clients.http_pool import HttpClientPool
+from app.modules.clients.country import CountryAPI
+from app.modules.clients.single_flight import single_flight
 from app.prompts.builder.prompts import render_template
 from app.models.templates.visa_context_template import VisaContextTemplate
 from app.consts.visa import (
@@ -11,6 +14,7 @@ from app.consts.visa import (
     VISA_API_TIMEOUT,
     REST_COUNTRIES_TIMEOUT,
     REST_COUNTRIES_BASE_URL,
+    VISA_MATRIX_ENABLED,
     COUNTRY_NAME_TO_CODE,
     VISA_CATEGORY_TO_STATUS,
     VISA_STATUS_DESCRIPTIONS,
@@ -22,18 +26,38 @@ from app.consts.visa import (
 
 
 class VisaAPI:
+    _llm: Optional[OllamaClient] = None
+
+    @classmethod
+    def _get_llm(cls) -> OllamaClient:
+        if cls._llm is None:
+            cls._llm = OllamaClient(model=QWEN_MODEL)
+        return cls._llm
+
+    @staticmethod
+    def matrix() -> Optional[VisaMatrix]:
+        return VisaMatrix.shared() if VISA_MATRIX_ENABLED else None
+
     @staticmethod
+    @single_flight(
+        "visa",
+        key=lambda origin_country, destination_country: (
+            (origin_country or "").strip().lower(),
+            (destination_country or "").strip().lower()
+        )
+    )
     async def get_visa_info(
         origin_country: str,
         destination_country: str
     ) -> Optional[Dict]:
         try:
-            async with httpx.AsyncClient(timeout=VISA_API_TIMEOUT) as client:
-                response = await VisaAPI._fetch_visa_data_free_api(
-                    client, origin_country, destination_country
-                )
-                if response:
-                    return VisaAPI._parse_visa_data(response, origin_country, destination_country)
+            response = await VisaAPI._lookup_matrix(origin_country, destination_country)
+            if response:
+                return VisaAPI._parse_visa_data(response, origin_country, destination_country)
+            
+            response = await VisaAPI._fetch_visa_data_free_api(origin_country, destination_country)
+            if response:
+                return VisaAPI._parse_visa_data(response, origin_country, destination_country)
             
             result = await VisaAPI._fetch_visa_data_llm(origin_country, destination_country)
             return result
@@ -42,13 +66,26 @@ class VisaAPI:
             print(f"Error fetching visa data: {str(e)}")
             return None
     
+    @staticmethod
+    async def _lookup_matrix(origin: str, destination: str) -> Optional[Dict]:
+        # The API and the LLM are only used for pairs the precomputed matrix does not know
+        matrix = VisaAPI.matrix()
+        if matrix is None:
+            return None
+        
+        origin_code = await VisaAPI._country_name_to_code(origin)
+        destination_code = await VisaAPI._country_name_to_code(destination)
+        if not origin_code or not destination_code:
+            return None
+        return matrix.lookup(origin_code, destination_code)
+    
     @staticmethod
     async def _fetch_visa_data_llm(
         origin: str,
         destination: str
     ) -> Optional[Dict]:
         try:
-            llm = OllamaClient(model=QWEN_MODEL)
+            llm = VisaAPI._get_llm()
             
             prompt = render_template("visa_llm_prompt.j2", origin=origin, destination=destination)
             messages = [{"role": "user", "content": prompt}]
@@ -102,7 +139,6 @@ class VisaAPI:
     
     @staticmethod
     async def _fetch_visa_data_free_api(
-        client: httpx.AsyncClient,
         origin: str,
         destination: str
     ) -> Optional[Dict]:
@@ -114,8 +150,9 @@ class VisaAPI:
                 print(f"Could not convert country names to codes: {origin} -> {origin_code}, {destination} -> {destination_code}")
                 return None
             
-            response = await client.get(
-                f"{VISA_API_BASE_URL}/visa/{origin_code}/{destination_code}"
+            response = await HttpClientPool.shared().get(
+                f"{VISA_API_BASE_URL}/visa/{origin_code}/{destination_code}",
+                timeout=VISA_API_TIMEOUT
             )
             response.raise_for_status()
             return response.json()
@@ -130,18 +167,24 @@ class VisaAPI:
         if country_lower in COUNTRY_NAME_TO_CODE:
             return COUNTRY_NAME_TO_CODE[country_lower]
         
+        snapshot = CountryAPI.snapshot()
+        if snapshot is not None:
+            country_code = snapshot.code(country_name)
+            if country_code or snapshot.complete:
+                return country_code
+        
         try:
-            async with httpx.AsyncClient(timeout=REST_COUNTRIES_TIMEOUT) as client:
-                response = await client.get(
-                    f"{REST_COUNTRIES_BASE_URL}/name/{country_name}",
-                    params={"fullText": "false"}
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    if data and len(data) > 0:
-                        country_code = data[0].get("cca2", "").upper()
-                        if country_code:
-                            return country_code
+            response = await HttpClientPool.shared().get(
+                f"{REST_COUNTRIES_BASE_URL}/name/{country_name}",
+                params={"fullText": "false"},
+                timeout=REST_COUNTRIES_TIMEOUT
+            )
+            if response.status_code == 200:
+                data = response.json()
+                if data and len(data) > 0:
+                    country_code = data[0].get("cca2", "").upper()
+                    if country_code:
+                        return country_code
         except Exception:
             pass
         
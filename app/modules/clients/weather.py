@@ -1,13 +1,17 @@
-import httpx
-from typing import Optional, Dict
-from app.models.weather import WeatherForecast
+from typing import Optional, Dict, List, Sequence, Tuple
+from app.models.weather import ForecastBatch
 from app.models.templates.weather_context_template import WeatherContextTemplate
+from app.modules.clients.http_pool import HttpClientPool
+from app.modules.clients.single_flight import single_flight
+from app.modules.clients.weather_cache import ForecastCache
+from app.consts.weather import WEATHER_CACHE_ENABLED, WEATHER_DAILY_FIELDS, WEATHER_BATCH_MAX_LOCATIONS
 
 
 class WeatherAPI:
     BASE_URL = "https://api.open-meteo.com/v1"
     
     @classmethod
+    @single_flight("weather")
     async def get_forecast(
         cls,
         latitude: float,
@@ -15,32 +19,94 @@ class WeatherAPI:
         start_date: str,
         end_date: str
     ) -> Optional[Dict]:
+        batch = await cls.get_forecasts([(latitude, longitude)], start_date, end_date)
+        return batch.view(0) if batch else None
+    
+    @classmethod
+    async def get_forecasts(
+        cls,
+        points: Sequence[Tuple[float, float]],
+        start_date: str,
+        end_date: str
+    ) -> Optional[ForecastBatch]:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{cls.BASE_URL}/forecast",
-                    params={
-                        "latitude": latitude,
-                        "longitude": longitude,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,weathercode",
-                        "timezone": "auto"
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                forecast = WeatherForecast.from_api_response(
-                    data, latitude, longitude, start_date, end_date
-                )
-                return forecast.model_dump() if forecast else None
-                
+            if WEATHER_CACHE_ENABLED:
+                daily = await cls._get_cached_daily(points, start_date, end_date)
+            else:
+                daily = await cls._fetch_daily(points, start_date, end_date)
+            
+            if not any(daily):
+                return None
+            return ForecastBatch.from_daily(points, daily, start_date, end_date)
+            
         except Exception as e:
         
             print(f"Error fetching weather data: {str(e)}")
             return None
     
+    @classmethod
+    async def _get_cached_daily(
+        cls,
+        points: Sequence[Tuple[float, float]],
+        start_date: str,
+        end_date: str
+    ) -> List[Optional[Dict[str, List]]]:
+        cache = ForecastCache.shared()
+        lookups = [cache.lookup(latitude, longitude, start_date, end_date) for latitude, longitude in points]
+        
+        # Days already cached for a grid cell are sliced out; the missing cells share one upstream request
+        missing_cells: Dict[Tuple[int, int], Tuple[float, float]] = {}
+        missing_days: List[str] = []
+        for (latitude, longitude), (_, missing) in zip(points, lookups):
+            if missing:
+                missing_cells.setdefault(cache.cell(latitude, longitude), (latitude, longitude))
+                missing_days.extend(missing)
+        
+        fetched_by_cell = {}
+        if missing_cells:
+            cell_points = list(missing_cells.values())
+            centers = [cache.center(latitude, longitude) for latitude, longitude in cell_points]
+            fetched = await cls._fetch_daily(centers, min(missing_days), max(missing_days))
+            for (latitude, longitude), daily in zip(cell_points, fetched):
+                if daily:
+                    fetched_by_cell[cache.cell(latitude, longitude)] = cache.store(latitude, longitude, daily)
+        
+        days = cache.days(start_date, end_date)
+        result = []
+        for (latitude, longitude), (records, _) in zip(points, lookups):
+            records.update(fetched_by_cell.get(cache.cell(latitude, longitude), {}))
+            result.append(cache.assemble(records, days) if records else None)
+        return result
+    
+    @classmethod
+    async def _fetch_daily(
+        cls,
+        points: Sequence[Tuple[float, float]],
+        start_date: str,
+        end_date: str
+    ) -> List[Optional[Dict[str, List]]]:
+        daily = []
+        for offset in range(0, len(points), WEATHER_BATCH_MAX_LOCATIONS):
+            chunk = points[offset:offset + WEATHER_BATCH_MAX_LOCATIONS]
+            response = await HttpClientPool.shared().get(
+                f"{cls.BASE_URL}/forecast",
+                params={
+                    "latitude": ",".join(str(latitude) for latitude, _ in chunk),
+                    "longitude": ",".join(str(longitude) for _, longitude in chunk),
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "daily": ",".join(WEATHER_DAILY_FIELDS),
+                    "timezone": "auto"
+                }
+            )
+            response.raise_for_status()
+            
+            # A single coordinate pair returns one object, several return a list in request order
+            data = response.json()
+            locations = data if isinstance(data, list) else [data]
+            daily.extend(location.get("daily") for location in locations)
+        return daily
+    
     @staticmethod
     def format(weather_data: Dict) -> str:    
         return WeatherContextTemplate.format(weather_data)
@@ -0,0 +1,121 @@
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.consts.weather import (
+    WEATHER_CACHE_GRID_DEGREES,
+    WEATHER_CACHE_MAX_CELLS,
+    WEATHER_CACHE_TTL_SECONDS,
+    WEATHER_DAILY_FIELDS
+)
+
+Cell = Tuple[int, int]
+
+
+class ForecastCache:
+    _shared: Optional["ForecastCache"] = None
+
+    def __init__(
+        self,
+        grid_degrees: float = WEATHER_CACHE_GRID_DEGREES,
+        max_cells: int = WEATHER_CACHE_MAX_CELLS,
+        ttl_seconds: float = WEATHER_CACHE_TTL_SECONDS
+    ):
+        self.grid_degrees = grid_degrees
+        self.max_cells = max_cells
+        self.ttl_seconds = ttl_seconds
+        # cell -> day -> (values in WEATHER_DAILY_FIELDS order, fetched_at)
+        self._cells: "OrderedDict[Cell, Dict[str, Tuple[tuple, float]]]" = OrderedDict()
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.days_served = 0
+        self.days_fetched = 0
+        self.evictions = 0
+
+    @classmethod
+    def shared(cls) -> "ForecastCache":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def cell(self, latitude: float, longitude: float) -> Cell:
+        return round(latitude / self.grid_degrees), round(longitude / self.grid_degrees)
+
+    def center(self, latitude: float, longitude: float) -> Tuple[float, float]:
+        cell_lat, cell_lon = self.cell(latitude, longitude)
+        return round(cell_lat * self.grid_degrees, 4), round(cell_lon * self.grid_degrees, 4)
+
+    @staticmethod
+    def days(start_date: str, end_date: str) -> List[str]:
+        start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+        return [(start + timedelta(days=offset)).isoformat() for offset in range((end - start).days + 1)]
+
+    def lookup(self, latitude: float, longitude: float, start_date: str, end_date: str) -> Tuple[Dict[str, tuple], List[str]]:
+        requested = self.days(start_date, end_date)
+        cell = self.cell(latitude, longitude)
+        records = self._cells.get(cell, {})
+        now = time.monotonic()
+
+        found = {}
+        for day in requested:
+            record = records.get(day)
+            if record is not None and now - record[1] < self.ttl_seconds:
+                found[day] = record[0]
+        missing = [day for day in requested if day not in found]
+
+        if records:
+            self._cells.move_to_end(cell)
+        if not missing:
+            self.hits += 1
+        elif found:
+            self.partial_hits += 1
+        else:
+            self.misses += 1
+        self.days_served += len(found)
+        return found, missing
+
+    def store(self, latitude: float, longitude: float, daily: Dict[str, List]) -> Dict[str, tuple]:
+        days = daily.get("time") or []
+        columns = [daily.get(field) or [] for field in WEATHER_DAILY_FIELDS]
+        records = {
+            day: tuple(column[index] if index < len(column) else None for column in columns)
+            for index, day in enumerate(days)
+        }
+
+        cell = self.cell(latitude, longitude)
+        now = time.monotonic()
+        cached = self._cells.setdefault(cell, {})
+        for day, values in records.items():
+            cached[day] = (values, now)
+        self._cells.move_to_end(cell)
+        self.days_fetched += len(records)
+
+        while len(self._cells) > self.max_cells:
+            self._cells.popitem(last=False)
+            self.evictions += 1
+        return records
+
+    @staticmethod
+    def assemble(records: Dict[str, tuple], days: List[str]) -> Dict[str, List]:
+        present = [day for day in days if day in records]
+        daily: Dict[str, List] = {"time": present}
+        for index, field in enumerate(WEATHER_DAILY_FIELDS):
+            daily[field] = [records[day][index] for day in present]
+        return daily
+
+    def stats(self) -> Dict:
+        requests = self.hits + self.partial_hits + self.misses
+        return {
+            "cells": len(self._cells),
+            "grid_degrees": self.grid_degrees,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "partial_hits": self.partial_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / requests, 4) if requests else 0.0,
+            "days_served_from_cache": self.days_served,
+            "days_fetched": self.days_fetched,
+            "evictions": self.evictions
+        }
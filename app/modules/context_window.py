@@ -0,0 +1,215 @@
+import math
+import re
+from typing import Dict, List, Optional, Protocol, Tuple
+
+from app.consts.context import (
+    CONTEXT_TOKEN_BUDGET,
+    CONTEXT_MODEL_TOKEN_BUDGETS,
+    CONTEXT_TOKENIZER_PATH,
+    CONTEXT_MESSAGE_OVERHEAD_TOKENS
+)
+from app.consts.roles import MessageRole
+
+
+class Tokenizer(Protocol):
+    name: str
+
+    def count(self, text: str) -> int:
+        ...
+
+
+class ApproximateTokenizer:
+    name = "approximate"
+
+    # Roughly four characters per BPE token for words, one token per symbol
+    CHARS_PER_TOKEN = 4
+    _PIECE_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+    def count(self, text: str) -> int:
+        tokens = 0
+        for piece in self._PIECE_PATTERN.findall(text or ""):
+            tokens += math.ceil(len(piece) / self.CHARS_PER_TOKEN)
+        return tokens
+
+
+class HuggingFaceTokenizer:
+    def __init__(self, path: str):
+        from tokenizers import Tokenizer as _Tokenizer
+
+        self._tokenizer = _Tokenizer.from_file(path)
+        self.name = f"tokenizers:{path}"
+
+    def count(self, text: str) -> int:
+        return len(self._tokenizer.encode(text or "", add_special_tokens=False).ids)
+
+
+def load_tokenizer(path: str = CONTEXT_TOKENIZER_PATH) -> Tokenizer:
+    if path:
+        try:
+            return HuggingFaceTokenizer(path)
+        except Exception as e:
+            print(f"Error loading tokenizer from '{path}', using the approximation: {str(e)}")
+    return ApproximateTokenizer()
+
+
+class ContextWindowManager:
+    _tokenizer: Optional[Tokenizer] = None
+    _stats: Dict[str, float] = {"turns": 0, "total_tokens": 0, "max_tokens": 0, "last_tokens": 0, "trimmed_turns": 0, "dropped_messages": 0}
+
+    def __init__(self, budget: int, tokenizer: Optional[Tokenizer] = None):
+        self.budget = budget
+        self.tokenizer = tokenizer or self.shared_tokenizer()
+
+    @classmethod
+    def for_model(cls, model: str) -> "ContextWindowManager":
+        budgets = cls._parse_budgets(CONTEXT_MODEL_TOKEN_BUDGETS)
+        return cls(budgets.get(model, CONTEXT_TOKEN_BUDGET))
+
+    @classmethod
+    def shared_tokenizer(cls) -> Tokenizer:
+        if cls._tokenizer is None:
+            cls._tokenizer = load_tokenizer()
+        return cls._tokenizer
+
+    def count_message(self, message: Dict[str, str]) -> int:
+        return self.tokenizer.count(message.get("content", "")) + CONTEXT_MESSAGE_OVERHEAD_TOKENS
+
+    def count(self, messages: List[Dict[str, str]]) -> int:
+        return sum(self.count_message(message) for message in messages)
+
+    def fit(self, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        sizes = [self.count_message(message) for message in messages]
+        pinned = self._pinned_indices(messages)
+
+        # Tool data and guidance for this turn are truncated only if the pinned messages alone exceed the budget
+        fitted = {index: message for index, message in enumerate(messages) if index in pinned}
+        used = sum(sizes[index] for index in pinned)
+        if used > self.budget:
+            used = self._truncate_latest_system(messages, pinned, sizes, fitted, used)
+
+        conversation, older_system = self._fill_candidates(messages, pinned)
+        for index in conversation:
+            # Turns are kept contiguous: once one does not fit, older ones are dropped too
+            if used + sizes[index] > self.budget:
+                break
+            fitted[index] = messages[index]
+            used += sizes[index]
+        for index in older_system:
+            if used + sizes[index] <= self.budget:
+                fitted[index] = messages[index]
+                used += sizes[index]
+
+        result = [fitted[index] for index in sorted(fitted)]
+        self._record(used, len(messages) - len(result))
+        return result
+
+    def _pinned_indices(self, messages: List[Dict[str, str]]) -> set:
+        pinned = set()
+        # The system prompt and anything directly after it (the conversation summary)
+        index = 0
+        while index < len(messages) and messages[index].get("role") == MessageRole.SYSTEM.value:
+            pinned.add(index)
+            index += 1
+
+        last_user = self._last_index(messages, MessageRole.USER.value)
+        if last_user is not None:
+            pinned.add(last_user)
+
+        # System messages of the current turn: injected tool data and response guidance
+        turn_start = self._last_index(messages, MessageRole.ASSISTANT.value)
+        turn_start = 0 if turn_start is None else turn_start + 1
+        for index in range(max(turn_start, 1), len(messages)):
+            if messages[index].get("role") == MessageRole.SYSTEM.value:
+                pinned.add(index)
+        return pinned
+
+    def _fill_candidates(self, messages: List[Dict[str, str]], pinned: set) -> Tuple[List[int], List[int]]:
+        # Recent turns first (newest to oldest), then tool data left over from earlier turns
+        remaining = [index for index in range(len(messages) - 1, -1, -1) if index not in pinned]
+        conversation = [index for index in remaining if messages[index].get("role") != MessageRole.SYSTEM.value]
+        older_system = [index for index in remaining if messages[index].get("role") == MessageRole.SYSTEM.value]
+        return conversation, older_system
+
+    def _truncate_latest_system(
+        self,
+        messages: List[Dict[str, str]],
+        pinned: set,
+        sizes: List[int],
+        fitted: Dict[int, Dict[str, str]],
+        used: int
+    ) -> int:
+        excess = used - self.budget
+        candidates = sorted(
+            (index for index in pinned if index != 0 and messages[index].get("role") == MessageRole.SYSTEM.value),
+            key=lambda index: sizes[index],
+            reverse=True
+        )
+        for index in candidates:
+            if excess <= 0:
+                break
+            truncated = self._truncate(messages[index], sizes[index] - excess)
+            new_size = self.count_message(truncated) if truncated else 0
+            if truncated:
+                fitted[index] = truncated
+            else:
+                del fitted[index]
+            excess -= sizes[index] - new_size
+            used -= sizes[index] - new_size
+        return used
+
+    def _truncate(self, message: Dict[str, str], max_tokens: int) -> Optional[Dict[str, str]]:
+        content = message.get("content", "")
+        content_tokens = max(1, self.tokenizer.count(content))
+        keep_chars = int(len(content) * (max_tokens - CONTEXT_MESSAGE_OVERHEAD_TOKENS) / content_tokens)
+        while keep_chars > 0:
+            truncated = {**message, "content": content[:keep_chars]}
+            if self.count_message(truncated) <= max_tokens:
+                return truncated
+            keep_chars = int(keep_chars * 0.9)
+        return None
+
+    def _record(self, tokens: int, dropped: int):
+        stats = ContextWindowManager._stats
+        stats["turns"] += 1
+        stats["total_tokens"] += tokens
+        stats["max_tokens"] = max(stats["max_tokens"], tokens)
+        stats["last_tokens"] = tokens
+        if dropped:
+            stats["trimmed_turns"] += 1
+            stats["dropped_messages"] += dropped
+
+    @staticmethod
+    def _last_index(messages: List[Dict[str, str]], role: str) -> Optional[int]:
+        for index in range(len(messages) - 1, -1, -1):
+            if messages[index].get("role") == role:
+                return index
+        return None
+
+    @staticmethod
+    def _parse_budgets(raw: str) -> Dict[str, int]:
+        budgets = {}
+        for entry in raw.split(","):
+            model, sep, value = entry.strip().rpartition("=")
+            if not sep or not model:
+                continue
+            try:
+                budgets[model.strip()] = max(1, int(value))
+            except ValueError:
+                print(f"Ignoring invalid context token budget: '{entry}'")
+        return budgets
+
+    @classmethod
+    def stats(cls) -> Dict:
+        stats = cls._stats
+        turns = int(stats["turns"])
+        return {
+            "tokenizer": cls.shared_tokenizer().name,
+            "default_budget": CONTEXT_TOKEN_BUDGET,
+            "model_budgets": cls._parse_budgets(CONTEXT_MODEL_TOKEN_BUDGETS),
+            "turns": turns,
+            "last_prompt_tokens": int(stats["last_tokens"]),
+            "avg_prompt_tokens": round(stats["total_tokens"] / turns, 1) if turns else 0.0,
+            "max_prompt_tokens": int(stats["max_tokens"]),
+            "trimmed_turns": int(stats["trimmed_turns"]),
+            "dropped_messages": int(stats["dropped_messages"])
+        }
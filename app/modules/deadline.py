@@ -0,0 +1,131 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from app.consts.deadline import (
+    TURN_DEADLINE_ENABLED,
+    TURN_DEADLINE_SECONDS,
+    DEADLINE_GENERATION_RESERVE,
+    DEADLINE_GENERATION_TOKENS_PER_SECOND,
+    DEADLINE_MIN_NUM_PREDICT
+)
+
+
+class DeadlineExceededError(asyncio.TimeoutError):
+    pass
+
+
+class Deadline:
+    # The active turn's deadline; asyncio tasks started during the turn inherit it
+    _current: ContextVar[Optional["Deadline"]] = ContextVar("turn_deadline", default=None)
+
+    _stats: Dict[str, int] = {
+        "turns": 0,
+        "exceeded": 0,
+        "extraction_cut": 0,
+        "research_skipped": 0,
+        "research_direct": 0,
+        "research_cut": 0,
+        "cache_fallbacks": 0,
+        "http_rejected": 0,
+        "generation_shrunk": 0
+    }
+
+    def __init__(self, budget: float):
+        self.budget = budget
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + budget
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    @classmethod
+    def for_request(cls, header_value: Optional[str] = None) -> Optional["Deadline"]:
+        if not TURN_DEADLINE_ENABLED:
+            return None
+
+        budget = TURN_DEADLINE_SECONDS
+        if header_value:
+            try:
+                budget = min(budget, max(0.0, float(header_value) / 1000))
+            except ValueError:
+                print(f"Ignoring invalid deadline header value '{header_value}'")
+        return cls(budget)
+
+    @classmethod
+    def current(cls) -> Optional["Deadline"]:
+        return cls._current.get()
+
+    @classmethod
+    @contextmanager
+    def activate(cls, deadline: Optional["Deadline"]) -> Iterator[Optional["Deadline"]]:
+        if deadline is None:
+            yield None
+            return
+
+        cls._stats["turns"] += 1
+        token = cls._current.set(deadline)
+        try:
+            yield deadline
+        finally:
+            if deadline.expired():
+                cls._stats["exceeded"] += 1
+            try:
+                cls._current.reset(token)
+            except ValueError:
+                # A streaming response can finish in another context than it started in
+                cls._current.set(None)
+
+    @classmethod
+    def detach(cls):
+        # Background work started during a turn must not inherit the turn's budget
+        cls._current.set(None)
+
+    @classmethod
+    def stage_budget(cls, reserve: float = DEADLINE_GENERATION_RESERVE) -> Optional[float]:
+        deadline = cls.current()
+        if deadline is None:
+            return None
+        return max(0.0, deadline.remaining() - reserve)
+
+    @classmethod
+    def bound(cls, timeout: float) -> float:
+        deadline = cls.current()
+        if deadline is None:
+            return timeout
+
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            cls._stats["http_rejected"] += 1
+            raise DeadlineExceededError("Turn deadline exceeded")
+        return min(timeout, remaining)
+
+    @classmethod
+    def num_predict(cls, num_predict: int) -> int:
+        deadline = cls.current()
+        if deadline is None:
+            return num_predict
+
+        affordable = int(deadline.remaining() * DEADLINE_GENERATION_TOKENS_PER_SECOND)
+        if affordable >= num_predict:
+            return num_predict
+        cls._stats["generation_shrunk"] += 1
+        return max(min(DEADLINE_MIN_NUM_PREDICT, num_predict), affordable)
+
+    @classmethod
+    def record(cls, event: str):
+        cls._stats[event] += 1
+
+    @classmethod
+    def stats(cls) -> Dict:
+        return {
+            "enabled": TURN_DEADLINE_ENABLED,
+            "budget_seconds": TURN_DEADLINE_SECONDS,
+            "generation_reserve_seconds": DEADLINE_GENERATION_RESERVE,
+            **cls._stats
+        }
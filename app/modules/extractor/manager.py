@@ -1,35 +1,94 @@
 import asyncio
-import os
+import time
+from typing import Callable, Dict, Optional
 
 from app.modules.clients.ollama import OllamaClient
+from app.modules.deadline import Deadline
 from app.algo.extractor.date import DateExtractor
 from app.algo.extractor.location import LocationExtractor
 from app.algo.extractor.intent import IntentExtractor
+from app.algo.extractor.fused import FusedExtractor
 from app.models.extraction_result import ExtractionResult
+from app.consts.intents import NON_VALID_INTENT
+from app.consts.extraction import EXTRACTION_MODE, EXTRACTION_MODES, FANOUT_EXTRACTION_MODE, FUSED_EXTRACTION_MODE
 
 
 class ExtractorManager:
-    def __init__(self, llm_client: OllamaClient):
+    _stats: Dict[str, Dict[str, float]] = {
+        mode: {"calls": 0, "total_ms": 0.0, "fallbacks": 0} for mode in EXTRACTION_MODES
+    }
+    _early_exits: Dict[str, int] = {"turns": 0, "cancelled_extractions": 0}
+    
+    def __init__(self, llm_client: OllamaClient, mode: Optional[str] = None):
         self.llm = llm_client
+        self.mode = mode or EXTRACTION_MODE
+        if self.mode not in EXTRACTION_MODES:
+            print(f"Unknown extraction mode '{self.mode}', using '{FANOUT_EXTRACTION_MODE}'")
+            self.mode = FANOUT_EXTRACTION_MODE
+    
+    async def extract(self, message: str, on_location: Optional[Callable[[str], None]] = None) -> ExtractionResult:
+        started = time.perf_counter()
+        
+        if self.mode == FUSED_EXTRACTION_MODE:
+            try:
+                result = await asyncio.wait_for(FusedExtractor(self.llm).extract(message), Deadline.stage_budget())
+            except asyncio.TimeoutError:
+                # Out of budget: answer without extracted details rather than not at all
+                Deadline.record("extraction_cut")
+                result = ExtractionResult()
+            if result is None:
+                # An unusable fused response falls back to the dedicated extractors
+                ExtractorManager._stats[FUSED_EXTRACTION_MODE]["fallbacks"] += 1
+                result = await self._extract_fanout(message, on_location)
+            elif result.location and on_location:
+                on_location(result.location)
+        else:
+            result = await self._extract_fanout(message, on_location)
+        
+        stats = ExtractorManager._stats[self.mode]
+        stats["calls"] += 1
+        stats["total_ms"] += (time.perf_counter() - started) * 1000
+        
+        return result
     
-    async def extract(self, message: str) -> ExtractionResult:
+    async def _extract_fanout(self, message: str, on_location: Optional[Callable[[str], None]] = None) -> ExtractionResult:
         intent_extractor = IntentExtractor(self.llm)
         location_extractor = LocationExtractor(self.llm)
         date_extractor = DateExtractor(self.llm)
         
-        tasks = [
-            ('intent', intent_extractor.extract(message)),
-            ('location', location_extractor.extract(message)),
-            ('date', date_extractor.extract(message))
-        ]
+        tasks = {
+            'intent': asyncio.create_task(intent_extractor.extract(message)),
+            'location': asyncio.create_task(self._extract_location(location_extractor, message, on_location)),
+            'date': asyncio.create_task(date_extractor.extract(message))
+        }
         
-        results = await asyncio.gather(*[task[1] for task in tasks], return_exceptions=True)
+        pending = set(tasks.values())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=Deadline.stage_budget(), return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # The turn's budget ran out; keep whatever extractions already finished
+                    Deadline.record("extraction_cut")
+                    break
+                if tasks['intent'] in done and self._is_terminal_intent(tasks['intent']):
+                    break
+        finally:
+            # A terminal intent makes the other extractions useless; cancelling them aborts their generations
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if pending:
+            ExtractorManager._early_exits["turns"] += 1
+            ExtractorManager._early_exits["cancelled_extractions"] += len(pending)
         
         result_data = {}
-        for (task_type, _), result in zip(tasks, results):
-            if isinstance(result, Exception):
+        for task_type, task in tasks.items():
+            if task.cancelled() or task.exception() is not None:
                 continue
             
+            result = task.result()
             if result:
                 result_data[task_type] = result
         
@@ -38,4 +97,36 @@ class ExtractorManager:
             location=result_data.get('location'),
             date=result_data.get('date')
         )
-
+    
+    @staticmethod
+    def _is_terminal_intent(task: asyncio.Task) -> bool:
+        if task.cancelled() or task.exception() is not None:
+            return False
+        return task.result() in NON_VALID_INTENT
+    
+    async def _extract_location(
+        self,
+        location_extractor: LocationExtractor,
+        message: str,
+        on_location: Optional[Callable[[str], None]]
+    ) -> Optional[str]:
+        location = await location_extractor.extract(message)
+        # Notify as soon as the location is known, while intent and date may still be running
+        if location and on_location:
+            on_location(location)
+        return location
+    
+    @classmethod
+    def stats(cls) -> Dict:
+        return {
+            "mode": EXTRACTION_MODE,
+            "modes": {
+                mode: {
+                    "calls": int(stats["calls"]),
+                    "fallbacks": int(stats["fallbacks"]),
+                    "avg_latency_ms": round(stats["total_ms"] / stats["calls"], 2) if stats["calls"] else 0.0
+                }
+                for mode, stats in cls._stats.items()
+            },
+            "early_exit": dict(cls._early_exits)
+        }
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, AsyncIterator
 
 from app.algo.processor.user_violation import UserViolationProcessor
 from app.models.extraction_result import ExtractionResult
@@ -7,7 +7,7 @@ from app.algo.processor.response import LLMResponseGenerator
 from app.prompts.builder.prompts import render_template
 from app.consts.roles import MessageRole
 from app.consts.intents import VALID_INTENTS
-from app.consts.context import MAX_CONTEXT_MESSAGES
+from app.modules.context_window import ContextWindowManager
 
 
 class ResponseGenerator:
@@ -26,17 +26,24 @@ class ResponseGenerator:
         response_processor = LLMResponseGenerator(self.llm_client)
         return await response_processor.generate(formatted_messages)
     
+    async def generate_response_stream(self) -> AsyncIterator[str]:
+        user_violation_response = await self._check_user_violation()
+        if user_violation_response:
+            yield user_violation_response
+            return
+        
+        formatted_messages = self._format_messages_pipeline()
+        
+        response_processor = LLMResponseGenerator(self.llm_client)
+        async for token in response_processor.generate_stream(formatted_messages):
+            yield token
+    
     async def _check_user_violation(self) -> Optional[str]:
         location = self.extraction_result.location
         
         if location == 'fictional':
             violation_processor = UserViolationProcessor(self.llm_client)
-            violation_feedback = await violation_processor.generate_response(self.messages[-1].get('content', ''))
-            self.messages.append({
-                "role": MessageRole.ASSISTANT.value,
-                "content": violation_feedback
-            })
-            return violation_feedback
+            return await violation_processor.generate_response(self.messages[-1].get('content', ''))
         
         return None
     
@@ -67,44 +74,6 @@ class ResponseGenerator:
         self,
         messages: List[Dict[str, str]]
     ) -> List[Dict[str, str]]:
-        total_count = len(messages)
-        
-        if total_count <= MAX_CONTEXT_MESSAGES:
-            return messages
-        
-        partitioned = self._partition_by_role(messages)
-        system_context = partitioned['system']
-        conversation_messages = partitioned['conversation']
-        
-        system_count = len(system_context)
-        available_slots = MAX_CONTEXT_MESSAGES - system_count
-        
-        if available_slots > 0:
-            trimmed_conversation = conversation_messages[-available_slots:]
-            return system_context + trimmed_conversation
-        
-        primary_system = system_context[0] if system_context else None
-        recent_conversation = conversation_messages[-(MAX_CONTEXT_MESSAGES - 1):]
-        
-        if primary_system:
-            return [primary_system] + recent_conversation
-        
-        return recent_conversation[-MAX_CONTEXT_MESSAGES:]
-    
-    def _partition_by_role(
-        self,
-        messages: List[Dict[str, str]]
-    ) -> Dict[str, List[Dict[str, str]]]:
-        system = []
-        conversation = []
-        
-        for msg in messages:
-            role = msg.get('role', '')
-            if role == MessageRole.SYSTEM.value:
-                system.append(msg)
-            else:
-                conversation.append(msg)
-        
-        return {'system': system, 'conversation': conversation}
+        context_window = ContextWindowManager.for_model(self.llm_client.model)
+        return context_window.fit(messages)
     
-
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import time
+from typing import Coroutine, Dict, List, Optional, Set, Tuple
+
+from app.modules.clients.ollama import OllamaClient
+from app.models.conversation_summary import ConversationSummary
+from app.prompts.builder.prompts import render_template
+from app.consts.priority import RequestPriority
+from app.consts.roles import MessageRole
+from app.consts.context import SUMMARY_ENABLED, SUMMARY_TAIL_MESSAGES, SUMMARY_MIN_FOLD_MESSAGES
+
+
+class ConversationSummarizer:
+    DIALOG_ROLES = [MessageRole.USER.value, MessageRole.ASSISTANT.value]
+
+    _stats: Dict[str, float] = {"folds": 0, "folded_messages": 0, "failures": 0, "total_ms": 0.0}
+
+    def __init__(
+        self,
+        llm_client: OllamaClient,
+        tail_messages: int = SUMMARY_TAIL_MESSAGES,
+        min_fold_messages: int = SUMMARY_MIN_FOLD_MESSAGES
+    ):
+        self.llm = llm_client
+        self.tail_messages = tail_messages
+        self.min_fold_messages = min_fold_messages
+        self._tasks: Set[asyncio.Task] = set()
+
+    def fold_range(self, messages: List[Dict[str, str]], summarized_until: int) -> Optional[Tuple[int, int]]:
+        start = max(1, summarized_until)
+        end = self._tail_start(messages)
+        if end is None or end <= start:
+            return None
+
+        dialog = [message for message in messages[start:end] if message.get("role") in self.DIALOG_ROLES]
+        if len(dialog) < self.min_fold_messages:
+            return None
+        return start, end
+
+    async def summarize(
+        self,
+        summary: Optional[ConversationSummary],
+        messages: List[Dict[str, str]]
+    ) -> Optional[ConversationSummary]:
+        turns = [message for message in messages if message.get("role") in self.DIALOG_ROLES]
+        prompt = self.build_prompt(summary, turns)
+
+        started = time.perf_counter()
+        try:
+            response = await self.llm.chat(
+                [{"role": MessageRole.USER.value, "content": prompt}],
+                temperature=0.0,
+                num_predict=250,
+                format="json",
+                priority=RequestPriority.BACKGROUND
+            )
+            data = json.loads(response.get("content", ""))
+            if not isinstance(data, dict):
+                raise ValueError("summary is not a JSON object")
+        except Exception as e:
+            ConversationSummarizer._stats["failures"] += 1
+            print(f"Conversation summarization error: {str(e)}")
+            return None
+
+        stats = ConversationSummarizer._stats
+        stats["folds"] += 1
+        stats["folded_messages"] += len(turns)
+        stats["total_ms"] += (time.perf_counter() - started) * 1000
+        return ConversationSummary.from_dict(data)
+
+    @classmethod
+    def build_prompt(cls, summary: Optional[ConversationSummary], messages: List[Dict[str, str]]) -> str:
+        # Injected tool data is left out; the summary keeps what the user said and was told.
+        # Roles are stored as MessageRole members, whose str() is "MessageRole.USER", so the value is used
+        turns = [
+            {"role": getattr(message.get("role"), "value", message.get("role")), "content": message.get("content", "")}
+            for message in messages if message.get("role") in cls.DIALOG_ROLES
+        ]
+        current = json.dumps((summary or ConversationSummary()).to_dict(), indent=2)
+        return render_template("conversation_summary.j2", summary=current, turns=turns)
+
+    @classmethod
+    def check_prompt(cls) -> bool:
+        # Startup check that turns reach the summarizer model labelled "USER:" / "ASSISTANT:"
+        prompt = cls.build_prompt(None, [
+            {"role": MessageRole.USER, "content": "Rome in May"},
+            {"role": MessageRole.ASSISTANT, "content": "Sounds great"}
+        ])
+        valid = "USER: Rome in May" in prompt and "ASSISTANT: Sounds great" in prompt
+        if not valid:
+            print("Conversation summary prompt does not label turns as USER:/ASSISTANT:")
+        return valid
+
+    def run_in_background(self, coroutine: Coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _tail_start(self, messages: List[Dict[str, str]]) -> Optional[int]:
+        count = 0
+        for index in range(len(messages) - 1, 0, -1):
+            if messages[index].get("role") not in self.DIALOG_ROLES:
+                continue
+            count += 1
+            if count == self.tail_messages:
+                # Keep the tool data injected right before the first tail turn with it
+                while index > 1 and messages[index - 1].get("role") == MessageRole.SYSTEM.value:
+                    index -= 1
+                return index
+        return None
+
+    def stats(self) -> Dict:
+        stats = ConversationSummarizer._stats
+        folds = int(stats["folds"])
+        return {
+            "enabled": SUMMARY_ENABLED,
+            "tail_messages": self.tail_messages,
+            "folds": folds,
+            "folded_messages": int(stats["folded_messages"]),
+            "failures": int(stats["failures"]),
+            "in_progress": len(self._tasks),
+            "avg_latency_ms": round(stats["total_ms"] / folds, 2) if folds else 0.0
+        }
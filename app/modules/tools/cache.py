@@ -0,0 +1,152 @@
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from app.consts.research import TOOL_CACHE_TTLS, TOOL_CACHE_STALE_TTLS, TOOL_CACHE_MAX_ENTRIES
+from app.consts.deadline import DEADLINE_CACHE_FALLBACK_SECONDS
+from app.modules.deadline import Deadline
+
+ToolCall = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class ToolResultCache:
+    _shared: Optional["ToolResultCache"] = None
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = TOOL_CACHE_MAX_ENTRIES
+    ):
+        self.ttls = ttls if ttls is not None else self._parse_policies(TOOL_CACHE_TTLS)
+        self.stale_ttls = stale_ttls if stale_ttls is not None else self._parse_policies(TOOL_CACHE_STALE_TTLS)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def shared(cls) -> "ToolResultCache":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    async def get(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        fetch: ToolCall,
+        refresh: ToolCall
+    ) -> Optional[Dict[str, Any]]:
+        ttl = self.ttls.get(tool_name)
+        if not ttl:
+            return await fetch()
+
+        stats = self._stats.setdefault(tool_name, {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_failures": 0})
+        key = (tool_name, self.normalize(arguments))
+        entry = self._entries.get(key)
+        if entry is not None:
+            result, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < ttl:
+                stats["hits"] += 1
+                self._entries.move_to_end(key)
+                return copy.deepcopy(result)
+            if age < ttl + self.stale_ttls.get(tool_name, 0) or self._out_of_budget():
+                # Answer with the stale result now; the refreshed one is there for the next caller
+                stats["stale_hits"] += 1
+                self._entries.move_to_end(key)
+                self._revalidate(key, tool_name, refresh)
+                return copy.deepcopy(result)
+
+        stats["misses"] += 1
+        result = await fetch()
+        self._store(key, result)
+        return copy.deepcopy(result)
+
+    @staticmethod
+    def _out_of_budget() -> bool:
+        # Close to the turn deadline, an expired result is better than a lookup that may not finish
+        budget = Deadline.stage_budget()
+        if budget is None or budget >= DEADLINE_CACHE_FALLBACK_SECONDS:
+            return False
+        Deadline.record("cache_fallbacks")
+        return True
+
+    def _revalidate(self, key: Hashable, tool_name: str, refresh: ToolCall):
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, tool_name, refresh))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: Hashable, tool_name: str, refresh: ToolCall):
+        Deadline.detach()
+        stats = self._stats[tool_name]
+        try:
+            result = await refresh()
+            if result:
+                stats["refreshes"] += 1
+                self._store(key, result)
+            else:
+                stats["refresh_failures"] += 1
+        except Exception as e:
+            stats["refresh_failures"] += 1
+            print(f"Error refreshing cached {tool_name} result: {str(e)}")
+        finally:
+            self._refreshing.discard(key)
+
+    def _store(self, key: Hashable, result: Optional[Dict[str, Any]]):
+        # Failed lookups are not cached, so the next call retries upstream
+        if not result:
+            return
+        self._entries[key] = (copy.deepcopy(result), time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @classmethod
+    def normalize(cls, value: Any) -> Hashable:
+        # " Paris ", "paris" and "PARIS" share one entry
+        if isinstance(value, str):
+            return " ".join(value.split()).lower()
+        if isinstance(value, dict):
+            return tuple(sorted((str(name), cls.normalize(item)) for name, item in value.items() if item is not None))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.normalize(item) for item in value)
+        return value
+
+    @staticmethod
+    def _parse_policies(value: str) -> Dict[str, float]:
+        policies = {}
+        for item in value.split(","):
+            tool_name, _, seconds = item.strip().partition("=")
+            if tool_name and seconds:
+                policies[tool_name.strip()] = float(seconds)
+        return policies
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> Dict:
+        tools = {}
+        for tool_name, stats in self._stats.items():
+            calls = stats["hits"] + stats["stale_hits"] + stats["misses"]
+            tools[tool_name] = {
+                **stats,
+                "ttl_seconds": self.ttls.get(tool_name),
+                "hit_rate": round((stats["hits"] + stats["stale_hits"]) / calls, 4) if calls else 0.0
+            }
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "refreshing": len(self._refreshing),
+            "tools": tools
+        }
@@ -139,6 +139,7 @@ class FunctionCaller:
         
         formatters = {
             "weather": lambda: f"Weather data for {data.get('location', 'location')}: {json.dumps(data, indent=2)}",
+            "weather_comparison": lambda: f"Weather data for {len(data)} locations: {json.dumps(data, indent=2)}",
             "country": lambda: f"Country information: {json.dumps(data, indent=2)}",
             "visa": lambda: f"Visa information: {json.dumps(data, indent=2)}"
         }
@@ -1,11 +1,15 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
-from app.algo.tools import fetch_weather_for_location, fetch_country_info, fetch_visa_info
+from app.algo.tools import fetch_weather_for_location, fetch_weather_for_locations, fetch_country_info, fetch_visa_info
+from app.modules.tools.speculation import SpeculativePrefetch
+from app.modules.tools.cache import ToolResultCache
+from app.consts.research import TOOL_CACHE_ENABLED
 
 
 class ToolRegistry:    
-    def __init__(self):
+    def __init__(self, prefetch: Optional[SpeculativePrefetch] = None):
+        self.prefetch = prefetch
         self.tools: Dict[str, Dict[str, Any]] = {}
         self._register_tools()
     
@@ -35,6 +39,31 @@ class ToolRegistry:
                 },
                 "function": self._fetch_weather_wrapper
             },
+            "compare_weather": {
+                "description": "Get weather forecasts for several locations over the same date range in one call. Use this when the user compares destinations or asks which of a few places has better weather.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "locations": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "The city or location names to compare (e.g., ['Lisbon', 'Barcelona', 'Athens'])"
+                        },
+                        "start_date": {
+                            "type": "string",
+                            "description": "Start date in YYYY-MM-DD format.",
+                            "default": None
+                        },
+                        "end_date": {
+                            "type": "string",
+                            "description": "End date in YYYY-MM-DD format.",
+                            "default": None
+                        }
+                    },
+                    "required": ["locations"]
+                },
+                "function": self._compare_weather_wrapper
+            },
             "fetch_country_info": {
                 "description": "Get detailed information about a country including culture, currency, language, and travel tips. Use this when the user asks about destinations, attractions, or general country information.",
                 "parameters": {
@@ -75,15 +104,30 @@ class ToolRegistry:
         if not end_date:
             end_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
         
-        result = await fetch_weather_for_location(location, start_date, end_date)
+        result = await fetch_weather_for_location(location, start_date, end_date, self.prefetch)
                 
         return {
             "type": "weather",
             "data": result
         } if result else None
     
+    async def _compare_weather_wrapper(self, locations: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
+        if not start_date:
+            start_date = datetime.now().strftime('%Y-%m-%d')
+        if not end_date:
+            end_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
+        
+        if isinstance(locations, str):
+            locations = [location.strip() for location in locations.split(",")]
+        result = await fetch_weather_for_locations(locations, start_date, end_date, self.prefetch)
+        
+        return {
+            "type": "weather_comparison",
+            "data": result
+        } if result else None
+    
     async def _fetch_country_info_wrapper(self, country_name: str) -> Dict[str, Any]:
-        result = await fetch_country_info(country_name)
+        result = await fetch_country_info(country_name, self.prefetch)
         return {
             "type": "country",
             "data": result
@@ -113,6 +157,18 @@ class ToolRegistry:
         if tool_name not in self.tools:
             return None
         
+        if not TOOL_CACHE_ENABLED:
+            return await self._run_tool(tool_name, arguments)
+        
+        # Background refreshes run on a registry of their own, detached from this turn's prefetch
+        return await ToolResultCache.shared().get(
+            tool_name,
+            arguments,
+            fetch=lambda: self._run_tool(tool_name, arguments),
+            refresh=lambda: ToolRegistry()._run_tool(tool_name, arguments)
+        )
+    
+    async def _run_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         tool = self.tools[tool_name]
         try:
             result = await tool["function"](**arguments)
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Dict, Optional, Set
+
+from app.consts.research import SPECULATIVE_PREFETCH_ENABLED
+from app.modules.clients.country import CountryAPI
+from app.modules.clients.geocoding import Coordinates, GeocodingClient
+
+
+class SpeculativePrefetch:
+    COORDINATES = "coordinates"
+    COUNTRY = "country"
+
+    _stats: Dict[str, Dict[str, int]] = {
+        kind: {"started": 0, "used": 0, "wasted": 0} for kind in (COORDINATES, COUNTRY)
+    }
+
+    def __init__(self):
+        self.location: Optional[str] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._used: Set[str] = set()
+        self._finished = False
+
+    def start(self, location: str):
+        if self._tasks or not location or location == 'fictional':
+            return
+
+        self.location = self._normalize(location)
+        self._tasks[self.COORDINATES] = asyncio.create_task(GeocodingClient.get_coordinates(location))
+        self._tasks[self.COUNTRY] = asyncio.create_task(CountryAPI.get_country_info(location))
+        for kind in self._tasks:
+            SpeculativePrefetch._stats[kind]["started"] += 1
+
+    async def get_coordinates(self, location: str) -> Optional[Coordinates]:
+        task = self._tasks.get(self.COORDINATES)
+        if task is not None and self._normalize(location) == self.location:
+            self._used.add(self.COORDINATES)
+            return await task
+        return await GeocodingClient.get_coordinates(location)
+
+    async def get_country_info(self, country_name: str) -> Optional[Dict]:
+        task = self._tasks.get(self.COUNTRY)
+        if task is not None and self._normalize(country_name) in (self.location, self._speculated_country(task)):
+            self._used.add(self.COUNTRY)
+            return await task
+        return await CountryAPI.get_country_info(country_name)
+
+    def finish(self):
+        if self._finished:
+            return
+        self._finished = True
+
+        for kind, task in self._tasks.items():
+            if kind in self._used:
+                SpeculativePrefetch._stats[kind]["used"] += 1
+                continue
+            SpeculativePrefetch._stats[kind]["wasted"] += 1
+            if not task.done():
+                task.cancel()
+
+    def _speculated_country(self, task: asyncio.Task) -> Optional[str]:
+        # The agent often asks for the country ("France") of the extracted location ("Paris")
+        if not task.done() or task.cancelled() or task.exception() is not None:
+            return None
+        country_data = task.result()
+        return self._normalize(country_data.get("name", "")) if country_data else None
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        return (name or "").strip().lower()
+
+    @classmethod
+    def stats(cls) -> Dict:
+        result = {"enabled": SPECULATIVE_PREFETCH_ENABLED}
+        for kind, stats in cls._stats.items():
+            settled = stats["used"] + stats["wasted"]
+            result[kind] = {
+                **stats,
+                "wasted_rate": round(stats["wasted"] / settled, 4) if settled else 0.0
+            }
+        return result
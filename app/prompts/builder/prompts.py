@@ -1,19 +1,9 @@
-import os
-from jinja2 import Environment, FileSystemLoader
 from app.consts.roles import MessageRole
-
-
-def _get_jinja_env():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    prompts_dir = os.path.dirname(current_dir)
-    
-    return Environment(loader=FileSystemLoader(prompts_dir))
+from app.prompts.builder.registry import TemplateRegistry
 
 
 def render_template(template_name: str, **kwargs) -> str:
-    env = _get_jinja_env()
-    template = env.get_template(template_name)
-    return template.render(**kwargs)
+    return TemplateRegistry.shared().render(template_name, **kwargs)
 
 
 def build_system_message() -> dict:
@@ -0,0 +1,151 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+
+from jinja2 import Environment, FileSystemLoader, Template, meta, nodes
+
+from app.consts.prompts import PROMPT_TEMPLATES_HOT_RELOAD
+
+PROMPTS_DIR = Path(__file__).parent.parent
+
+
+@dataclass
+class CompiledPrompt:
+    name: str
+    path: Path
+    mtime: float
+    size: int
+    variables: Set[str]
+    template: Template
+    # Literal text and variable names in order, when the template is nothing but plain {{ name }} outputs
+    segments: Optional[List[Union[str, nodes.Name]]] = None
+
+    @property
+    def is_static(self) -> bool:
+        return self.segments is not None and not self.variables
+
+    def render(self, **kwargs) -> str:
+        if self.segments is None:
+            return self.template.render(**kwargs)
+        return "".join(
+            segment if isinstance(segment, str) else str(kwargs.get(segment.name, ""))
+            for segment in self.segments
+        )
+
+
+class TemplateRegistry:
+    _shared: Optional["TemplateRegistry"] = None
+
+    _stats: Dict[str, int] = {"renders": 0, "fast_renders": 0, "jinja_renders": 0, "compiles": 0, "reloads": 0}
+
+    def __init__(self, directory: Path = PROMPTS_DIR, hot_reload: bool = PROMPT_TEMPLATES_HOT_RELOAD):
+        self.directory = Path(directory)
+        self.hot_reload = hot_reload
+        self.env = Environment(loader=FileSystemLoader(str(self.directory)), auto_reload=False)
+        self._templates: Dict[str, CompiledPrompt] = {}
+
+    def load_all(self) -> List[str]:
+        for path in sorted(self.directory.glob("*.j2")):
+            if path.name not in self._templates:
+                self._compile(path.name)
+        return list(self._templates)
+
+    def get(self, name: str) -> CompiledPrompt:
+        prompt = self._templates.get(name)
+        if prompt is None:
+            return self._compile(name)
+
+        if self.hot_reload and os.stat(prompt.path).st_mtime != prompt.mtime:
+            TemplateRegistry._stats["reloads"] += 1
+            print(f"Prompt template '{name}' changed on disk, recompiling")
+            return self._compile(name)
+        return prompt
+
+    def render(self, template_name: str, **kwargs) -> str:
+        prompt = self.get(template_name)
+        stats = TemplateRegistry._stats
+        stats["renders"] += 1
+        if prompt.segments is not None:
+            stats["fast_renders"] += 1
+        else:
+            stats["jinja_renders"] += 1
+        return prompt.render(**kwargs)
+
+    def _compile(self, name: str) -> CompiledPrompt:
+        path = self.directory / name
+        if not path.is_file():
+            # Let Jinja raise its usual TemplateNotFound
+            self.env.get_template(name)
+
+        mtime = os.stat(path).st_mtime
+        source = path.read_text(encoding="utf-8")
+        ast = self.env.parse(source, name, str(path))
+        template = Template.from_code(self.env, self.env.compile(ast, name, str(path)), self.env.make_globals(None))
+
+        prompt = CompiledPrompt(
+            name=name,
+            path=path,
+            mtime=mtime,
+            size=len(source.encode("utf-8")),
+            variables=meta.find_undeclared_variables(ast),
+            template=template,
+            segments=self._plain_segments(ast)
+        )
+        if prompt.is_static:
+            prompt.segments = [template.render()]
+
+        self._templates[name] = prompt
+        TemplateRegistry._stats["compiles"] += 1
+        return prompt
+
+    @staticmethod
+    def _plain_segments(ast: nodes.Template) -> Optional[List[Union[str, nodes.Name]]]:
+        # Templates without tags, filters or expressions are rendered by joining strings instead of running Jinja
+        if not ast.body:
+            return []
+        if len(ast.body) != 1 or not isinstance(ast.body[0], nodes.Output):
+            return None
+
+        segments: List[Union[str, nodes.Name]] = []
+        for node in ast.body[0].nodes:
+            if isinstance(node, nodes.TemplateData):
+                segments.append(node.data)
+            elif isinstance(node, nodes.Name) and node.ctx == "load":
+                segments.append(node)
+            else:
+                return None
+        return segments
+
+    def report(self) -> List[Dict]:
+        return [
+            {
+                "template": prompt.name,
+                "bytes": prompt.size,
+                "variables": sorted(prompt.variables),
+                "mode": "static" if prompt.is_static else "substitution" if prompt.segments is not None else "jinja"
+            }
+            for prompt in self._templates.values()
+        ]
+
+    def print_report(self):
+        report = self.report()
+        print(f"Compiled {len(report)} prompt templates ({sum(entry['bytes'] for entry in report)} bytes)")
+        for entry in report:
+            variables = ", ".join(entry["variables"]) or "-"
+            print(f"  {entry['template']:<36} {entry['bytes']:>6} B  {entry['mode']:<12} {variables}")
+
+    def stats(self) -> Dict:
+        stats = TemplateRegistry._stats
+        return {
+            "templates": len(self._templates),
+            "hot_reload": self.hot_reload,
+            "total_bytes": sum(prompt.size for prompt in self._templates.values()),
+            **stats
+        }
+
+    @classmethod
+    def shared(cls) -> "TemplateRegistry":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
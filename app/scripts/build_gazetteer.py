@@ -0,0 +1,78 @@
+"""Build the offline gazetteer index from GeoNames-format city and country files.
+
+Usage:
+    python -m app.scripts.build_gazetteer [--cities cities15000.txt] [--countries countryInfo.txt] [--output app/data/gazetteer]
+
+The defaults use the small seed files in app/data/geonames. Any GeoNames dump
+(https://download.geonames.org/export/dump/) with the same columns can replace them.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+from app.algo.gazetteer import Gazetteer, normalize_place
+from app.consts.gazetteer import GAZETTEER_PATH, GAZETTEER_CITIES_SOURCE, GAZETTEER_COUNTRIES_SOURCE
+
+# GeoNames main table columns
+NAME, ASCII_NAME, ALTERNATE_NAMES, LATITUDE, LONGITUDE, COUNTRY_CODE, POPULATION = 1, 2, 3, 4, 5, 8, 14
+
+
+def load_countries(path: Path) -> Dict[str, str]:
+    countries = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        columns = line.split("\t")
+        countries[columns[0]] = columns[4]
+    return countries
+
+
+def load_places(path: Path, min_population: int, max_aliases: int) -> List[Dict]:
+    places = []
+    with path.open(encoding="utf-8") as source:
+        for line in source:
+            columns = line.rstrip("\n").split("\t")
+            if len(columns) <= POPULATION:
+                continue
+            population = int(columns[POPULATION] or 0)
+            if population < min_population:
+                continue
+
+            # Alternate names cover many scripts; only the ones that survive ASCII folding are searchable
+            aliases = [columns[ASCII_NAME]] + [
+                alias for alias in columns[ALTERNATE_NAMES].split(",") if normalize_place(alias)
+            ][:max_aliases]
+            places.append({
+                "name": columns[NAME],
+                "aliases": aliases,
+                "latitude": float(columns[LATITUDE]),
+                "longitude": float(columns[LONGITUDE]),
+                "country_code": columns[COUNTRY_CODE],
+                "population": population
+            })
+    return places
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cities", default=GAZETTEER_CITIES_SOURCE, help="GeoNames cities file")
+    parser.add_argument("--countries", default=GAZETTEER_COUNTRIES_SOURCE, help="GeoNames countryInfo file")
+    parser.add_argument("--output", default=GAZETTEER_PATH, help="Directory to write the index to")
+    parser.add_argument("--min-population", type=int, default=0, help="Skip places smaller than this")
+    parser.add_argument("--max-aliases", type=int, default=20, help="Alternate names kept per place")
+    args = parser.parse_args()
+
+    countries = load_countries(Path(args.countries))
+    places = load_places(Path(args.cities), args.min_population, args.max_aliases)
+
+    gazetteer = Gazetteer.build(places, countries)
+    output = Path(args.output)
+    gazetteer.save(output)
+
+    size = sum(path.stat().st_size for path in output.glob("*.npy"))
+    print(f"Saved gazetteer ({len(places)} places, {len(gazetteer.keys)} keys, {size} bytes) to {output}")
+
+
+if __name__ == "__main__":
+    main()
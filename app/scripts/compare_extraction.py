@@ -0,0 +1,69 @@
+"""Compare latency and agreement of the fan-out and fused extraction modes.
+
+Usage:
+    python -m app.scripts.compare_extraction [--message "..."] [--transcripts transcripts]
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from app.modules.clients.ollama import OllamaClient
+from app.modules.extractor.manager import ExtractorManager
+from app.consts.extraction import FANOUT_EXTRACTION_MODE, FUSED_EXTRACTION_MODE
+
+FIELDS = ["intent", "location", "date"]
+
+
+def load_user_messages(transcripts_dir: Path) -> List[str]:
+    messages = []
+    for transcript in sorted(transcripts_dir.glob("*.md")):
+        for line in transcript.read_text().splitlines():
+            if line.startswith("USER:"):
+                messages.append(line[len("USER:"):].strip())
+    return messages
+
+
+async def compare(messages: List[str]) -> Dict:
+    llm = OllamaClient()
+    # Measure the model, not the response cache
+    llm.cache = None
+    
+    latencies = {FANOUT_EXTRACTION_MODE: [], FUSED_EXTRACTION_MODE: []}
+    agreement = {field: 0 for field in FIELDS}
+    
+    for message in messages:
+        results = {}
+        for mode in latencies:
+            started = time.perf_counter()
+            results[mode] = await ExtractorManager(llm, mode=mode).extract(message)
+            latencies[mode].append((time.perf_counter() - started) * 1000)
+        
+        fanout, fused = results[FANOUT_EXTRACTION_MODE], results[FUSED_EXTRACTION_MODE]
+        for field in FIELDS:
+            if fanout.get(field) == fused.get(field):
+                agreement[field] += 1
+        print(f"{message[:60]!r}\n  fanout: {fanout.to_dict()}\n  fused:  {fused.to_dict()}")
+    
+    return {
+        "messages": len(messages),
+        "avg_latency_ms": {mode: round(sum(values) / len(values), 1) for mode, values in latencies.items() if values},
+        "agreement": {field: f"{count}/{len(messages)}" for field, count in agreement.items()}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--message", action="append", help="Message to extract from (repeatable)")
+    parser.add_argument("--transcripts", default="transcripts", help="Directory of transcript files")
+    args = parser.parse_args()
+    
+    messages = args.message or load_user_messages(Path(args.transcripts))
+    summary = asyncio.run(compare(messages))
+    print(summary)
+
+
+if __name__ == "__main__":
+    main()
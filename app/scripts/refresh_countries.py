@@ -0,0 +1,48 @@
+"""Refresh the bundled REST Countries snapshot used for offline country lookups.
+
+Usage:
+    python -m app.scripts.refresh_countries [--output app/data/countries/rest_countries.json]
+"""
+
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from app.algo.country_index import CountryIndex
+from app.consts.countries import COUNTRY_SNAPSHOT_PATH, COUNTRY_SNAPSHOT_FIELDS
+from app.consts.visa import REST_COUNTRIES_BASE_URL
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=COUNTRY_SNAPSHOT_PATH, help="Where to write the snapshot")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout in seconds")
+    args = parser.parse_args()
+
+    url = f"{REST_COUNTRIES_BASE_URL}/all"
+    response = httpx.get(url, params={"fields": ",".join(COUNTRY_SNAPSHOT_FIELDS)}, timeout=args.timeout)
+    response.raise_for_status()
+    countries = sorted(response.json(), key=lambda country: country.get("cca2", ""))
+
+    snapshot = {
+        "source": url,
+        "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "complete": True,
+        "countries": countries
+    }
+    # Index the new data before replacing the old file, so a broken response never lands on disk
+    index = CountryIndex(countries)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temporary = output.with_suffix(".tmp")
+    temporary.write_text(json.dumps(snapshot, ensure_ascii=False, indent=1), encoding="utf-8")
+    temporary.replace(output)
+    print(f"Saved {len(countries)} countries ({index.stats()['keys']} lookup keys) to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Build or refresh the precomputed visa requirement matrix.
+
+Usage:
+    python -m app.scripts.refresh_visa_matrix [--csv passport-index-tidy-iso2.csv] [--missing-only] [--output app/data/visa_matrix]
+
+With --csv the matrix is imported from a passport-index style CSV (Passport,Destination,Requirement,
+using ISO2 codes). Otherwise every origin/destination pair is fetched from the visa API, for the
+country codes in the country snapshot or the ones given with --codes.
+"""
+
+import argparse
+import asyncio
+import csv
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import httpx
+
+from app.algo.country_index import CountryIndex
+from app.algo.visa_matrix import VisaMatrix
+from app.consts.countries import COUNTRY_SNAPSHOT_PATH
+from app.consts.visa import VISA_API_BASE_URL, VISA_MATRIX_PATH
+
+# passport-index requirement values; plain numbers are visa-free stays in days
+CSV_REQUIREMENTS = {
+    "visa free": "VF",
+    "visa on arrival": "VOA",
+    "e-visa": "EV",
+    "eta": "EV",
+    "visa required": "VR",
+    "no admission": "NA",
+    "covid ban": "NA"
+}
+
+
+def parse_requirement(value: str) -> Tuple[Optional[str], Optional[int]]:
+    value = value.strip().lower()
+    if value.isdigit():
+        return "VF", int(value)
+    return CSV_REQUIREMENTS.get(value), None
+
+
+def import_csv(path: Path, matrix: Optional[VisaMatrix], missing_only: bool = False) -> VisaMatrix:
+    with path.open(encoding="utf-8") as source:
+        rows = [row for row in csv.DictReader(source)]
+
+    codes = {row["Passport"].upper() for row in rows} | {row["Destination"].upper() for row in rows}
+    if matrix is None:
+        matrix = VisaMatrix.empty(list(codes))
+    else:
+        added = sorted(codes - {code.decode("ascii") for code in matrix.codes})
+        if added:
+            print(f"Adding {len(added)} countries from the CSV to the existing matrix: {', '.join(added)}")
+            matrix = matrix.resized(added)
+
+    imported = skipped = 0
+    for row in rows:
+        category, duration = parse_requirement(row["Requirement"])
+        if not category:
+            continue
+        if missing_only and matrix.lookup(row["Passport"], row["Destination"]):
+            skipped += 1
+            continue
+        matrix.set(row["Passport"], row["Destination"], category, duration)
+        imported += 1
+    print(f"Imported {imported} pairs from {path.name} ({skipped} already known pairs kept)")
+    return matrix
+
+
+async def fetch_api(matrix: VisaMatrix, concurrency: int, missing_only: bool, timeout: float):
+    codes = [code.decode("ascii") for code in matrix.codes]
+    pairs = [
+        (origin, destination) for origin in codes for destination in codes
+        if origin != destination and not (missing_only and matrix.lookup(origin, destination))
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+    done = failed = 0
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        async def fetch(origin: str, destination: str):
+            nonlocal done, failed
+            async with semaphore:
+                try:
+                    response = await client.get(f"{VISA_API_BASE_URL}/visa/{origin}/{destination}")
+                    response.raise_for_status()
+                    data = response.json()
+                    category = data.get("category", {})
+                    matrix.set(origin, destination, category.get("code", "") if isinstance(category, dict) else "", data.get("dur"))
+                except Exception as e:
+                    failed += 1
+                    print(f"Error fetching visa data for {origin} -> {destination}: {str(e)}", file=sys.stderr)
+                done += 1
+                if done % 500 == 0:
+                    print(f"{done}/{len(pairs)} pairs fetched ({failed} failed)")
+
+        await asyncio.gather(*[fetch(origin, destination) for origin, destination in pairs])
+    print(f"{done} pairs fetched ({failed} failed)")
+
+
+def snapshot_codes() -> List[str]:
+    index = CountryIndex.load(Path(COUNTRY_SNAPSHOT_PATH))
+    return [country["cca2"] for country in index.countries if country.get("cca2")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=VISA_MATRIX_PATH, help="Directory to write the matrix to")
+    parser.add_argument("--csv", help="passport-index style CSV to import instead of calling the API")
+    parser.add_argument("--codes", help="Comma-separated ISO2 codes to fetch from the API (default: country snapshot)")
+    parser.add_argument("--missing-only", action="store_true", help="Keep the existing matrix and only fill unknown pairs")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent API requests")
+    parser.add_argument("--timeout", type=float, default=10.0, help="API request timeout in seconds")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    existing = VisaMatrix.load(output, writable=True) if args.missing_only and (output / "codes.npy").exists() else None
+
+    if args.csv:
+        matrix = import_csv(Path(args.csv), existing, args.missing_only)
+        source = f"csv:{Path(args.csv).name}"
+    else:
+        codes = args.codes.split(",") if args.codes else snapshot_codes()
+        matrix = existing or VisaMatrix.empty(codes)
+        asyncio.run(fetch_api(matrix, args.concurrency, args.missing_only, args.timeout))
+        source = VISA_API_BASE_URL
+
+    matrix.save(output, {"source": source})
+    print(f"Saved visa matrix ({len(matrix.codes)} countries, {matrix.coverage():.1%} of pairs known) to {output}")
+
+
+if __name__ == "__main__":
+    main()
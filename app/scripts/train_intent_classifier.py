@@ -0,0 +1,105 @@
+"""Train the local intent classifier from the intent prompt's examples and the labeled corpus.
+
+Usage:
+    python -m app.scripts.train_intent_classifier [--output app/data/intent_classifier.npz]
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+from typing import List, Tuple
+
+from app.algo.extractor.intent_classifier import IntentClassifier
+from app.consts.extraction import INTENT_CLASSIFIER_MODEL_PATH, INTENT_CLASSIFIER_THRESHOLD
+from app.consts.intents import VALID_INTENTS, NON_VALID_INTENT
+
+APP_DIR = Path(__file__).parent.parent
+PROMPT_PATH = APP_DIR / "prompts" / "intent_extraction.j2"
+CORPUS_PATH = APP_DIR / "data" / "intent_corpus.jsonl"
+
+_CATEGORY_HEADER = re.compile(r'^\d+\.\s+\*\*(\w+)\*\*')
+_LABELED_EXAMPLE = re.compile(r'^-\s+"(.+?)"\s+->\s+\{"intent":\s*"(\w+)"\}')
+_QUOTED = re.compile(r'"([^"]+)"')
+
+
+def load_prompt_examples(prompt_path: Path) -> List[Tuple[str, str]]:
+    examples = []
+    category = None
+    
+    for line in prompt_path.read_text().splitlines():
+        stripped = line.strip()
+        
+        labeled = _LABELED_EXAMPLE.match(stripped)
+        if labeled:
+            examples.append((labeled.group(1), labeled.group(2)))
+            continue
+        
+        header = _CATEGORY_HEADER.match(stripped)
+        if header:
+            category = header.group(1)
+            continue
+        
+        if stripped.startswith("Valid response examples"):
+            category = None
+        
+        # Example lists inside a category block, e.g. 'Examples: "what to pack", "packing list"'
+        if category and ("Examples:" in stripped or stripped.startswith("- ")) and "NOTE" not in stripped:
+            examples.extend((text, category) for text in _QUOTED.findall(stripped))
+    
+    return examples
+
+
+def load_corpus(corpus_path: Path) -> List[Tuple[str, str]]:
+    examples = []
+    for line in corpus_path.read_text().splitlines():
+        if line.strip():
+            record = json.loads(line)
+            examples.append((record["text"], record["intent"]))
+    return examples
+
+
+def evaluate(texts: List[str], labels: List[str], threshold: float) -> dict:
+    # Leave-one-out: accuracy overall and on the predictions confident enough to skip the LLM
+    correct = confident = confident_correct = 0
+    for i in range(len(texts)):
+        classifier = IntentClassifier.train(texts[:i] + texts[i + 1:], labels[:i] + labels[i + 1:])
+        predicted, confidence = classifier.predict(texts[i])
+        correct += predicted == labels[i]
+        if confidence >= threshold:
+            confident += 1
+            confident_correct += predicted == labels[i]
+    
+    return {
+        "examples": len(texts),
+        "accuracy": round(correct / len(texts), 3),
+        "coverage_at_threshold": round(confident / len(texts), 3),
+        "accuracy_at_threshold": round(confident_correct / confident, 3) if confident else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=INTENT_CLASSIFIER_MODEL_PATH, help="Where to write the model file")
+    parser.add_argument("--threshold", type=float, default=INTENT_CLASSIFIER_THRESHOLD, help="Confidence threshold to evaluate")
+    parser.add_argument("--skip-eval", action="store_true", help="Skip the leave-one-out evaluation")
+    args = parser.parse_args()
+    
+    valid_labels = set(VALID_INTENTS + NON_VALID_INTENT)
+    examples = [
+        (text, label) for text, label in load_prompt_examples(PROMPT_PATH) + load_corpus(CORPUS_PATH)
+        if label in valid_labels
+    ]
+    texts = [text for text, _ in examples]
+    labels = [label for _, label in examples]
+    
+    if not args.skip_eval:
+        print(evaluate(texts, labels, args.threshold))
+    
+    classifier = IntentClassifier.train(texts, labels)
+    classifier.save(Path(args.output))
+    print(f"Saved intent classifier ({len(classifier.vocabulary)} features, {len(texts)} examples) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
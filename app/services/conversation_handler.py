@@ -1,4 +1,5 @@
-from typing import List, Dict, Optional
+import asyncio
+from typing import List, Dict, Optional, AsyncIterator
 
 from app.modules.clients.ollama import OllamaClient
 from app.modules.extractor.manager import ExtractorManager
@@ -6,56 +7,172 @@ from app.models.extraction_result import ExtractionResult
 from app.modules.response_generator import ResponseGenerator
 from app.modules.agents.research_agent import ResearchAgent
 from app.modules.tools.registry import ToolRegistry
-from app.prompts import build_system_message
+from app.modules.tools.speculation import SpeculativePrefetch
+from app.modules.summarizer import ConversationSummarizer
+from app.models.templates.summary_context_template import SummaryContextTemplate
+from app.modules.deadline import Deadline
+from app.services.session_store import SessionStore, ConversationSession
 from app.consts.roles import MessageRole
 from app.consts.intents import NON_LEGIT_INTENT, NON_VALID_INTENT, NON_VALID_INTENT_MESSAGES
+from app.consts.research import SPECULATIVE_PREFETCH_ENABLED
+from app.consts.context import SUMMARY_ENABLED
+from app.consts.deadline import DEADLINE_RESEARCH_MIN_SECONDS
 
 
 class ConversationHandler:
-    def __init__(self, llm_client: OllamaClient):
+    def __init__(self, llm_client: OllamaClient, sessions: Optional[SessionStore] = None):
         self.llm = llm_client
-        self.messages: List[Dict[str, str]] = []
-        
-    def start_conversation(self):
-        system_prompt = build_system_message()
-        self.messages = [system_prompt]
+        self.sessions = sessions or SessionStore()
+        self.summarizer = ConversationSummarizer(llm_client)
     
-    async def handle(self, user_message: str) -> str:
-        self.add_message(user_message, MessageRole.USER)
-        
-        extractor = ExtractorManager(self.llm)
-        extractions = await extractor.extract(user_message)
-        
-        if extractions.intent in NON_VALID_INTENT:
-            message = NON_VALID_INTENT_MESSAGES.get(extractions.intent, NON_VALID_INTENT_MESSAGES[NON_LEGIT_INTENT])
-            return message
-        
-        await self._fetch_external_data(extractions)
-        
-        response_generator = ResponseGenerator(self.llm, self.messages, extractions)
-        assistant_response = await response_generator.generate_response()
+    async def reset_conversation(self, session_id: str):
+        await self.sessions.reset(session_id)
+    
+    async def handle(self, session_id: str, user_message: str) -> str:
+        session = await self.sessions.get(session_id)
         
-        self.add_message(assistant_response, MessageRole.ASSISTANT)
+        # Turns of one session run one at a time; other sessions are not blocked
+        async with session.lock:
+            self.add_message(session.messages, user_message, MessageRole.USER)
+            
+            prefetch = SpeculativePrefetch() if SPECULATIVE_PREFETCH_ENABLED else None
+            extractor = ExtractorManager(self.llm)
+            extractions = await extractor.extract(user_message, on_location=prefetch.start if prefetch else None)
+            
+            if extractions.intent in NON_VALID_INTENT:
+                if prefetch:
+                    prefetch.finish()
+                self.sessions.commit(session)
+                message = NON_VALID_INTENT_MESSAGES.get(extractions.intent, NON_VALID_INTENT_MESSAGES[NON_LEGIT_INTENT])
+                return message
+            
+            await self._fetch_external_data(extractions, session.messages, prefetch)
+            
+            response_generator = ResponseGenerator(self.llm, self._context_messages(session, session.messages), extractions)
+            assistant_response = await response_generator.generate_response()
+            
+            self.add_message(session.messages, assistant_response, MessageRole.ASSISTANT)
+            self.sessions.commit(session)
+            self._schedule_summary(session)
+            
+            return assistant_response
+    
+    async def handle_stream(self, session_id: str, user_message: str) -> AsyncIterator[str]:
+        session = await self.sessions.get(session_id)
         
-        return assistant_response
+        async with session.lock:
+            # Work on a pending copy so the history is committed only once the stream ends
+            pending_messages = session.messages.copy()
+            self.add_message(pending_messages, user_message, MessageRole.USER)
+            
+            prefetch = SpeculativePrefetch() if SPECULATIVE_PREFETCH_ENABLED else None
+            extractor = ExtractorManager(self.llm)
+            extractions = await extractor.extract(user_message, on_location=prefetch.start if prefetch else None)
+            
+            if extractions.intent in NON_VALID_INTENT:
+                if prefetch:
+                    prefetch.finish()
+                yield NON_VALID_INTENT_MESSAGES.get(extractions.intent, NON_VALID_INTENT_MESSAGES[NON_LEGIT_INTENT])
+                session.messages = pending_messages
+                self.sessions.commit(session)
+                return
+            
+            await self._fetch_external_data(extractions, pending_messages, prefetch)
+            
+            response_generator = ResponseGenerator(self.llm, self._context_messages(session, pending_messages), extractions)
+            tokens = []
+            async for token in response_generator.generate_response_stream():
+                tokens.append(token)
+                yield token
+            
+            self.add_message(pending_messages, "".join(tokens).strip(), MessageRole.ASSISTANT)
+            session.messages = pending_messages
+            self.sessions.commit(session)
+            self._schedule_summary(session)
     
-    def add_message(self, content: str, role: MessageRole, position: Optional[int] = None):
+    def add_message(
+        self,
+        messages: List[Dict[str, str]],
+        content: str,
+        role: MessageRole,
+        position: Optional[int] = None
+    ):
         message = {
             "role": role,
             "content": content
         }
         if position is not None:
-            self.messages.insert(position, message)
+            messages.insert(position, message)
         else:
-            self.messages.append(message)
-            
-    async def _fetch_external_data(self, extracted_info: ExtractionResult):
-        self.research_agent = ResearchAgent(self.llm, ToolRegistry())
-        external_data = await self.research_agent.research(extracted_info, self.messages)
+            messages.append(message)
+    
+    async def _fetch_external_data(
+        self,
+        extracted_info: ExtractionResult,
+        messages: List[Dict[str, str]],
+        prefetch: Optional[SpeculativePrefetch] = None
+    ):
+        research_agent = ResearchAgent(self.llm, ToolRegistry(prefetch))
+        budget = Deadline.stage_budget()
+        try:
+            if budget is not None and budget < DEADLINE_RESEARCH_MIN_SECONDS:
+                # Research is optional; without budget for it the answer goes out without external data
+                Deadline.record("research_skipped")
+                external_data = []
+            else:
+                external_data = await asyncio.wait_for(research_agent.research(extracted_info, messages), budget)
+        except asyncio.TimeoutError:
+            Deadline.record("research_cut")
+            external_data = []
+        finally:
+            # Speculative lookups the agent did not ask for are discarded here
+            if prefetch:
+                prefetch.finish()
         
         if external_data:
-            self._inject_system_message(external_data)
+            self._inject_system_message(external_data, messages)
     
-    def _inject_system_message(self, external_data: List[Dict]):
+    def _inject_system_message(self, external_data: List[Dict], messages: List[Dict[str, str]]):
         external_data_content = "\n".join([data['data'] for data in external_data])
-        self.add_message(external_data_content, MessageRole.SYSTEM, position=-1)
+        self.add_message(messages, external_data_content, MessageRole.SYSTEM, position=-1)
+    
+    def _context_messages(self, session: ConversationSession, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        # Folded turns are replaced by the running summary; the unsummarized tail is sent verbatim
+        if session.summary is None or session.summarized_until <= 1:
+            return messages
+        
+        summary_message = {
+            "role": MessageRole.SYSTEM.value,
+            "content": SummaryContextTemplate.format(session.summary)
+        }
+        return [messages[0], summary_message] + messages[session.summarized_until:]
+    
+    def _schedule_summary(self, session: ConversationSession):
+        if not SUMMARY_ENABLED:
+            return
+        
+        if session.summary_task is not None and not session.summary_task.done():
+            return
+        
+        fold_range = self.summarizer.fold_range(session.messages, session.summarized_until)
+        if fold_range is None:
+            return
+        
+        start, end = fold_range
+        session.summary_task = self.summarizer.run_in_background(
+            self._update_summary(session, session.summary_epoch, session.messages[start:end], end)
+        )
+    
+    async def _update_summary(
+        self,
+        session: ConversationSession,
+        epoch: int,
+        messages: List[Dict[str, str]],
+        end: int
+    ):
+        summary = await self.summarizer.summarize(session.summary, messages)
+        # Skip the result if the conversation was reset meanwhile
+        if summary is not None and epoch == session.summary_epoch:
+            session.summary = summary
+            session.summarized_until = end
+            self.sessions.commit(session)
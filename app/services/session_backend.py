@@ -0,0 +1,241 @@
+import asyncio
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.consts.session import (
+    SESSION_BACKEND,
+    SESSION_SQLITE_PATH,
+    SESSION_FLUSH_INTERVAL,
+    SESSION_FLUSH_BATCH_SIZE,
+    SESSION_RETENTION,
+    SESSION_COMPACT_INTERVAL
+)
+
+
+class SessionBackend:
+    # Default backend: sessions live only in the process and are lost on restart
+    name = "memory"
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def load(self, session_id: str) -> Optional[Dict]:
+        return None
+
+    def save(self, session_id: str, state: Dict):
+        pass
+
+    def delete(self, session_id: str):
+        pass
+
+    def stats(self) -> Dict:
+        return {"backend": self.name}
+
+    @staticmethod
+    def create(name: str = SESSION_BACKEND) -> "SessionBackend":
+        if name == SQLiteSessionBackend.name:
+            return SQLiteSessionBackend()
+        if name != SessionBackend.name:
+            print(f"Unknown session backend '{name}', keeping sessions in memory")
+        return SessionBackend()
+
+
+class SQLiteSessionBackend(SessionBackend):
+    name = "sqlite"
+
+    def __init__(
+        self,
+        path: str = SESSION_SQLITE_PATH,
+        flush_interval: float = SESSION_FLUSH_INTERVAL,
+        flush_batch_size: int = SESSION_FLUSH_BATCH_SIZE,
+        retention: float = SESSION_RETENTION,
+        compact_interval: float = SESSION_COMPACT_INTERVAL
+    ):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self.retention = retention
+        self.compact_interval = compact_interval
+        # A single worker thread owns the connection, so statements never run concurrently
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-sqlite")
+        self._connection: Optional[sqlite3.Connection] = None
+        self._dirty: Dict[str, Optional[Dict]] = {}
+        self._flush_requested = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self.loads = 0
+        self.load_hits = 0
+        self.flushes = 0
+        self.rows_written = 0
+        self.flush_errors = 0
+        self.total_flush_ms = 0.0
+        self.expired = 0
+
+    async def start(self):
+        if self._connection is not None:
+            return
+        await self._run(self._open)
+        await self.compact()
+        self._tasks = [
+            asyncio.create_task(self._flush_loop()),
+            asyncio.create_task(self._compact_loop())
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        # Everything still buffered is written before shutdown, so restarts lose nothing
+        if self._connection is not None:
+            await self.flush()
+            await self._run(self._close)
+        self._executor.shutdown(wait=True)
+
+    async def load(self, session_id: str) -> Optional[Dict]:
+        self.loads += 1
+        if session_id in self._dirty:
+            state = self._dirty[session_id]
+            if state is not None:
+                self.load_hits += 1
+            return state
+
+        if self._connection is None:
+            return None
+
+        row = await self._run(self._select, session_id)
+        if row is None:
+            return None
+
+        self.load_hits += 1
+        return json.loads(row)
+
+    def save(self, session_id: str, state: Dict):
+        # Later saves of the same session overwrite earlier ones still waiting in the buffer
+        self._dirty[session_id] = state
+        if len(self._dirty) >= self.flush_batch_size:
+            self._flush_requested.set()
+
+    def delete(self, session_id: str):
+        self._dirty[session_id] = None
+        if len(self._dirty) >= self.flush_batch_size:
+            self._flush_requested.set()
+
+    async def flush(self):
+        if not self._dirty or self._connection is None:
+            return
+
+        batch, self._dirty = self._dirty, {}
+        started = time.perf_counter()
+        try:
+            await self._run(self._write_batch, batch)
+        except Exception as e:
+            self.flush_errors += 1
+            print(f"Error flushing {len(batch)} sessions to SQLite: {str(e)}")
+            for session_id, state in batch.items():
+                self._dirty.setdefault(session_id, state)
+            return
+
+        self.flushes += 1
+        self.rows_written += len(batch)
+        self.total_flush_ms += (time.perf_counter() - started) * 1000
+
+    async def compact(self):
+        if self._connection is None:
+            return
+        try:
+            self.expired += await self._run(self._expire, time.time() - self.retention)
+        except Exception as e:
+            print(f"Error compacting session store: {str(e)}")
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    async def _compact_loop(self):
+        while True:
+            await asyncio.sleep(self.compact_interval)
+            await self.compact()
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _open(self):
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS sessions_updated_at ON sessions (updated_at)")
+        self._connection = connection
+
+    def _close(self):
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._connection.close()
+        self._connection = None
+
+    def _select(self, session_id: str) -> Optional[str]:
+        row = self._connection.execute("SELECT state FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return row[0] if row else None
+
+    def _write_batch(self, batch: Dict[str, Optional[Dict]]):
+        now = time.time()
+        upserts: List[Tuple[str, str, float]] = []
+        deletes: List[Tuple[str]] = []
+        for session_id, state in batch.items():
+            if state is None:
+                deletes.append((session_id,))
+            else:
+                upserts.append((session_id, json.dumps(state, default=str), now))
+
+        # One transaction per batch: a single WAL commit for all sessions in it
+        with self._connection:
+            self._connection.execute("BEGIN")
+            if upserts:
+                self._connection.executemany(
+                    "INSERT INTO sessions (session_id, state, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(session_id) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at",
+                    upserts
+                )
+            if deletes:
+                self._connection.executemany("DELETE FROM sessions WHERE session_id = ?", deletes)
+
+    def _expire(self, cutoff: float) -> int:
+        with self._connection:
+            self._connection.execute("BEGIN")
+            removed = self._connection.execute("DELETE FROM sessions WHERE updated_at < ?", (cutoff,)).rowcount
+        if removed:
+            self._connection.execute("PRAGMA incremental_vacuum")
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    def stats(self) -> Dict:
+        return {
+            "backend": self.name,
+            "path": self.path,
+            "pending_writes": len(self._dirty),
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "flush_errors": self.flush_errors,
+            "avg_flush_ms": round(self.total_flush_ms / self.flushes, 2) if self.flushes else 0.0,
+            "loads": self.loads,
+            "load_hits": self.load_hits,
+            "expired": self.expired
+        }
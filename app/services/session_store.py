@@ -0,0 +1,237 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.models.conversation_summary import ConversationSummary
+from app.prompts import build_system_message
+from app.services.session_backend import SessionBackend
+from app.consts.session import (
+    SESSION_MAX_SESSIONS,
+    SESSION_IDLE_TTL,
+    SESSION_MAX_MEMORY_BYTES,
+    SESSION_SWEEP_INTERVAL
+)
+
+
+class ConversationSession:
+    # Rough per-message and per-session bookkeeping overhead (dicts, list slots, lock)
+    MESSAGE_OVERHEAD_BYTES = 240
+    SESSION_OVERHEAD_BYTES = 2048
+
+    def __init__(self, session_id: str, system_message: Dict[str, str]):
+        self.session_id = session_id
+        self.system_message = system_message
+        self.lock = asyncio.Lock()
+        self.created_at = time.time()
+        self.last_access = time.monotonic()
+        self.summary_task: Optional[asyncio.Task] = None
+        self.summary_epoch = 0
+        self.size_bytes = 0
+        self.reset()
+
+    def reset(self):
+        self.messages: List[Dict[str, str]] = [dict(self.system_message)]
+        self.summary: Optional[ConversationSummary] = None
+        self.summarized_until = 0
+        self.summary_epoch += 1
+
+    def touch(self):
+        self.last_access = time.monotonic()
+
+    def to_state(self) -> Dict:
+        # The system prompt is not persisted, so prompt changes apply to restored sessions
+        return {
+            "messages": self.messages[1:],
+            "summary": self.summary.to_dict() if self.summary is not None else None,
+            "summarized_until": self.summarized_until
+        }
+
+    def restore(self, state: Dict):
+        self.messages = [dict(self.system_message)] + list(state.get("messages", []))
+        summary = state.get("summary")
+        self.summary = ConversationSummary.from_dict(summary) if summary else None
+        self.summarized_until = min(int(state.get("summarized_until", 0)), len(self.messages))
+
+    def estimate_size(self) -> int:
+        # The system prompt text is shared by all sessions and is not counted per session
+        size = self.SESSION_OVERHEAD_BYTES
+        for message in self.messages[1:]:
+            size += len(str(message.get("content", "")).encode("utf-8")) + self.MESSAGE_OVERHEAD_BYTES
+        if self.summary is not None:
+            size += len(str(self.summary.to_dict()).encode("utf-8"))
+        return size
+
+
+class SessionStore:
+    def __init__(
+        self,
+        max_sessions: int = SESSION_MAX_SESSIONS,
+        idle_ttl: float = SESSION_IDLE_TTL,
+        max_memory_bytes: int = SESSION_MAX_MEMORY_BYTES,
+        sweep_interval: float = SESSION_SWEEP_INTERVAL,
+        backend: Optional[SessionBackend] = None
+    ):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_memory_bytes = max_memory_bytes
+        self.sweep_interval = sweep_interval
+        self.backend = backend or SessionBackend.create()
+        self._sessions: "OrderedDict[str, ConversationSession]" = OrderedDict()
+        self._system_message: Optional[Dict[str, str]] = None
+        self._loading: Dict[str, asyncio.Task] = {}
+        self._sweeper_task: Optional[asyncio.Task] = None
+        self.total_bytes = 0
+        self.created = 0
+        self.restored = 0
+        self.resets = 0
+        self.evictions = {"lru": 0, "idle": 0, "memory": 0}
+
+    async def get(self, session_id: str) -> ConversationSession:
+        session = self._sessions.get(session_id)
+        if session is not None and self._is_expired(session):
+            self._evict(session_id, "idle")
+            session = None
+
+        if session is None:
+            # Concurrent first requests for a session share one lazy load
+            loading = self._loading.get(session_id)
+            if loading is None:
+                loading = asyncio.ensure_future(self._load(session_id))
+                self._loading[session_id] = loading
+                loading.add_done_callback(lambda _: self._loading.pop(session_id, None))
+            session = await asyncio.shield(loading)
+        else:
+            self._sessions.move_to_end(session_id)
+
+        session.touch()
+        return session
+
+    async def reset(self, session_id: str):
+        session = await self.get(session_id)
+        # Wait for a running turn to finish, otherwise it would write its history back over the reset
+        async with session.lock:
+            session.reset()
+            self.resets += 1
+            self.commit(session)
+
+    def commit(self, session: ConversationSession):
+        self.update_size(session)
+        self.backend.save(session.session_id, session.to_state())
+
+    async def start(self):
+        await self.backend.start()
+        self.start_sweeper()
+
+    def update_size(self, session: ConversationSession):
+        if self._sessions.get(session.session_id) is not session:
+            return
+        size = session.estimate_size()
+        self.total_bytes += size - session.size_bytes
+        session.size_bytes = size
+        self._enforce_limits(keep=session.session_id)
+
+    def evict_expired(self) -> int:
+        expired = []
+        for session_id, session in self._sessions.items():
+            # Sessions are ordered by last access, so the first live one ends the scan
+            if not self._is_expired(session):
+                break
+            if not session.lock.locked():
+                expired.append(session_id)
+
+        for session_id in expired:
+            self._evict(session_id, "idle")
+        return len(expired)
+
+    def start_sweeper(self):
+        if self._sweeper_task is None:
+            self._sweeper_task = asyncio.create_task(self._sweep())
+
+    async def stop(self):
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
+        await self.backend.stop()
+
+    async def _load(self, session_id: str) -> ConversationSession:
+        session = ConversationSession(session_id, self._get_system_message())
+        try:
+            state = await self.backend.load(session_id)
+        except Exception as e:
+            print(f"Error loading session '{session_id}': {str(e)}")
+            state = None
+
+        if state:
+            session.restore(state)
+            self.restored += 1
+        else:
+            self.created += 1
+
+        session.size_bytes = session.estimate_size()
+        self._sessions[session_id] = session
+        self.total_bytes += session.size_bytes
+        self._enforce_limits(keep=session_id)
+        return session
+
+    def _get_system_message(self) -> Dict[str, str]:
+        if self._system_message is None:
+            self._system_message = build_system_message()
+        return self._system_message
+
+    def _is_expired(self, session: ConversationSession) -> bool:
+        return time.monotonic() - session.last_access > self.idle_ttl
+
+    def _enforce_limits(self, keep: str):
+        while len(self._sessions) > self.max_sessions:
+            if not self._evict_oldest("lru", keep):
+                break
+        while self.total_bytes > self.max_memory_bytes:
+            if not self._evict_oldest("memory", keep):
+                break
+
+    def _evict_oldest(self, reason: str, keep: str) -> bool:
+        for session_id, session in self._sessions.items():
+            # Sessions with a turn in progress are never evicted
+            if session_id != keep and not session.lock.locked():
+                self._evict(session_id, reason)
+                return True
+        return False
+
+    def _evict(self, session_id: str, reason: str):
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+        self.total_bytes -= session.size_bytes
+        self.evictions[reason] += 1
+        if session.summary_task is not None and not session.summary_task.done():
+            session.summary_task.cancel()
+
+    async def _sweep(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                self.evict_expired()
+            except Exception as e:
+                print(f"Session sweep error: {str(e)}")
+
+    def stats(self) -> Dict:
+        sessions = len(self._sessions)
+        return {
+            "sessions": sessions,
+            "max_sessions": self.max_sessions,
+            "active_turns": sum(1 for session in self._sessions.values() if session.lock.locked()),
+            "memory_bytes": self.total_bytes,
+            "max_memory_bytes": self.max_memory_bytes,
+            "avg_session_bytes": round(self.total_bytes / sessions) if sessions else 0,
+            "idle_ttl_seconds": self.idle_ttl,
+            "created": self.created,
+            "restored": self.restored,
+            "resets": self.resets,
+            "evictions": dict(self.evictions),
+            "persistence": self.backend.stats()
+        }
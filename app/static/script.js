@@ -107,28 +107,20 @@ async function handleSendMessage() {
     showLoadingIndicator();
     
     try {
-        const response = await fetch(`${API_BASE_URL}/chat`, {
+        const response = await fetch(`${API_BASE_URL}/chat/stream`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
+                'Accept': 'text/event-stream',
             },
             body: JSON.stringify({ message }),
         });
         
-        const data = await response.json();
-        
-        if (!response.ok) {
-            throw new Error(data.detail || `HTTP error! status: ${response.status}`);
+        if (!response.ok || !response.body) {
+            throw new Error(`HTTP error! status: ${response.status}`);
         }
         
-        // Hide loading and add assistant response
-        hideLoadingIndicator();
-        
-        if (data.response) {
-            addMessage(data.response, 'assistant');
-        } else {
-            throw new Error('Invalid response format from server');
-        }
+        await renderStreamedResponse(response);
         
     } catch (error) {
         console.error('Error sending message:', error);
@@ -143,6 +135,62 @@ async function handleSendMessage() {
     }
 }
 
+async function renderStreamedResponse(response) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let text = '';
+    let messageDiv = null;
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+            break;
+        }
+        
+        buffer += decoder.decode(value, { stream: true });
+        
+        // Server-Sent Events are separated by a blank line
+        let boundary = buffer.indexOf('\n\n');
+        while (boundary !== -1) {
+            const event = parseServerSentEvent(buffer.slice(0, boundary));
+            buffer = buffer.slice(boundary + 2);
+            boundary = buffer.indexOf('\n\n');
+            
+            if (event.type === 'token') {
+                text += event.data.token;
+                if (!messageDiv) {
+                    hideLoadingIndicator();
+                    messageDiv = addMessage(text, 'assistant');
+                } else {
+                    updateMessage(messageDiv, text);
+                }
+            } else if (event.type === 'error') {
+                throw new Error(event.data.error);
+            }
+        }
+    }
+    
+    if (!messageDiv) {
+        throw new Error('Invalid response format from server');
+    }
+}
+
+function parseServerSentEvent(rawEvent) {
+    let type = 'message';
+    const dataLines = [];
+    
+    rawEvent.split('\n').forEach((line) => {
+        if (line.startsWith('event:')) {
+            type = line.slice(6).trim();
+        } else if (line.startsWith('data:')) {
+            dataLines.push(line.slice(5).trim());
+        }
+    });
+    
+    return { type, data: dataLines.length ? JSON.parse(dataLines.join('\n')) : {} };
+}
+
 function addMessage(text, role) {
     const messageDiv = document.createElement('div');
     messageDiv.className = `message ${role}`;
@@ -156,6 +204,12 @@ function addMessage(text, role) {
     
     chatContainer.appendChild(messageDiv);
     scrollToBottom();
+    return messageDiv;
+}
+
+function updateMessage(messageDiv, text) {
+    messageDiv.querySelector('.message-content').innerHTML = formatMarkdown(text);
+    scrollToBottom();
 }
 
 function formatMarkdown(text) {